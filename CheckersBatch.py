@@ -0,0 +1,380 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains a CheckersBatch Class that holds many Checkers boards as NumPy bitboard lanes and generates
+# moves, plays them, removes captured pieces and promotes for every board at once. Boards are copied to and from
+# Checkers objects only when asked. Needs NumPy, which the rest of the game does not.
+#
+# Every move a piece could make is numbered by its starting square, direction and distance: candidate number
+# square * 28 + direction * 7 + (distance - 1), with directions in DIRECTIONS order. Moves are generated as a
+# (boards, 4, 7) array of uint32 words, one per direction and distance, with a bit set for every square whose piece can
+# make that move. move_mask unpacks the words into a (boards, CANDIDATES) boolean mask. A chosen move is a candidate
+# number, or -1 for a board that doesn't move.
+
+import argparse
+import time
+import numpy as np
+from CheckersGame import Checkers, COLORS, DIRECTIONS, FORWARD_DIRECTIONS, RAYS, SQUARE_LOCATIONS
+
+
+MAX_DISTANCE = 7        # longest diagonal step
+CANDIDATES = len(SQUARE_LOCATIONS) * len(DIRECTIONS) * MAX_DISTANCE
+ALL_SQUARES = np.uint32(0xFFFFFFFF)
+
+
+def _build_shifts():
+    """
+    Returns a tuple indexed by direction of ((shift, mask), ...). Shifting the squares in mask by shift moves each one
+    to its neighbor in that direction. Squares on even and odd rows shift by different amounts.
+    """
+
+    shifts = []
+    for direction in range(len(DIRECTIONS)):
+        masks = {}
+        for square_index, square_rays in enumerate(RAYS):
+            if square_rays[direction]:
+                shift = square_rays[direction][0] - square_index
+                masks[shift] = masks.get(shift, 0) | 1 << square_index
+        shifts.append(tuple((shift, np.uint32(mask)) for shift, mask in sorted(masks.items())))
+    return tuple(shifts)
+
+
+def _build_candidates():
+    """Returns (starts, ends, distances, directions, between masks) of every candidate, with -1 ends off the board"""
+
+    starts = np.repeat(np.arange(len(SQUARE_LOCATIONS)), len(DIRECTIONS) * MAX_DISTANCE)
+    ends = np.full(CANDIDATES, -1)
+    between = np.zeros(CANDIDATES, dtype=np.uint32)
+    for square_index, square_rays in enumerate(RAYS):
+        for direction, ray in enumerate(square_rays):
+            for distance in range(1, len(ray) + 1):
+                candidate = (square_index * len(DIRECTIONS) + direction) * MAX_DISTANCE + distance - 1
+                ends[candidate] = ray[distance - 1]
+                between[candidate] = sum(1 << square for square in ray[:distance - 1])
+    distances = np.tile(np.arange(1, MAX_DISTANCE + 1), len(SQUARE_LOCATIONS) * len(DIRECTIONS))
+    directions = np.tile(np.repeat(np.arange(len(DIRECTIONS)), MAX_DISTANCE), len(SQUARE_LOCATIONS))
+    return starts, ends, distances, directions, between
+
+
+SHIFTS = _build_shifts()
+CANDIDATE_STARTS, CANDIDATE_ENDS, CANDIDATE_DISTANCES, CANDIDATE_DIRECTIONS, CANDIDATE_BETWEEN = _build_candidates()
+SQUARE_BITS = np.array([1 << square_index for square_index in range(len(SQUARE_LOCATIONS))], dtype=np.uint32)
+SQUARE_ROWS = np.array([row for row, column in SQUARE_LOCATIONS])
+
+# indexed by color index then direction, True for the directions that color's men move in
+FORWARD = np.array([[direction in directions for direction in range(len(DIRECTIONS))]
+                    for directions in FORWARD_DIRECTIONS])
+
+# key=(starting_square_location, destination_square_location), value=candidate number
+CANDIDATE_INDEX = {(SQUARE_LOCATIONS[start], SQUARE_LOCATIONS[end]): candidate
+                   for candidate, (start, end) in enumerate(zip(CANDIDATE_STARTS.tolist(), CANDIDATE_ENDS.tolist()))
+                   if end >= 0}
+
+
+def candidate_of(starting_square_location, destination_square_location):
+    """Returns the candidate number of a move given as (row, column) tuples, or -1 if no piece could make it"""
+
+    return CANDIDATE_INDEX.get((tuple(starting_square_location), tuple(destination_square_location)), -1)
+
+
+def move_of(candidate):
+    """Returns the (starting_square_location, destination_square_location) tuple of a candidate number"""
+
+    return SQUARE_LOCATIONS[CANDIDATE_STARTS[candidate]], SQUARE_LOCATIONS[CANDIDATE_ENDS[candidate]]
+
+
+def shift(bitboards, direction):
+    """Returns bitboards, an array of uint32 bitboards, with every square moved to its neighbor in direction"""
+
+    (first_shift, first_mask), (second_shift, second_mask) = SHIFTS[direction]
+    if first_shift > 0:
+        return (bitboards & first_mask) << first_shift | (bitboards & second_mask) << second_shift
+    return (bitboards & first_mask) >> -first_shift | (bitboards & second_mask) >> -second_shift
+
+
+def popcount(bitboards):
+    """Returns the number of set bits in each uint32 of bitboards"""
+
+    bitboards = bitboards - ((bitboards >> 1) & np.uint32(0x55555555))
+    bitboards = (bitboards & np.uint32(0x33333333)) + ((bitboards >> 2) & np.uint32(0x33333333))
+    bitboards = (bitboards + (bitboards >> 4)) & np.uint32(0x0F0F0F0F)
+    return (bitboards * np.uint32(0x01010101)) >> 24
+
+
+class CheckersBatch:
+    """
+    Represents a batch of Checkers boards that takes the number of boards, each starting at the opening position.
+
+    Each board is a row of six uint32 bitboards in piece code order, laid out like Checkers._bitboards. The player who
+    is up, jump_just_occurred and each color's king, triple king and total captured counts are kept per board, so a
+    board copied back to a Checkers object matches one played through play_game.
+    """
+
+    def __init__(self, size):
+        self._bitboards = np.zeros((size, 6), dtype=np.uint32)
+        self._bitboards[:, 0] = (1 << 12) - 1       # White fills squares 0-11
+        self._bitboards[:, 3] = ((1 << 12) - 1) << 20       # Black fills squares 20-31
+        self._turn = np.ones(size, dtype=np.int8)       # Black plays first every game
+        self._jump = np.zeros(size, dtype=bool)
+        self._kings = np.zeros((size, len(COLORS)), dtype=np.int16)
+        self._triple_kings = np.zeros((size, len(COLORS)), dtype=np.int16)
+        self._captured = np.zeros((size, len(COLORS)), dtype=np.int16)
+
+    def get_size(self):
+        """Returns the number of boards"""
+
+        return len(self._turn)
+
+    def move_words(self, colors, captures_only=False):
+        """
+        Returns the (boards, 4, 7) move words for each board's color in colors, an array of color indexes, as if that
+        color were up. captures_only, a bool or an array of them, leaves out steps and jumps that capture nothing.
+        Follows the rules of Checkers.legal_moves.
+        """
+
+        bitboards = self._bitboards
+        rows = np.arange(len(bitboards))
+        colors = np.asarray(colors)
+        white = bitboards[:, 0] | bitboards[:, 1] | bitboards[:, 2]
+        black = bitboards[:, 3] | bitboards[:, 4] | bitboards[:, 5]
+        own = np.where(colors == 0, white, black)
+        enemy = np.where(colors == 0, black, white)
+        empty = ~(white | black)
+        base = colors * 3
+        men = bitboards[rows, base]
+        kings = bitboards[rows, base + 1]
+        triple_kings = bitboards[rows, base + 2]
+        steps_allowed = np.where(captures_only, np.uint32(0), ALL_SQUARES)
+        any_kings = bool((kings | triple_kings).any())
+
+        words = np.zeros((len(bitboards), len(DIRECTIONS), MAX_DISTANCE), dtype=np.uint32)
+        for direction in range(len(DIRECTIONS)):
+            # a bit is set in empty_at when the square distance squares away from it in direction is empty
+            opposite = len(DIRECTIONS) - 1 - direction
+            empty_at = shift(empty, opposite)
+            enemy_at = shift(enemy, opposite)
+            forward_men = np.where(FORWARD[colors, direction], men, np.uint32(0))
+            words[:, direction, 0] = (forward_men | kings | triple_kings) & empty_at & steps_allowed
+            words[:, direction, 1] = forward_men & enemy_at & shift(empty_at, opposite)
+            if not any_kings:
+                continue
+
+            own_at = shift(own, opposite)
+            king_clear = kings & empty_at       # nothing passed yet
+            king_captured = kings & enemy_at        # passed one opponent piece
+            clear = triple_kings & empty_at     # triple king states, named for what it has passed
+            friendly = triple_kings & own_at
+            one_enemy_adjacent = triple_kings & enemy_at
+            one_enemy = np.zeros_like(clear)
+            two_enemies = np.zeros_like(clear)
+            for distance in range(1, MAX_DISTANCE):
+                empty_at = shift(empty_at, opposite)
+                enemy_at = shift(enemy_at, opposite)
+                own_at = shift(own_at, opposite)
+                words[:, direction, distance] |= (
+                    (king_captured | one_enemy_adjacent | one_enemy | two_enemies | friendly & steps_allowed) &
+                    empty_at)
+
+                king_captured = king_clear & enemy_at | king_captured & empty_at
+                king_clear &= empty_at
+                not_enemy_at = empty_at | own_at
+                clear, friendly, one_enemy_adjacent, one_enemy, two_enemies = (
+                    clear & empty_at,
+                    (clear | friendly) & own_at | friendly & empty_at,
+                    (clear | friendly) & enemy_at,
+                    (one_enemy_adjacent | one_enemy) & not_enemy_at,
+                    one_enemy_adjacent & enemy_at | two_enemies & not_enemy_at)
+        return words
+
+    def move_mask(self, colors, captures_only=False):
+        """Returns the (boards, CANDIDATES) boolean mask of the moves in move_words"""
+
+        words = self.move_words(colors, captures_only).astype("<u4")
+        bits = np.unpackbits(words.view(np.uint8).reshape(len(words), len(DIRECTIONS), MAX_DISTANCE, 4), axis=3,
+                             bitorder="little").astype(bool)
+        return bits.transpose(0, 3, 1, 2).reshape(len(words), CANDIDATES)
+
+    def side_to_move(self):
+        """
+        Returns (color index array, move words) for the player who moves next on each board, the same player
+        CheckersEngine.side_to_move picks: the player who just jumped while they can capture again, otherwise the
+        player who is up.
+        """
+
+        colors = self._turn.copy()
+        words = self.move_words(colors)
+        jumped = np.flatnonzero(self._jump)
+        if len(jumped):
+            subsequent_colors = 1 - self._turn
+            subsequent = self.move_words(subsequent_colors, True)[jumped]
+            keeps_jumping = jumped[subsequent.any(axis=(1, 2))]
+            colors[keeps_jumping] = subsequent_colors[keeps_jumping]
+            words[keeps_jumping] = subsequent[subsequent.any(axis=(1, 2))]
+        return colors, words
+
+    def legal_moves(self, board):
+        """Returns the list of (starting_square_location, destination_square_location) board's next player may make"""
+
+        words = self.side_to_move()[1][board]
+        moves = []
+        for direction in range(len(DIRECTIONS)):
+            for distance in range(MAX_DISTANCE):
+                word = int(words[direction, distance])
+                while word:
+                    low_bit = word & -word
+                    moves.append(move_of((low_bit.bit_length() - 1) * len(DIRECTIONS) * MAX_DISTANCE +
+                                         direction * MAX_DISTANCE + distance))
+                    word ^= low_bit
+        return sorted(moves)
+
+    def random_moves(self, rng, words=None):
+        """
+        Returns a candidate number for every board, picked at random among the moves in words (by default the next
+        player's moves), or -1 for a board with none. rng is a numpy.random.Generator.
+        """
+
+        if words is None:
+            words = self.side_to_move()[1]
+        words = words.reshape(len(words), -1)
+        counts = popcount(words).astype(np.int32)
+        totals = counts.sum(axis=1)
+        picks = (rng.random(len(words)) * totals).astype(np.int32)
+
+        # find the word holding the picked move, then the bit within it
+        ends = np.cumsum(counts, axis=1)
+        word_index = (ends <= picks[:, None]).sum(axis=1)
+        word_index = np.minimum(word_index, words.shape[1] - 1)
+        rows = np.arange(len(words))
+        skip = picks - (ends[rows, word_index] - counts[rows, word_index])
+        word = words[rows, word_index]
+        bit_ends = np.cumsum((word[:, None] >> np.arange(32, dtype=np.uint32)) & np.uint32(1), axis=1)
+        square = (bit_ends <= skip[:, None]).sum(axis=1)
+        return np.where(totals > 0, square * words.shape[1] + word_index, -1)
+
+    def apply_moves(self, candidates):
+        """
+        Plays one move on every board, candidates being an array of candidate numbers, or -1 for boards that don't
+        move. Moves aren't checked against the rules, so they should come from the move words.
+        Removes the opponent pieces jumped, promotes, counts captures and passes the turn as make_move does.
+        """
+
+        candidates = np.asarray(candidates)
+        boards = np.flatnonzero(candidates >= 0)
+        candidates = candidates[boards]
+        rows = np.arange(len(boards))
+        bitboards = self._bitboards[boards]
+        start_bits = SQUARE_BITS[CANDIDATE_STARTS[candidates]]
+        ends = CANDIDATE_ENDS[candidates]
+        between = CANDIDATE_BETWEEN[candidates]
+
+        codes = ((bitboards & start_bits[:, None]) != 0).argmax(axis=1)
+        colors = codes // 3
+        ranks = codes % 3
+        end_rows = SQUARE_ROWS[ends]
+        promoted_to_king = (ranks == 0) & ((end_rows == 0) | (end_rows == 7))
+        promoted_to_triple_king = (ranks == 1) & (end_rows == np.where(colors == 0, 0, 7))
+        opponents = 1 - colors
+
+        # every opponent piece between the start and the destination is captured
+        captured = np.zeros(len(boards), dtype=np.int16)
+        for rank in range(3):
+            opponent_codes = opponents * 3 + rank
+            jumped = popcount(bitboards[rows, opponent_codes] & between).astype(np.int16)
+            bitboards[rows, opponent_codes] &= ~between
+            captured += jumped
+            if rank == 1:
+                self._kings[boards, opponents] -= jumped
+            elif rank == 2:
+                self._triple_kings[boards, opponents] -= jumped
+
+        bitboards[rows, codes] &= ~start_bits
+        bitboards[rows, codes + (promoted_to_king | promoted_to_triple_king)] |= SQUARE_BITS[ends]
+        self._bitboards[boards] = bitboards
+        self._kings[boards, colors] += promoted_to_king
+        self._triple_kings[boards, colors] += promoted_to_triple_king
+        self._captured[boards, colors] += captured
+        self._turn[boards] = opponents
+        self._jump[boards] = CANDIDATE_DISTANCES[candidates] > 1
+
+    def winners(self):
+        """
+        Returns an array holding, for every board, the color index of the winner as game_winner decides it, or -1 if
+        the game has not ended
+        """
+
+        colors, words = self.side_to_move()
+        winners = np.where(words.any(axis=(1, 2)), -1, 1 - colors)
+        for color_index in range(len(COLORS)):
+            winners = np.where(self._captured[:, color_index] == 12, color_index, winners)
+        return winners
+
+    def get_position(self, board):
+        """Returns board's position as a Checkers.get_position tuple"""
+
+        return tuple(self._bitboards[board].tolist()) + (int(self._turn[board]), int(self._jump[board]))
+
+    def load_game(self, board, game):
+        """Copies the position and player counts of game, a Checkers object, into board"""
+
+        position = game.get_position()
+        self._bitboards[board] = position[:6]
+        self._turn[board] = position[6]
+        self._jump[board] = position[7]
+        for color_index, color in enumerate(COLORS):
+            player_object = game.get_player_by_color(color)
+            if player_object is None:
+                counts = (0, 0, 0)
+            else:
+                counts = (player_object.get_king_count(), player_object.get_triple_king_count(),
+                          player_object.get_total_captured_pieces_count())
+            self._kings[board, color_index] = counts[0]
+            self._triple_kings[board, color_index] = counts[1]
+            self._captured[board, color_index] = counts[2]
+
+    def to_game(self, board, game=None):
+        """
+        Copies board into game, a Checkers object, and returns it. Without a game, a new one is made with each player
+        named after their color. Player counts are set to the board's.
+        """
+
+        if game is None:
+            game = Checkers()
+            for color in COLORS:
+                game.create_player(color, color)
+        game.set_position(self.get_position(board))
+        for color_index, color in enumerate(COLORS):
+            player_object = game.get_player_by_color(color)
+            if player_object is not None:
+                player_object.set_king_count(int(self._kings[board, color_index]) - player_object.get_king_count())
+                player_object.set_triple_king_count(int(self._triple_kings[board, color_index]) -
+                                                    player_object.get_triple_king_count())
+                player_object.set_total_captured_pieces(int(self._captured[board, color_index]) -
+                                                        player_object.get_total_captured_pieces_count())
+        return game
+
+
+def main():
+    """Plays random games on a batch of boards from the command line and prints board updates per second"""
+
+    parser = argparse.ArgumentParser(description="Play random Checkers games on a NumPy batch of boards")
+    parser.add_argument("--boards", type=int, default=4096)
+    parser.add_argument("--moves", type=int, default=100, help="moves to play on every board")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    batch = CheckersBatch(args.boards)
+    rng = np.random.default_rng(args.seed)
+    updates = 0
+    start = time.perf_counter()
+    for _ in range(args.moves):
+        candidates = batch.random_moves(rng)
+        batch.apply_moves(candidates)
+        updates += int((candidates >= 0).sum())
+    elapsed = time.perf_counter() - start
+    finished = int((batch.winners() >= 0).sum())
+    print(f"{args.boards} boards, {updates:,} board updates in {elapsed:.2f} sec, "
+          f"{updates / elapsed:,.0f} board updates/sec, {finished} games finished")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersBatch. Tests that batch move generation, captures, promotions and
+# winners match Checkers, and that boards copy to and from Checkers objects. Skipped when NumPy isn't installed.
+
+import unittest
+from CheckersGame import Checkers, COLORS
+from CheckersEngine import side_to_move
+from CheckersFixtures import set_up_board, game_state
+
+try:
+    import numpy
+    from CheckersBatch import CheckersBatch, candidate_of, move_of
+except ImportError:
+    numpy = None
+
+
+@unittest.skipUnless(numpy is not None, "NumPy is not installed")
+class CheckersBatchTests(unittest.TestCase):
+
+    def test_opening_moves(self):
+        """Test that every board starts with Black's opening moves"""
+
+        batch = CheckersBatch(3)
+        expected = sorted(Checkers().legal_moves("Black"))
+        for board in range(3):
+            self.assertEqual(batch.legal_moves(board), expected)
+
+    def test_special_pieces(self):
+        """Test king, triple king and subsequent jump moves against legal_moves"""
+
+        games = [set_up_board({(7, 0): "Black_king", (5, 2): "White", (1, 6): "White", (0, 7): "White"}),
+                 set_up_board({(7, 0): "Black_Triple_King", (6, 1): "Black", (4, 3): "White", (3, 4): "White",
+                               (1, 6): "White"}),
+                 set_up_board({(5, 2): "Black", (4, 3): "White", (2, 5): "White", (0, 1): "White"})]
+        games[2].play_game("Faris", (5, 2), (3, 4))
+        batch = CheckersBatch(len(games))
+        for board, game in enumerate(games):
+            batch.load_game(board, game)
+            self.assertEqual(batch.legal_moves(board), sorted(side_to_move(game)[1]))
+
+        # the triple king takes both white pieces next to each other
+        candidates = numpy.full(len(games), -1)
+        candidates[1] = candidate_of((7, 0), (2, 5))
+        batch.apply_moves(candidates)
+        games[1].play_game("Faris", (7, 0), (2, 5))
+        self.assertEqual(game_state(batch.to_game(1, set_up_board({}))), game_state(games[1]))
+        self.assertEqual(batch.get_position(0), games[0].get_position())
+
+    def test_random_games(self):
+        """Play random games on a batch and on Checkers objects side by side and check they stay the same"""
+
+        batch = CheckersBatch(8)
+        games = [batch.to_game(board) for board in range(8)]
+        rng = numpy.random.default_rng(5)
+        for _ in range(200):
+            colors, words = batch.side_to_move()
+            candidates = batch.random_moves(rng, words)
+            for board, game in enumerate(games):
+                color_index, moves = side_to_move(game)
+                self.assertEqual(batch.legal_moves(board), sorted(moves))
+                if candidates[board] >= 0:
+                    self.assertEqual(colors[board], color_index)
+                    move = move_of(candidates[board])
+                    game.play_game(COLORS[color_index], move[0], move[1])
+            batch.apply_moves(candidates)
+            winners = batch.winners()
+            for board, game in enumerate(games):
+                self.assertEqual(game_state(batch.to_game(board)), game_state(game))
+                winner = game.game_winner()
+                self.assertEqual(COLORS[winners[board]] if winners[board] >= 0 else "Game has not ended", winner)
+        self.assertTrue((winners >= 0).all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,569 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Times importing CheckersGame and creating the first game in a new process, times the Checkers class by
+# replaying a scripted game through play_game and by reading every square with get_checker_details, times legal_moves
+# along the same game, times drawing boards with pretty_print_board and CheckersRender, times publishing move events to
+# 1,000 subscribers, times saving and restoring 100,000 games with to_bytes/from_bytes, measures the memory held by
+# each live game, and measures engine search speed with one process and with parallel_search on 1, 2, 4 and 8 workers.
+# The benchmark suite times whole scripted games, scripted openings, capture heavy triple king endgames, random
+# playouts, multi jump moves, square lookups and startup, saves the results as a JSON baseline and flags any scenario
+# that slowed down by more than a threshold. Run this file directly to print every rate and check the suite against the
+# saved baseline.
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import pickle
+import platform
+import random
+import struct
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from CheckersGame import Checkers, PIECE_CODES, SQUARE_INDEX, SQUARE_LOCATIONS
+from CheckersEngine import CheckersEngine, parallel_search, side_to_move
+from CheckersRender import BoardRenderer
+from CheckersEvents import EventStream
+from CheckersFixtures import SCRIPTED_GAME, play_scripted_game
+
+
+# Where main keeps the suite's baseline unless told otherwise
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "checkers_benchmark_baseline.json")
+
+# Endgame the triple_king_endgame scenario plays out: Black's triple kings and king against a spread of White men
+TRIPLE_KING_ENDGAME = {(7, 0): "Black_Triple_King", (7, 4): "Black_Triple_King", (6, 7): "Black_king",
+                       (5, 2): "White", (4, 3): "White", (2, 5): "White", (3, 0): "White", (1, 4): "White",
+                       (2, 1): "White", (3, 6): "White", (0, 1): "White_king"}
+
+# Moves of the multi_jump scenario, played on the boards of the legal_moves tests in CheckersGameTester: a man's jump
+# and subsequent jump, then a triple king jumping its own piece and two White men at once
+MULTI_JUMP_BOARDS = (
+    ({(5, 2): "Black", (4, 3): "White", (2, 5): "White", (0, 1): "White"},
+     (("Faris", (5, 2), (3, 4)), ("Faris", (3, 4), (1, 6)))),
+    ({(7, 0): "Black_Triple_King", (6, 1): "Black", (4, 3): "White", (3, 4): "White", (1, 6): "White"},
+     (("Faris", (7, 0), (2, 5)),)),
+)
+
+# One suite result. ops_per_second is the best of the timed rounds. peak_kib is the most memory the scenario held
+# above where it started while running once under tracemalloc, and retained_blocks_per_op is how many more memory
+# blocks were allocated after that run than before, per operation
+BenchmarkResult = namedtuple("BenchmarkResult", ["name", "ops_per_second", "peak_kib", "retained_blocks_per_op"])
+
+# Returned by compare_to_baseline for every scenario that got slower than the threshold allows
+Regression = namedtuple("Regression", ["name", "baseline_ops_per_second", "ops_per_second", "change"])
+
+
+# Run in a new interpreter by benchmark_startup so the import isn't already cached
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+import CheckersGame
+imported = time.perf_counter()
+CheckersGame.Checkers()
+created = time.perf_counter()
+print(imported - start, created - imported)
+"""
+
+
+def benchmark_startup(repeat=5):
+    """
+    Starts a new Python process repeat times and returns the fastest (seconds to import CheckersGame, seconds for the
+    first Checkers()). Raises AssertionError if the import prints anything.
+    """
+
+    best_import = best_create = float("inf")
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.split("\n")
+        assert len(output) == 2 and output[1] == "", "importing CheckersGame printed output"
+        import_time, create_time = (float(number) for number in output[0].split())
+        best_import = min(best_import, import_time)
+        best_create = min(best_create, create_time)
+    return best_import, best_create
+
+
+def run_startup(repeat=5):
+    """
+    Returns the benchmark_startup timings as a dict of name: BenchmarkResult for the suite, with ops_per_second being
+    imports of CheckersGame per second and first Checkers() per second. Memory isn't measured in the new process, so
+    peak_kib and retained_blocks_per_op are 0.
+    """
+
+    import_time, create_time = benchmark_startup(repeat)
+    return {name: BenchmarkResult(name, 1 / seconds, 0.0, 0.0)
+            for name, seconds in (("startup_import", import_time), ("startup_create", create_time))}
+
+
+def benchmark_play_game(repeat=2000):
+    """Replays SCRIPTED_GAME repeat times and returns the number of play_game calls per second"""
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        play_scripted_game()
+    elapsed = time.perf_counter() - start
+    return repeat * len(SCRIPTED_GAME) / elapsed
+
+
+def benchmark_get_checker_details(repeat=2000):
+    """Reads all 64 squares of the starting board repeat times and returns get_checker_details calls per second"""
+
+    game = Checkers()
+    squares = [(row, column) for row in range(8) for column in range(8)]
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for square in squares:
+            game.get_checker_details(square)
+    elapsed = time.perf_counter() - start
+    return repeat * len(squares) / elapsed
+
+
+def benchmark_render(repeat=200):
+    """
+    Draws the board at every position of SCRIPTED_GAME repeat times with pretty_print_board (into a string buffer),
+    with BoardRenderer.render_position and with the cached BoardRenderer.render. Returns boards per second for each.
+    """
+
+    games = [Checkers.from_bytes(snapshot) for snapshot in scripted_snapshots()]
+    positions = [game.get_position() for game in games]
+    renderer = BoardRenderer()
+    rates = []
+
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        for _ in range(repeat):
+            for game in games:
+                game.pretty_print_board()
+                output.seek(0)
+                output.truncate()
+    rates.append(repeat * len(games) / (time.perf_counter() - start))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for position in positions:
+            renderer.render_position(position)
+    rates.append(repeat * len(games) / (time.perf_counter() - start))
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for game in games:
+            renderer.render(game)
+    rates.append(repeat * len(games) / (time.perf_counter() - start))
+    return tuple(rates)
+
+
+def benchmark_events(subscribers=1000, repeat=20):
+    """
+    Replays SCRIPTED_GAME repeat times with an EventStream of subscribers subscriptions set on the game, each with a
+    queue of 64 that drops its oldest events. Returns (moves/sec, deliveries/sec).
+    """
+
+    stream = EventStream()
+    for _ in range(subscribers):
+        stream.subscribe(64, "drop_oldest")
+    start = time.perf_counter()
+    for _ in range(repeat):
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.create_player("Faris", "Black")
+        game.set_event_stream(stream)
+        for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME:
+            game.play_game(player_name, starting_square_location, destination_square_location)
+    elapsed = time.perf_counter() - start
+    moves = repeat * len(SCRIPTED_GAME)
+    return moves / elapsed, moves * subscribers / elapsed
+
+
+def scripted_snapshots():
+    """Returns the to_bytes snapshot of the game before and after every move of SCRIPTED_GAME"""
+
+    game = Checkers()
+    game.create_player("Sam", "White")
+    game.create_player("Faris", "Black")
+    snapshots = [game.to_bytes()]
+    for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME:
+        game.play_game(player_name, starting_square_location, destination_square_location)
+        snapshots.append(game.to_bytes())
+    return snapshots
+
+
+def benchmark_legal_moves(repeat=200):
+    """
+    Calls legal_moves repeat times for the player who is up at every position of SCRIPTED_GAME and returns
+    legal_moves calls per second
+    """
+
+    game = Checkers()
+    game.create_player("Sam", "White")
+    game.create_player("Faris", "Black")
+    elapsed = 0
+    for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME:
+        game.play_game(player_name, starting_square_location, destination_square_location)
+        color = game.get_which_players_turn()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            game.legal_moves(color)
+        elapsed += time.perf_counter() - start
+    return repeat * len(SCRIPTED_GAME) / elapsed
+
+
+def benchmark_snapshot(games=100000):
+    """
+    Saves games live games with to_bytes into one buffer of length prefixed snapshots, then restores every one with
+    from_bytes. The games are the positions along SCRIPTED_GAME. Returns (saves/sec, restores/sec, bytes per game,
+    bytes per game with pickle).
+    """
+
+    snapshots = scripted_snapshots()
+    live_games = [Checkers.from_bytes(snapshots[number % len(snapshots)]) for number in range(games)]
+    length = struct.Struct("<H")
+
+    start = time.perf_counter()
+    buffer = bytearray()
+    for game in live_games:
+        snapshot = game.to_bytes()
+        buffer += length.pack(len(snapshot))
+        buffer += snapshot
+    save_time = time.perf_counter() - start
+    pickled_size = len(pickle.dumps(live_games[-1]))
+    del live_games
+
+    start = time.perf_counter()
+    restored_games = []
+    view = memoryview(buffer)
+    offset = 0
+    while offset < len(buffer):
+        snapshot_length, = length.unpack_from(buffer, offset)
+        offset += length.size
+        restored_games.append(Checkers.from_bytes(view[offset:offset + snapshot_length]))
+        offset += snapshot_length
+    restore_time = time.perf_counter() - start
+    assert len(restored_games) == games
+    view.release()
+    return games / save_time, games / restore_time, len(buffer) / games, pickled_size
+
+
+def benchmark_memory(games=10000):
+    """
+    Measures the memory held by games live games with two players each, as a server keeps its idle tables, with
+    tracemalloc. Returns (bytes per new game, bytes per game once both players' move lists are cached).
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        live_games = []
+        for _ in range(games):
+            game = Checkers()
+            game.create_player("Sam", "White")
+            game.create_player("Faris", "Black")
+            live_games.append(game)
+        new_game_bytes = (tracemalloc.get_traced_memory()[0] - start) / games
+        for game in live_games:
+            game.get_mobility("White")
+            game.get_mobility("Black")
+        cached_game_bytes = (tracemalloc.get_traced_memory()[0] - start) / games
+    finally:
+        tracemalloc.stop()
+    return new_game_bytes, cached_game_bytes
+
+
+def benchmark_engine(time_budget=1.0):
+    """Searches the starting board for Black for time_budget seconds and returns the engine's SearchResult"""
+
+    return CheckersEngine().search(Checkers(), "Black", time_budget=time_budget)
+
+
+def benchmark_parallel_search(worker_counts=(1, 2, 4, 8), max_depth=8):
+    """
+    Runs a fixed depth parallel_search on the starting board with each number of workers in worker_counts.
+    Returns a list of (workers, seconds, nodes/sec). The pool is started and warmed up before the clock starts.
+    """
+
+    results = []
+    for workers in worker_counts:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            parallel_search(Checkers(), "Black", max_depth=1, executor=executor)
+            result = parallel_search(Checkers(), "Black", max_depth=max_depth, executor=executor)
+        results.append((workers, result.elapsed, result.nodes_per_second))
+    return results
+
+
+def position_with_pieces(pieces, turn="Black"):
+    """Returns the Checkers.get_position tuple of a board holding only pieces, a dict of (row, column): piece name"""
+
+    bitboards = [0] * 6
+    for square_location, piece in pieces.items():
+        bitboards[PIECE_CODES[piece]] |= 1 << SQUARE_INDEX[square_location]
+    return tuple(bitboards) + (int(turn == "Black"), 0)
+
+
+def _new_game(position=None):
+    """Returns a Checkers game with Sam (White) and Faris (Black), set to position if one is given"""
+
+    game = Checkers()
+    game.create_player("Sam", "White")
+    game.create_player("Faris", "Black")
+    if position is not None:
+        game.set_position(position)
+    return game
+
+
+def _playout_moves(game, choose, max_moves):
+    """Plays up to max_moves moves on game, picking each with choose(moves), and returns them as play_game arguments"""
+
+    names = {0: "Sam", 1: "Faris"}
+    played = []
+    while len(played) < max_moves and game.game_winner() == "Game has not ended":
+        color_index, moves = side_to_move(game)
+        move = choose(moves)
+        game.play_game(names[color_index], move[0], move[1])
+        played.append((names[color_index], move[0], move[1]))
+    return tuple(played)
+
+
+def scenario_play_game(repeat):
+    """Plays all of SCRIPTED_GAME through play_game on a new game repeat times. Returns the number of moves."""
+
+    for _ in range(repeat):
+        play_scripted_game()
+    return repeat * len(SCRIPTED_GAME)
+
+
+def scenario_scripted_opening(repeat):
+    """Plays the first 12 moves of SCRIPTED_GAME on a new game repeat times. Returns the number of moves."""
+
+    opening = SCRIPTED_GAME[:12]
+    for _ in range(repeat):
+        game = _new_game()
+        for player_name, starting_square_location, destination_square_location in opening:
+            game.play_game(player_name, starting_square_location, destination_square_location)
+    return repeat * len(opening)
+
+
+def _endgame_moves():
+    """Returns the TRIPLE_KING_ENDGAME moves, each side taking its first jump whenever it has one"""
+
+    return _playout_moves(_new_game(position_with_pieces(TRIPLE_KING_ENDGAME)), lambda moves: moves[0], 40)
+
+
+def scenario_triple_king_endgame(repeat, moves=None):
+    """Plays out TRIPLE_KING_ENDGAME repeat times. Returns the number of moves."""
+
+    moves = moves or _endgame_moves()
+    position = position_with_pieces(TRIPLE_KING_ENDGAME)
+    for _ in range(repeat):
+        game = _new_game(position)
+        for player_name, starting_square_location, destination_square_location in moves:
+            game.play_game(player_name, starting_square_location, destination_square_location)
+    return repeat * len(moves)
+
+
+def scenario_random_playout(repeat):
+    """
+    Plays repeat seeded random games of up to 150 moves, generating the legal moves before every move. Returns the
+    number of moves.
+    """
+
+    rng = random.Random(2023)
+    played = 0
+    for _ in range(repeat):
+        played += len(_playout_moves(_new_game(), rng.choice, 150))
+    return played
+
+
+def scenario_multi_jump(repeat):
+    """Plays the MULTI_JUMP_BOARDS moves repeat times. Returns the number of moves."""
+
+    boards = [(position_with_pieces(pieces), moves) for pieces, moves in MULTI_JUMP_BOARDS]
+    played = 0
+    for _ in range(repeat):
+        for position, moves in boards:
+            game = _new_game(position)
+            for player_name, starting_square_location, destination_square_location in moves:
+                game.play_game(player_name, starting_square_location, destination_square_location)
+            played += len(moves)
+    return played
+
+
+def scenario_get_checker_details(repeat):
+    """Reads every dark square of the scripted game's middle position repeat times. Returns the number of lookups."""
+
+    game = _new_game()
+    for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME[:20]:
+        game.play_game(player_name, starting_square_location, destination_square_location)
+    for _ in range(repeat):
+        for square_location in SQUARE_LOCATIONS:
+            game.get_checker_details(square_location)
+    return repeat * len(SQUARE_LOCATIONS)
+
+
+# key=scenario name, value=function that runs it repeat times and returns how many operations it did
+SCENARIOS = {
+    "play_game": scenario_play_game,
+    "scripted_opening": scenario_scripted_opening,
+    "triple_king_endgame": scenario_triple_king_endgame,
+    "random_playout": scenario_random_playout,
+    "multi_jump": scenario_multi_jump,
+    "get_checker_details": scenario_get_checker_details,
+}
+
+
+def run_scenario(name, min_time=0.2, rounds=3):
+    """
+    Returns the BenchmarkResult of scenario name. The repeat count is doubled until one run takes min_time seconds,
+    then rounds runs are timed with garbage collection off.
+    """
+
+    scenario = SCENARIOS[name]
+    repeat = 1
+    while True:
+        start = time.perf_counter()
+        scenario(repeat)
+        if time.perf_counter() - start >= min_time / 4 or repeat >= 1 << 20:
+            break
+        repeat *= 2
+    repeat = max(1, int(repeat * min_time / max(time.perf_counter() - start, 1e-9)))
+
+    best = 0.0
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            operations = scenario(repeat)
+            best = max(best, operations / (time.perf_counter() - start))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    gc.collect()
+    blocks = sys.getallocatedblocks()
+    tracemalloc.start()
+    try:
+        baseline_memory = tracemalloc.get_traced_memory()[0]
+        operations = scenario(max(1, repeat // 10))
+        peak = tracemalloc.get_traced_memory()[1] - baseline_memory
+    finally:
+        tracemalloc.stop()
+    gc.collect()
+    retained = (sys.getallocatedblocks() - blocks) / operations
+    return BenchmarkResult(name, best, peak / 1024, retained)
+
+
+def run_suite(names=None, min_time=0.2):
+    """Runs the scenarios in names (every scenario by default) and returns a dict of name: BenchmarkResult"""
+
+    return {name: run_scenario(name, min_time) for name in (names or SCENARIOS)}
+
+
+def save_baseline(results, path):
+    """Saves suite results to path as JSON, along with the Python version they were measured on"""
+
+    baseline = {"python": platform.python_version(),
+                "scenarios": {name: result._asdict() for name, result in results.items()}}
+    with open(path, "w") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+
+
+def load_baseline(path):
+    """Returns the dict of name: BenchmarkResult saved at path, or None if there is no baseline there"""
+
+    if not os.path.exists(path):
+        return None
+    with open(path) as baseline_file:
+        baseline = json.load(baseline_file)
+    return {name: BenchmarkResult(**fields) for name, fields in baseline["scenarios"].items()}
+
+
+def compare_to_baseline(results, baseline, threshold=0.1):
+    """
+    Returns a Regression for every scenario in results whose ops_per_second is more than threshold (a fraction) below
+    its baseline. Scenarios without a baseline are skipped.
+    """
+
+    regressions = []
+    for name, result in results.items():
+        if name in baseline:
+            change = result.ops_per_second / baseline[name].ops_per_second - 1
+            if change < -threshold:
+                regressions.append(Regression(name, baseline[name].ops_per_second, result.ops_per_second, change))
+    return regressions
+
+
+def main():
+    """
+    Prints the result of every benchmark, then runs the suite and compares it with the baseline. Returns 1 if any
+    scenario regressed, otherwise 0.
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the Checkers game and engine")
+    parser.add_argument("--suite-only", action="store_true", help="only run the benchmark suite")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="JSON baseline file")
+    parser.add_argument("--save-baseline", action="store_true", help="save this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.1, help="slowdown, as a fraction, that counts as a "
+                                                                     "regression")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per timed round of each scenario")
+    args = parser.parse_args()
+
+    if not args.suite_only:
+        print_benchmarks()
+
+    results = run_suite(min_time=args.min_time)
+    startup_results = run_startup()
+    results.update(startup_results)
+    baseline = load_baseline(args.baseline)
+    for result in results.values():
+        if result.name in startup_results:
+            line = f"{result.name}: {1000 / result.ops_per_second:.3f} ms"
+        else:
+            line = (f"{result.name}: {result.ops_per_second:,.0f} ops/sec, peak {result.peak_kib:.1f} KiB, "
+                    f"{result.retained_blocks_per_op:.2f} retained blocks/op")
+        if baseline is not None and result.name in baseline:
+            line += f" ({result.ops_per_second / baseline[result.name].ops_per_second - 1:+.1%} vs baseline)"
+        print(line)
+
+    regressions = []
+    if baseline is not None:
+        regressions = compare_to_baseline(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression.name}: {regression.ops_per_second:,.0f} ops/sec, was "
+                  f"{regression.baseline_ops_per_second:,.0f} ({regression.change:+.1%})")
+    if args.save_baseline or baseline is None:
+        save_baseline(results, args.baseline)
+        print(f"baseline saved to {args.baseline}")
+    return 1 if regressions else 0
+
+
+def print_benchmarks():
+    """Prints the result of every benchmark outside the suite. Startup is timed as part of the suite."""
+
+    print(f"play_game: {benchmark_play_game():,.0f} moves/sec")
+    print(f"get_checker_details: {benchmark_get_checker_details():,.0f} lookups/sec")
+    print(f"legal_moves: {benchmark_legal_moves():,.0f} calls/sec")
+    pretty_print_rate, render_rate, cached_render_rate = benchmark_render()
+    print(f"render: pretty_print_board {pretty_print_rate:,.0f} boards/sec, BoardRenderer {render_rate:,.0f} uncached, "
+          f"{cached_render_rate:,.0f} cached")
+    moves, deliveries = benchmark_events()
+    print(f"events: {moves:,.0f} moves/sec, {deliveries:,.0f} deliveries/sec to 1,000 subscribers")
+    saves, restores, snapshot_size, pickled_size = benchmark_snapshot()
+    print(f"snapshot: {saves:,.0f} saves/sec, {restores:,.0f} restores/sec, {snapshot_size:.1f} bytes/game "
+          f"({pickled_size} with pickle)")
+    new_game_bytes, cached_game_bytes = benchmark_memory()
+    print(f"memory: {new_game_bytes:,.0f} bytes/game, {cached_game_bytes:,.0f} with cached move lists")
+    result = benchmark_engine()
+    print(f"engine: {result.nodes_per_second:,.0f} nodes/sec, depth {result.depth} in {result.elapsed:.2f} sec")
+    for workers, elapsed, nodes_per_second in benchmark_parallel_search():
+        print(f"parallel search, {workers} workers: {elapsed:.2f} sec, {nodes_per_second:,.0f} nodes/sec")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
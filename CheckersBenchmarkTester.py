@@ -0,0 +1,64 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for the CheckersBenchmark suite. Tests that every scenario plays legal moves, that
+# baselines, startup timings included, save and load as JSON, and that slowdowns beyond the threshold are flagged.
+
+import os
+import tempfile
+import unittest
+from CheckersBenchmark import (SCENARIOS, BenchmarkResult, run_suite, save_baseline, load_baseline,
+                               compare_to_baseline, run_startup, scenario_triple_king_endgame, _endgame_moves)
+
+
+class CheckersBenchmarkTests(unittest.TestCase):
+
+    def test_scenarios(self):
+        """Test that every scenario runs without an exception and counts its operations"""
+
+        for name, scenario in SCENARIOS.items():
+            self.assertGreater(scenario(2), 0, name)
+        moves = _endgame_moves()
+        self.assertEqual(scenario_triple_king_endgame(3, moves), 3 * len(moves))
+
+    def test_baseline_round_trip(self):
+        """Test that a suite run saves and loads unchanged"""
+
+        results = run_suite(["multi_jump"], min_time=0.01)
+        self.assertGreater(results["multi_jump"].ops_per_second, 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            self.assertIsNone(load_baseline(path))
+            save_baseline(results, path)
+            self.assertEqual(load_baseline(path), results)
+
+    def test_startup_results(self):
+        """Test that the import and first game timings are suite results that save and compare like scenarios"""
+
+        results = run_startup(repeat=1)
+        self.assertEqual(list(results), ["startup_import", "startup_create"])
+        for result in results.values():
+            self.assertGreater(result.ops_per_second, 0)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "baseline.json")
+            save_baseline(results, path)
+            baseline = load_baseline(path)
+        self.assertEqual(baseline, results)
+        slower = {name: result._replace(ops_per_second=result.ops_per_second / 2) for name, result in results.items()}
+        self.assertEqual([regression.name for regression in compare_to_baseline(slower, baseline)],
+                         ["startup_import", "startup_create"])
+
+    def test_regressions(self):
+        """Test that only slowdowns beyond the threshold are flagged"""
+
+        baseline = {"a": BenchmarkResult("a", 1000.0, 1.0, 0.0), "b": BenchmarkResult("b", 1000.0, 1.0, 0.0)}
+        results = {"a": BenchmarkResult("a", 950.0, 1.0, 0.0), "b": BenchmarkResult("b", 800.0, 1.0, 0.0),
+                   "c": BenchmarkResult("c", 10.0, 1.0, 0.0)}
+        regressions = compare_to_baseline(results, baseline, threshold=0.1)
+        self.assertEqual([regression.name for regression in regressions], ["b"])
+        self.assertAlmostEqual(regressions[0].change, -0.2)
+        self.assertEqual(compare_to_baseline(results, baseline, threshold=0.01)[0].name, "a")
+
+
+if __name__ == '__main__':
+    unittest.main()
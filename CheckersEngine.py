@@ -0,0 +1,403 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains a CheckersEngine Class that picks moves for a Player in a Checkers game. It searches with negamax
+# alpha-beta and iterative deepening under a time budget, using a transposition table, killer moves and a history table.
+# parallel_search splits the root moves of a search across a process pool. An opening book can be checked before
+# searching.
+
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from CheckersGame import Checkers, COLOR_INDEX, SQUARE_INDEX
+
+
+WIN_SCORE = 100000      # score of a position where the player to move has already won
+PIECE_VALUES = (100, 250, 400)      # man, king, triple king
+
+# transposition table entry flags
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+
+# Returned by CheckersEngine.search. score is from the searching player's point of view and depth is the deepest
+# iteration that finished in time
+SearchResult = namedtuple("SearchResult", ["move", "score", "depth", "nodes", "elapsed", "nodes_per_second"])
+
+
+class SearchTimeout(Exception):
+    """Raised inside a search when the time budget runs out"""
+    pass
+
+
+def side_to_move(game):
+    """
+    Returns (color index, moves) for the player who moves next in game's search tree.
+    A player who just jumped and can capture again keeps moving, so their subsequent jumps come before the
+    opponent's turn. Otherwise it is whoever get_which_players_turn names.
+    """
+
+    turn_index = COLOR_INDEX[game.get_which_players_turn()]
+    if game.get_jump_just_occurred():
+        subsequent_jumps = game._generate_moves(1 - turn_index, True)
+        if subsequent_jumps:
+            return 1 - turn_index, subsequent_jumps
+    return turn_index, game._generate_moves(turn_index, False)
+
+
+def evaluate(game, color_index):
+    """Returns the material balance of game from color_index's point of view"""
+
+    counts = game._piece_counts
+    white = PIECE_VALUES[0] * counts[0] + PIECE_VALUES[1] * counts[1] + PIECE_VALUES[2] * counts[2]
+    black = PIECE_VALUES[0] * counts[3] + PIECE_VALUES[1] * counts[4] + PIECE_VALUES[2] * counts[5]
+    if color_index == 0:
+        return white - black
+    return black - white
+
+
+def is_jump(move):
+    """Returns True if move, a (starting_square_location, destination_square_location) tuple, is a jump"""
+
+    return abs(move[1][1] - move[0][1]) > 1
+
+
+class CheckersEngine:
+    """
+    Represents a computer opponent that takes a transposition table size (rounded up to a power of two), a time budget
+    in seconds per move, a maximum search depth and, optionally, a CheckersTablebase.Tablebase and a
+    CheckersOpeningBook.OpeningBook. Positions with few enough pieces for the tablebase are scored from it instead of
+    searched, and positions in the book are answered with its most played move without searching.
+
+    Searches on the Checkers object it is given with make_move/unmake_move, so the game is unchanged afterwards.
+    Keeps its transposition table and history table between moves. Killer moves are cleared for every search.
+    """
+
+    def __init__(self, table_size=1 << 18, time_budget=1.0, max_depth=64, tablebase=None, book=None):
+        size = 1
+        while size < table_size:
+            size *= 2
+        self._table = [None] * size     # entries are (hash, depth, score, flag, best move, age)
+        self._table_mask = size - 1
+        self._age = 0       # bumped every search so entries from old searches get replaced first
+        self._time_budget = time_budget
+        self._max_depth = max_depth
+        self._history = {}      # key=move, value=bonus earned by causing beta cutoffs
+        self._killers = []      # two quiet moves per ply that caused beta cutoffs
+        self._path = set()      # hashes of the positions between the root and the current node
+        self._nodes = 0
+        self._deadline = 0
+        self._tablebase = tablebase
+        self._tablebase_pieces = tablebase.get_max_pieces() if tablebase is not None else 0
+        self._book = book
+
+    def get_time_budget(self):
+        """Returns the number of seconds a search may take"""
+
+        return self._time_budget
+
+    def set_time_budget(self, time_budget):
+        """Sets the number of seconds a search may take"""
+
+        self._time_budget = time_budget
+
+    def clear(self):
+        """Empties the transposition and history tables"""
+
+        self._table = [None] * len(self._table)
+        self._history = {}
+
+    def choose_move(self, game, player_object):
+        """
+        Returns the (starting_square_location, destination_square_location) the engine picks for player_object, or None
+        if the player has no move
+        """
+
+        return self.search(game, player_object.get_checker_color()).move
+
+    def play_move(self, game, player_object):
+        """
+        Picks a move for player_object and plays it through play_game. Returns the move, or None if there was nothing to
+        play
+        """
+
+        move = self.choose_move(game, player_object)
+        if move is not None:
+            game.play_game(player_object.get_name(), move[0], move[1])
+        return move
+
+    def search(self, game, color, max_depth=None, time_budget=None):
+        """
+        Searches game for color ("White" or "Black") with iterative deepening and returns a SearchResult.
+        Stops at max_depth or when time_budget seconds have passed, whichever comes first. The move from the deepest
+        finished iteration is returned. A search always finishes depth 1 even if the budget is already spent.
+        A move from the opening book is returned with depth 0 and no nodes searched.
+        """
+
+        if max_depth is None:
+            max_depth = self._max_depth
+        if time_budget is None:
+            time_budget = self._time_budget
+
+        color_index = COLOR_INDEX[color]
+        start = time.perf_counter()
+        if self._book is not None:
+            book_move = self._book.choose_move(game, color)
+            if book_move is not None:
+                return SearchResult(book_move, 0, 0, 0, time.perf_counter() - start, 0.0)
+        moves = game.legal_moves(color)
+        self._nodes = 0
+        self._age += 1
+        self._killers = [[None, None] for _ in range(max_depth + 2)]
+        self._path = set()
+        best_move = moves[0] if moves else None
+        best_score = -WIN_SCORE
+        finished_depth = 0
+
+        for depth in range(1, max_depth + 1):
+            if not moves:
+                break
+            # depth 1 has no deadline so there is always a move to return
+            self._deadline = start + time_budget if depth > 1 else float("inf")
+            try:
+                best_score, best_move = self._search_root(game, color_index, moves, depth, best_move)
+            except SearchTimeout:
+                break
+            finished_depth = depth
+            if abs(best_score) > WIN_SCORE - 1000 or time.perf_counter() - start > time_budget:
+                break       # found a forced win or loss, or there is no time for another iteration
+
+        elapsed = time.perf_counter() - start
+        nodes_per_second = self._nodes / elapsed if elapsed > 0 else 0.0
+        return SearchResult(best_move, best_score, finished_depth, self._nodes, elapsed, nodes_per_second)
+
+    def score_move(self, game, move, max_depth, time_budget=None):
+        """
+        Scores move for the player making it by searching the position after it with iterative deepening, counting move
+        itself as the first ply. Returns (list of scores for depths 1 to the deepest finished depth, nodes searched).
+        Depth 1 always finishes, deeper iterations stop when time_budget seconds have passed.
+        """
+
+        color_index = game._squares[SQUARE_INDEX[move[0]]] // 3
+        start = time.perf_counter()
+        self._nodes = 0
+        self._age += 1
+        self._killers = [[None, None] for _ in range(max_depth + 2)]
+        self._path = {game.get_hash()}
+        scores = []
+
+        for depth in range(1, max_depth + 1):
+            if time_budget is None or depth == 1:
+                self._deadline = float("inf")
+            else:
+                self._deadline = start + time_budget
+            try:
+                scores.append(self._search_child(game, move, color_index, depth, -WIN_SCORE - 1, WIN_SCORE + 1, 1))
+            except SearchTimeout:
+                break
+            if time_budget is not None and time.perf_counter() - start > time_budget:
+                break
+
+        self._path = set()
+        return scores, self._nodes
+
+    def _search_root(self, game, color_index, moves, depth, previous_best):
+        """Searches every root move to depth and returns (best score, best move)"""
+
+        alpha = -WIN_SCORE - 1
+        beta = WIN_SCORE + 1
+        best_move = previous_best
+        root_hash = game.get_hash()
+        self._path.add(root_hash)
+        try:
+            for move in self._order_moves(moves, previous_best, 0):
+                score = self._search_child(game, move, color_index, depth, alpha, beta, 1)
+                if score > alpha:
+                    alpha = score
+                    best_move = move
+        finally:
+            self._path.discard(root_hash)
+        self._store(root_hash, depth, alpha, EXACT, best_move, 0)
+        return alpha, best_move
+
+    def _search_child(self, game, move, color_index, depth, alpha, beta, ply):
+        """Plays move, searches the resulting position and returns its score from color_index's point of view"""
+
+        game.make_move(move)
+        try:
+            child_color_index, child_moves = side_to_move(game)
+            if child_color_index == color_index:        # subsequent jump by the same player
+                return self._negamax(game, child_color_index, child_moves, depth - 1, alpha, beta, ply)
+            return -self._negamax(game, child_color_index, child_moves, depth - 1, -beta, -alpha, ply)
+        finally:
+            game.unmake_move()
+
+    def _negamax(self, game, color_index, moves, depth, alpha, beta, ply):
+        """Returns the score of game for color_index, who is about to choose one of moves"""
+
+        self._nodes += 1
+        if self._nodes & 1023 == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout
+
+        if not moves:       # blocked or out of pieces
+            return -WIN_SCORE + ply
+        position_hash = game.get_hash()
+        if position_hash in self._path:     # repeated position
+            return 0
+        if self._tablebase_pieces and sum(game._piece_counts) <= self._tablebase_pieces:
+            result = self._tablebase.probe(game)
+            if result is not None:
+                if result.result == 1:      # win
+                    return WIN_SCORE - ply - result.distance
+                if result.result == 2:      # loss
+                    return -WIN_SCORE + ply + result.distance
+                return 0
+        if depth <= 0:
+            return evaluate(game, color_index)
+
+        entry = self._table[position_hash & self._table_mask]
+        table_move = None
+        if entry is not None and entry[0] == position_hash:
+            table_move = entry[4]
+            if entry[1] >= depth:
+                score = self._score_from_table(entry[2], ply)
+                flag = entry[3]
+                if flag == EXACT:
+                    return score
+                if flag == LOWER_BOUND and score >= beta:
+                    return score
+                if flag == UPPER_BOUND and score <= alpha:
+                    return score
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        self._path.add(position_hash)
+        try:
+            for move in self._order_moves(moves, table_move, ply):
+                score = self._search_child(game, move, color_index, depth, alpha, beta, ply + 1)
+                if score > best_score:
+                    best_score = score
+                    best_move = move
+                if score > alpha:
+                    alpha = score
+                if alpha >= beta:
+                    if not is_jump(move):
+                        self._remember_cutoff(move, depth, ply)
+                    break
+        finally:
+            self._path.discard(position_hash)
+
+        if best_score <= original_alpha:
+            flag = UPPER_BOUND
+        elif best_score >= beta:
+            flag = LOWER_BOUND
+        else:
+            flag = EXACT
+        self._store(position_hash, depth, best_score, flag, best_move, ply)
+        return best_score
+
+    def _order_moves(self, moves, table_move, ply):
+        """Returns moves sorted with the transposition table move first, then jumps, killer moves and history scores"""
+
+        killers = self._killers[ply] if ply < len(self._killers) else (None, None)
+        history = self._history
+
+        def priority(move):
+            if move == table_move:
+                return 3000000
+            if is_jump(move):
+                return 2000000
+            if move == killers[0] or move == killers[1]:
+                return 1000000
+            return history.get(move, 0)
+
+        return sorted(moves, key=priority, reverse=True)
+
+    def _remember_cutoff(self, move, depth, ply):
+        """Records a quiet move that caused a beta cutoff in the killer and history tables"""
+
+        if ply < len(self._killers):
+            killers = self._killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        self._history[move] = self._history.get(move, 0) + depth * depth
+
+    def _store(self, position_hash, depth, score, flag, best_move, ply):
+        """
+        Saves a search result in the transposition table. An entry from an older search is always replaced, an entry
+        from this search only by a result searched at least as deep.
+        """
+
+        slot = position_hash & self._table_mask
+        entry = self._table[slot]
+        if entry is None or entry[5] != self._age or depth >= entry[1]:
+            if score > WIN_SCORE - 1000:        # store wins and losses relative to this node, not the root
+                score += ply
+            elif score < -WIN_SCORE + 1000:
+                score -= ply
+            self._table[slot] = (position_hash, depth, score, flag, best_move, self._age)
+
+    @staticmethod
+    def _score_from_table(score, ply):
+        """Converts a stored win or loss score back to a distance from the root"""
+
+        if score > WIN_SCORE - 1000:
+            return score - ply
+        if score < -WIN_SCORE + 1000:
+            return score + ply
+        return score
+
+
+def _score_root_move(position, move, max_depth, time_budget, table_size):
+    """
+    Process pool task for parallel_search. Rebuilds the game from position, a tuple from Checkers.get_position, and
+    returns CheckersEngine.score_move for move.
+    """
+
+    game = Checkers()
+    game.set_position(position)
+    return CheckersEngine(table_size=table_size).score_move(game, move, max_depth, time_budget)
+
+
+def parallel_search(game, color, max_depth=None, time_budget=None, workers=None, executor=None, table_size=1 << 16):
+    """
+    Searches game for color ("White" or "Black") by scoring every root move in its own process and returns a
+    SearchResult like CheckersEngine.search.
+    Workers get the position as the 8 integer tuple from Checkers.get_position. Pass a ProcessPoolExecutor as executor
+    to reuse it between searches, otherwise one with workers processes is made for this search.
+    With max_depth and no time_budget every root move is searched to max_depth and the result doesn't depend on the
+    number of workers: the highest score wins and ties go to the move listed first by legal_moves. With a time_budget,
+    moves are compared at the deepest depth every worker finished.
+    """
+
+    if max_depth is None:
+        max_depth = 64
+    start = time.perf_counter()
+    moves = game.legal_moves(color)
+    if not moves:
+        return SearchResult(None, -WIN_SCORE, 0, 0, 0.0, 0.0)
+
+    position = game.get_position()
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_score_root_move, position, move, max_depth, time_budget, table_size)
+                   for move in moves]
+        results = [future.result() for future in futures]
+    finally:
+        if own_executor:
+            executor.shutdown()
+
+    depth = min(len(scores) for scores, nodes in results)
+    nodes = sum(nodes for scores, nodes in results)
+    best_move = None
+    best_score = -WIN_SCORE - 1
+    for move, (scores, move_nodes) in zip(moves, results):
+        if scores[depth - 1] > best_score:
+            best_score = scores[depth - 1]
+            best_move = move
+
+    elapsed = time.perf_counter() - start
+    nodes_per_second = nodes / elapsed if elapsed > 0 else 0.0
+    return SearchResult(best_move, best_score, depth, nodes, elapsed, nodes_per_second)
@@ -0,0 +1,85 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersEngine. Tests that a search leaves the game as it found it, finds
+# captures and wins, keeps to its time budget, plays subsequent jumps, and splits a search across processes.
+
+import unittest
+from CheckersGame import Checkers
+from CheckersEngine import CheckersEngine, WIN_SCORE, parallel_search
+from CheckersFixtures import set_up_board, game_state
+
+
+class CheckersEngineTests(unittest.TestCase):
+
+    def test_search_leaves_game_unchanged(self):
+        """Test that the board, turn, jump flag, counts and hash are the same after a search"""
+
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.create_player("Faris", "Black")
+        before = game_state(game)
+        position_hash = game.get_hash()
+        result = CheckersEngine().search(game, "Black", max_depth=5)
+        self.assertIn(result.move, game.legal_moves("Black"))
+        self.assertEqual(result.depth, 5)
+        self.assertEqual(game_state(game), before)
+        self.assertEqual(game.get_hash(), position_hash)
+
+    def test_takes_free_piece(self):
+        """Test that the engine captures a piece that can't be recaptured"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White", (0, 1): "White", (7, 6): "Black"})
+        result = CheckersEngine().search(game, "Black", max_depth=4)
+        self.assertEqual(result.move, ((5, 2), (3, 4)))
+        self.assertGreater(result.score, 0)
+
+    def test_finds_win(self):
+        """Test that capturing the last opponent piece is scored as a win"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White", (7, 6): "Black"})
+        result = CheckersEngine().search(game, "Black", max_depth=3)
+        self.assertEqual(result.move, ((5, 2), (3, 4)))
+        self.assertGreater(result.score, WIN_SCORE - 1000)
+
+    def test_subsequent_jump(self):
+        """Test that the engine plays the subsequent jump for the player who just jumped"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White", (2, 5): "White", (0, 1): "White", (7, 6): "Black"})
+        faris = game.get_player("Faris")
+        engine = CheckersEngine()
+        engine.play_move(game, faris)
+        self.assertEqual(game.get_checker_details((3, 4)), "Black")
+        self.assertEqual(engine.play_move(game, faris), ((3, 4), (1, 6)))
+        self.assertEqual(faris.get_total_captured_pieces_count(), 2)
+
+    def test_time_budget(self):
+        """Test that a search stops close to its time budget and still returns a move"""
+
+        game = Checkers()
+        result = CheckersEngine().search(game, "Black", time_budget=0.05)
+        self.assertIsNotNone(result.move)
+        self.assertGreaterEqual(result.depth, 1)
+        self.assertLess(result.elapsed, 1)
+        self.assertGreater(result.nodes_per_second, 0)
+
+    def test_no_moves(self):
+        """Test that a player with no move gets None"""
+
+        game = Checkers()
+        self.assertIsNone(CheckersEngine().search(game, "White").move)
+
+    def test_parallel_search(self):
+        """Test that a fixed depth parallel search gives the same answer for any number of workers"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White", (1, 4): "White", (6, 5): "Black", (2, 1): "White"})
+        one_worker = parallel_search(game, "Black", max_depth=4, workers=1)
+        two_workers = parallel_search(game, "Black", max_depth=4, workers=2)
+        self.assertEqual(one_worker.move, two_workers.move)
+        self.assertEqual(one_worker.score, two_workers.score)
+        self.assertEqual(one_worker.depth, 4)
+        self.assertEqual(one_worker.score, CheckersEngine().search(game, "Black", max_depth=4).score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains an EventStream Class that fans the MoveEvents of one or more Checkers games out to many
+# subscribers, and the Subscription Class each subscriber reads from. Every subscription has a bounded queue and a
+# policy for what happens when its reader falls behind: drop the oldest event, drop the newest, or coalesce the events
+# of each game so only the latest one is kept. Deliveries are numbered, so a reader can tell when it missed events and
+# catch up from the position in the next one.
+
+from collections import deque, namedtuple
+
+
+POLICIES = ("drop_oldest", "drop_newest", "coalesce")
+
+# Handed to subscribers. sequence counts every event the stream published, starting at 1, source is the game that
+# published event
+Delivery = namedtuple("Delivery", ["sequence", "source", "event"])
+
+
+class Subscription:
+    """
+    Represents one subscriber's queue of Deliveries, holding at most max_queue of them. policy, one of POLICIES, decides
+    what a full queue does with a new delivery:
+    drop_oldest discards the oldest delivery, drop_newest discards the new one, and coalesce discards the queued
+    delivery from the same game as the new one (or the oldest one if that game has none queued) and queues the new one.
+    notify, if given, is called with no arguments after every delivery is queued, for example to wake a waiting reader.
+    """
+
+    def __init__(self, max_queue=256, policy="drop_oldest", notify=None):
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {', '.join(POLICIES)}")
+        if max_queue < 1:
+            raise ValueError("max_queue must be at least 1")
+        self._queue = deque()
+        self._max_queue = max_queue
+        self._policy = policy
+        self._notify = notify
+        self._dropped = 0
+        self._coalesced = 0
+
+    def __len__(self):
+        return len(self._queue)
+
+    def get_policy(self):
+        """Returns the policy used when the queue is full"""
+
+        return self._policy
+
+    def get_dropped(self):
+        """Returns the number of deliveries thrown away because the queue was full"""
+
+        return self._dropped
+
+    def get_coalesced(self):
+        """Returns the number of queued deliveries replaced by a later one from the same game"""
+
+        return self._coalesced
+
+    def offer(self, delivery):
+        """Queues delivery, applying the policy if the queue is full"""
+
+        queue = self._queue
+        if len(queue) >= self._max_queue:
+            if self._policy == "drop_newest":
+                self._dropped += 1
+                return
+            if self._policy == "coalesce":
+                for index, queued in enumerate(queue):
+                    if queued.source is delivery.source:
+                        del queue[index]
+                        self._coalesced += 1
+                        break
+                else:
+                    queue.popleft()
+                    self._dropped += 1
+            else:
+                queue.popleft()
+                self._dropped += 1
+        queue.append(delivery)
+        if self._notify is not None:
+            self._notify()
+
+    def get(self):
+        """Returns the oldest queued Delivery, or None if the queue is empty"""
+
+        return self._queue.popleft() if self._queue else None
+
+    def drain(self):
+        """Returns a list of every queued Delivery, oldest first, and empties the queue"""
+
+        deliveries = list(self._queue)
+        self._queue.clear()
+        return deliveries
+
+
+class EventStream:
+    """
+    Represents a publish/subscribe stream of game events. Pass it to Checkers.set_event_stream on any number of games
+    and every move they play is offered to every subscription. Publishing never blocks: a subscriber that falls behind
+    loses events according to its own policy without slowing the game or the other subscribers.
+    Not thread safe. Publish and read from the same thread or asyncio event loop.
+    """
+
+    def __init__(self):
+        self._subscriptions = []
+        self._sequence = 0
+
+    def subscribe(self, max_queue=256, policy="drop_oldest", notify=None):
+        """Returns a new Subscription that receives every event published from now on. Arguments are as for it."""
+
+        subscription = Subscription(max_queue, policy, notify)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Stops delivering events to subscription"""
+
+        self._subscriptions.remove(subscription)
+
+    def get_subscriber_count(self):
+        """Returns the number of subscriptions"""
+
+        return len(self._subscriptions)
+
+    def get_sequence(self):
+        """Returns the sequence number of the last event published, 0 before the first"""
+
+        return self._sequence
+
+    def publish(self, event, source=None):
+        """Numbers event, from the game source, and offers it to every subscription"""
+
+        self._sequence += 1
+        delivery = Delivery(self._sequence, source, event)
+        for subscription in self._subscriptions:
+            subscription.offer(delivery)
@@ -0,0 +1,90 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersEvents. Tests the MoveEvents a game publishes for steps, jumps and
+# promotions, fan-out to several subscribers, and the drop and coalesce policies of full queues.
+
+import unittest
+from CheckersGame import Checkers, MoveEvent
+from CheckersEvents import EventStream, Subscription, Delivery
+from CheckersMetrics import MoveMetrics
+from CheckersFixtures import SCRIPTED_GAME
+
+
+def new_game(stream):
+    """Returns a game with players Sam (White) and Faris (Black) that publishes to stream"""
+
+    game = Checkers()
+    game.create_player("Sam", "White")
+    game.create_player("Faris", "Black")
+    game.set_event_stream(stream)
+    return game
+
+
+class CheckersEventsTests(unittest.TestCase):
+
+    def test_move_events(self):
+        """Test the events of a step, a capture and a promotion, with and without metrics"""
+
+        for metrics in (None, MoveMetrics()):
+            stream = EventStream()
+            subscription = stream.subscribe()
+            game = new_game(stream)
+            game.set_metrics(metrics)
+            for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME:
+                game.play_game(player_name, starting_square_location, destination_square_location)
+            deliveries = subscription.drain()
+            self.assertEqual([delivery.sequence for delivery in deliveries], list(range(1, len(SCRIPTED_GAME) + 1)))
+            self.assertTrue(all(delivery.source is game for delivery in deliveries))
+            self.assertEqual(deliveries[0].event, MoveEvent("Faris", "Black", (5, 2), (4, 1), "Black", 0, (), (),
+                                                            "White", False, deliveries[0].event.position))
+            self.assertEqual(deliveries[2].event.captured_squares, ((3, 2),))
+            self.assertEqual(deliveries[2].event.captured_pieces, ("White",))
+            self.assertTrue(deliveries[2].event.jump_just_occurred)
+            promotions = [delivery.event for delivery in deliveries if delivery.event.promotion]
+            self.assertEqual((promotions[0].piece, promotions[0].promotion), ("Black_king", 1))
+            self.assertEqual(sum(len(delivery.event.captured_squares) for delivery in deliveries), 18)
+            self.assertEqual(deliveries[-1].event.position, game.get_position())
+
+        game.set_event_stream(None)
+        self.assertIsNone(game.get_event_stream())
+
+    def test_fan_out(self):
+        """Test that every subscriber gets every event, and that unsubscribed ones stop getting them"""
+
+        stream = EventStream()
+        woken = []
+        subscriptions = [stream.subscribe(notify=lambda: woken.append(1)) for _ in range(3)]
+        game = new_game(stream)
+        game.play_game("Faris", (5, 2), (4, 1))
+        stream.unsubscribe(subscriptions[2])
+        game.play_game("Sam", (2, 3), (3, 2))
+        self.assertEqual([len(subscription) for subscription in subscriptions], [2, 2, 1])
+        self.assertEqual(len(woken), 5)
+        self.assertEqual(subscriptions[0].get().event.player, "Faris")
+        self.assertEqual(subscriptions[0].get().event.player, "Sam")
+        self.assertIsNone(subscriptions[0].get())
+        self.assertEqual(stream.get_sequence(), 2)
+        self.assertEqual(stream.get_subscriber_count(), 2)
+
+    def test_policies(self):
+        """Test what each policy keeps when its queue is full"""
+
+        first_game, second_game = object(), object()
+        sources = [first_game, second_game, first_game, first_game, second_game]
+        kept = {}
+        for policy in ("drop_oldest", "drop_newest", "coalesce"):
+            subscription = Subscription(max_queue=2, policy=policy)
+            for sequence, source in enumerate(sources, 1):
+                subscription.offer(Delivery(sequence, source, None))
+            kept[policy] = ([delivery.sequence for delivery in subscription.drain()], subscription.get_dropped(),
+                            subscription.get_coalesced())
+        self.assertEqual(kept["drop_oldest"], ([4, 5], 3, 0))
+        self.assertEqual(kept["drop_newest"], ([1, 2], 3, 0))
+        self.assertEqual(kept["coalesce"], ([4, 5], 0, 3))
+        with self.assertRaises(ValueError):
+            Subscription(policy="block")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains the scripted Checkers game shared by the server's load test, the benchmarks and the unit tests,
+# a function that plays it, and the board setup and game state helpers the unit tests share.
+
+from CheckersGame import Checkers, PIECE_CODES, SQUARE_INDEX
+
+
+# A complete game between Sam (White) and Faris (Black) that ends with Faris capturing all 12 white checkers.
+# Each entry is (player_name, starting_square_location, destination_square_location)
+SCRIPTED_GAME = (
+    ("Faris", (5, 2), (4, 1)), ("Sam", (2, 3), (3, 2)), ("Faris", (4, 1), (2, 3)), ("Sam", (1, 2), (3, 4)),
+    ("Faris", (5, 4), (4, 5)), ("Sam", (0, 1), (1, 2)), ("Faris", (4, 5), (2, 3)), ("Faris", (2, 3), (0, 1)),
+    ("Sam", (2, 7), (3, 6)), ("Faris", (6, 3), (5, 2)), ("Sam", (2, 5), (3, 4)), ("Faris", (0, 1), (4, 5)),
+    ("Sam", (3, 6), (5, 4)), ("Faris", (6, 5), (4, 3)), ("Sam", (1, 6), (2, 7)), ("Faris", (5, 6), (4, 5)),
+    ("Sam", (1, 4), (2, 5)), ("Faris", (4, 5), (3, 6)), ("Sam", (2, 7), (4, 5)), ("Faris", (7, 6), (6, 5)),
+    ("Sam", (4, 5), (5, 4)), ("Faris", (5, 2), (4, 1)), ("Sam", (5, 4), (7, 6)), ("Sam", (7, 6), (3, 2)),
+    ("Faris", (4, 1), (2, 3)), ("Sam", (0, 3), (1, 2)), ("Faris", (2, 3), (0, 1)), ("Sam", (2, 1), (3, 2)),
+    ("Faris", (0, 1), (1, 2)), ("Sam", (2, 5), (3, 4)), ("Faris", (1, 2), (2, 1)), ("Sam", (0, 5), (1, 4)),
+    ("Faris", (2, 1), (4, 3)), ("Faris", (4, 3), (2, 5)), ("Faris", (2, 5), (0, 3)), ("Sam", (0, 7), (1, 6)),
+    ("Faris", (5, 0), (4, 1)), ("Sam", (1, 6), (2, 5)), ("Faris", (0, 3), (3, 6)), ("Sam", (1, 0), (2, 1)),
+    ("Faris", (4, 1), (3, 2)), ("Sam", (2, 1), (4, 3)), ("Faris", (3, 6), (4, 5)), ("Sam", (4, 3), (5, 4)),
+    ("Faris", (4, 5), (6, 3)))
+
+
+def play_scripted_game():
+    """Plays SCRIPTED_GAME on a new Checkers game and returns the finished game"""
+
+    game = Checkers()
+    game.create_player("Sam", "White")
+    game.create_player("Faris", "Black")
+    for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME:
+        game.play_game(player_name, starting_square_location, destination_square_location)
+    return game
+
+
+def set_up_board(pieces, turn="Black"):
+    """Returns a game with players Sam (White) and Faris (Black) whose board only holds pieces, a dict of
+    (row, column): piece name"""
+
+    game = Checkers()
+    game.create_player("Sam", "White")
+    game.create_player("Faris", "Black")
+    for square_index in range(len(SQUARE_INDEX)):
+        code = game._piece_at(square_index)
+        if code is not None:
+            game._remove_piece(code, square_index)
+    for square_location, piece in pieces.items():
+        game._place_piece(PIECE_CODES[piece], SQUARE_INDEX[square_location])
+    if turn != game.get_which_players_turn():
+        game.set_which_players_turn()
+    return game
+
+
+def game_state(game):
+    """Returns the board, turn, jump_just_occurred, every player's counts and the piece counts of game"""
+
+    counts = [(player.get_king_count(), player.get_triple_king_count(), player.get_total_captured_pieces_count())
+              for player in game._players]
+    piece_counts = [game.get_piece_counts(color) for color in ("White", "Black")]
+    return game.get_board(), game.get_which_players_turn(), game.get_jump_just_occurred(), counts, piece_counts
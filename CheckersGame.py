@@ -2,7 +2,141 @@
 # GitHub username: samantha-jarrah
 # Date: 3/10/23
 # Description: Contains a Player Class, Checkers Class, and 3 exceptions that all work together to create a console
-# version of checkers for two players.
+# version of checkers for two players. Run this file directly to play a game at the console.
+
+import random
+import re
+import struct
+import time
+from collections import namedtuple
+
+
+EMPTY_SQUARE = "__"
+
+# Piece codes index Checkers._bitboards. The color of a code is code // 3 and its rank is code % 3
+PIECE_NAMES = ("White", "White_king", "White_Triple_King", "Black", "Black_king", "Black_Triple_King")
+PIECE_CODES = {name: code for code, name in enumerate(PIECE_NAMES)}
+EMPTY_CODE = len(PIECE_NAMES)       # code stored for an empty square in the packed square array
+
+# The 32 dark squares are numbered 0-31 left to right, top to bottom, so (row, column) is square row * 4 + column // 2
+SQUARE_LOCATIONS = tuple((row, column) for row in range(8) for column in range(8) if (row + column) % 2 == 1)
+SQUARE_INDEX = {location: index for index, location in enumerate(SQUARE_LOCATIONS)}
+
+WHITE_START = (1 << 12) - 1     # squares 0-11
+BLACK_START = ((1 << 12) - 1) << 20     # squares 20-31
+
+COLORS = ("White", "Black")
+COLOR_INDEX = {color: index for index, color in enumerate(COLORS)}
+
+# Diagonal directions as (row step, column step). Men only move forward: down the board for White, up for Black
+DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+FORWARD_DIRECTIONS = ((2, 3), (0, 1))   # indexed by COLOR_INDEX
+
+
+def _build_rays():
+    """
+    Returns a tuple indexed by square then by direction. Each entry lists the squares met walking from that square
+    along the direction to the edge of the board, nearest first.
+    """
+
+    rays = []
+    for row, column in SQUARE_LOCATIONS:
+        square_rays = []
+        for row_step, column_step in DIRECTIONS:
+            ray = []
+            ray_row, ray_column = row + row_step, column + column_step
+            while 0 <= ray_row <= 7 and 0 <= ray_column <= 7:
+                ray.append(SQUARE_INDEX[(ray_row, ray_column)])
+                ray_row, ray_column = ray_row + row_step, ray_column + column_step
+            square_rays.append(tuple(ray))
+        rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+RAYS = _build_rays()
+
+
+def _build_step_masks():
+    """
+    Returns (man steps, king steps): bitboards of the squares one diagonal step from each square, for a man of each
+    color index (forward only) and for a king or triple king (any direction)
+    """
+
+    man_steps = tuple(tuple(sum(1 << rays[direction][0] for direction in FORWARD_DIRECTIONS[color_index]
+                                if rays[direction]) for rays in RAYS) for color_index in range(len(FORWARD_DIRECTIONS)))
+    king_steps = tuple(sum(1 << ray[0] for ray in rays if ray) for rays in RAYS)
+    return man_steps, king_steps
+
+
+MAN_STEPS, KING_STEPS = _build_step_masks()
+
+
+def _build_zobrist_keys():
+    """
+    Returns (piece keys, black to play key, jump just occurred key). Piece keys are indexed by piece code then square.
+    The generator is seeded so hashes match between processes and runs.
+    """
+
+    generator = random.Random(20230310)
+    piece_keys = tuple(tuple(generator.getrandbits(64) for _ in SQUARE_LOCATIONS) for _ in PIECE_NAMES)
+    return piece_keys, generator.getrandbits(64), generator.getrandbits(64)
+
+
+ZOBRIST_PIECES, ZOBRIST_BLACK_TURN, ZOBRIST_JUMP = _build_zobrist_keys()
+
+
+def _build_start_hash():
+    """Returns the hash of the starting board with Black up, so a new game doesn't have to compute it"""
+
+    position_hash = ZOBRIST_BLACK_TURN
+    for square_index in range(12):
+        position_hash ^= ZOBRIST_PIECES[0][square_index] ^ ZOBRIST_PIECES[3][square_index + 20]
+    return position_hash
+
+
+START_HASH = _build_start_hash()
+
+# The starting board as Checkers.__init__ copies it: bitboards and piece counts per piece code, and the packed squares
+START_BITBOARDS = (WHITE_START, 0, 0, BLACK_START, 0, 0)
+START_PIECE_COUNTS = (12, 0, 0, 12, 0, 0)
+START_SQUARES = bytes([0] * 12 + [EMPTY_CODE] * 8 + [3] * 12)
+
+
+def _quote_name(player_name):
+    """Returns player_name with the characters Checkers notation uses as separators percent encoded"""
+
+    return "".join(f"%{ord(character):02X}" if character in "%:/,\n" else character for character in player_name)
+
+
+def _unquote_name(quoted_name):
+    """Reverses _quote_name"""
+
+    return re.sub(r"%([0-9A-F]{2})", lambda match: chr(int(match.group(1), 16)), quoted_name)
+
+
+# Returned by Checkers.capture_piece. squares holds the (row, column) of every captured piece and pieces holds the
+# name of the piece that was on each of those squares
+CaptureResult = namedtuple("CaptureResult", ["squares", "pieces"])
+
+# Returned by Checkers.get_mobility. jumps and steps count the moves a color could make if it were up
+Mobility = namedtuple("Mobility", ["jumps", "steps"])
+
+# Published to the event stream set with set_event_stream after every move played through play_game or play_move.
+# start and end are (row, column) tuples, piece is the moved piece's name after any promotion, promotion is 0, or 1 if
+# it became a king, or 2 if it became a triple king, captured_squares and captured_pieces list the pieces jumped,
+# turn is the player who is up next and position is the get_position tuple after the move
+MoveEvent = namedtuple("MoveEvent", ["player", "color", "start", "end", "piece", "promotion", "captured_squares",
+                                     "captured_pieces", "turn", "jump_just_occurred", "position"])
+
+# Checkers.to_bytes layout, little endian: a version byte, the six bitboards, a flags byte (1 if Black is up, 2 if a
+# jump just occurred) and the number of players. Then for each player in creation order: color index, king count,
+# triple king count, total captured count and name length, followed by the UTF-8 name.
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<B6IBB")
+SNAPSHOT_PLAYER = struct.Struct("<BhhhB")
+
+# Rank letters used by Checkers.to_notation in front of a square number
+NOTATION_RANKS = ("", "K", "T")
 
 
 class OutofTurn(Exception):
@@ -28,6 +162,9 @@ class Player:
     and captured piece count.
     """
 
+    __slots__ = ("_player_name", "_checker_color", "_kings", "_triple_kings", "_captured_pieces",
+                 "_total_captured_pieces")
+
     def __init__(self, player_name, checker_color):
         self._player_name = player_name
         self._checker_color = checker_color
@@ -90,10 +227,13 @@ class Player:
 
         return self._total_captured_pieces
 
-    def set_total_captured_pieces(self):
-        """Increments the total number of opponent pieces captured"""
+    def set_total_captured_pieces(self, num_captured=1):
+        """
+        Increments the total number of opponent pieces captured
+        num_captured is negative when captures are taken back
+        """
 
-        self._total_captured_pieces += 1
+        self._total_captured_pieces += num_captured
 
 
 class Checkers:
@@ -107,31 +247,121 @@ class Checkers:
     which player's turn it is, update the board, capture a piece on the board, and get the winner(if there is one)
     """
 
+    # fixed attributes instead of a per-game __dict__, so idle games take as little memory as possible
+    __slots__ = ("_bitboards", "_squares", "_piece_counts", "_moves", "_which_players_turn", "_players",
+                 "_players_by_color", "_jump_just_occurred", "_undo_stack", "_metrics", "_events", "_hash")
+
     def __init__(self):
-        # W=white, B=Black, empty=no checker piece in that square
-        self._board = [
-             ["__", "White", "__", "White", "__", "White", "__", "White"],
-             ["White", "__", "White", "__", "White", "__", "White", "__"],
-             ["__", "White", "__", "White", "__", "White", "__", "White"],
-             ["__", "__", "__", "__", "__", "__", "__", "__"],
-             ["__", "__", "__", "__", "__", "__", "__", "__"],
-             ["Black", "__", "Black", "__", "Black", "__", "Black", "__"],
-             ["__", "Black", "__", "Black", "__", "Black", "__", "Black"],
-             ["Black", "__", "Black", "__", "Black", "__", "Black", "__"]]
+        # one integer bitboard per piece code, bit n is set when dark square n holds that piece
+        # White fills the first three rows and Black the last three
+        self._bitboards = list(START_BITBOARDS)
+        # piece code (or EMPTY_CODE) on each dark square, one byte per square, mirrors the bitboards so single square
+        # lookups skip the bit scan
+        self._squares = bytearray(START_SQUARES)
+        # number of pieces on the board per piece code, kept up to date with the bitboards
+        self._piece_counts = list(START_PIECE_COUNTS)
+        self._moves = None      # move list per color index, built when first asked for and dropped when a piece moves
         self._which_players_turn = "Black"      # Black plays first every game
         self._players = {}  # key=player object, value=list with player name and checker color
+        self._players_by_color = [None, None]       # player object per color index, None until that color is taken
         self._jump_just_occurred = False        # keeps track of whether a jump just occurred to allow subsequent capture jumps by player that is not up
+        self._undo_stack = []       # one record per make_move call, popped by unmake_move
+        self._metrics = None        # CheckersMetrics.MoveMetrics set with set_metrics, None when not measuring
+        self._events = None     # CheckersEvents.EventStream set with set_event_stream, None when nobody is watching
+        self._hash = START_HASH     # Zobrist hash, kept up to date as pieces, turn and jump flag change
+
+    @property
+    def _board(self):
+        """String grid view of the bitboards, kept for code written against the original list of lists"""
+
+        return self.get_board()
 
     def create_player(self, player_name, piece_color):
         """
         Creates and returns a Player object. Adds player object as key in player dictionary, player_name and piece_color
         are the values.
+        Raises InvalidPlayer if player_name is already taken, or if piece_color is not "White" or "Black" or already taken
+        Prints what was wrong before raising
         """
 
+        try:
+            return self.add_player(player_name, piece_color)
+        except InvalidPlayer as error:
+            print(error)
+            raise
+
+    def add_player(self, player_name, piece_color):
+        """Same as create_player but never prints. The exceptions carry the message create_player prints."""
+
+        if self.get_player(player_name) is not None:
+            raise InvalidPlayer("That name is already taken.")
+        if piece_color not in COLOR_INDEX or self._players_by_color[COLOR_INDEX[piece_color]] is not None:
+            raise InvalidPlayer("That checker color is not available.")
+
         player = Player(player_name, piece_color)
         self._players[player] = [player_name, piece_color]
+        self._players_by_color[COLOR_INDEX[piece_color]] = player
         return player
 
+    def get_player(self, player_name):
+        """Returns the Player object named player_name, or None if there is no such player"""
+
+        for player in self._players_by_color:
+            if player is not None and player._player_name == player_name:
+                return player
+        return None
+
+    def get_player_by_color(self, checker_color):
+        """Returns the Player object playing checker_color, or None if nobody has that color yet"""
+
+        color_index = COLOR_INDEX.get(checker_color)
+        return self._players_by_color[color_index] if color_index is not None else None
+
+    def get_metrics(self):
+        """Returns the metrics play_move records into, or None if moves aren't being measured"""
+
+        return self._metrics
+
+    def set_metrics(self, metrics):
+        """
+        Starts recording phase timings and counters for every move into metrics, a CheckersMetrics.MoveMetrics.
+        Pass None to stop. Moves aren't timed at all while no metrics are set.
+        """
+
+        self._metrics = metrics
+
+    def get_event_stream(self):
+        """Returns the event stream moves are published to, or None if they aren't published"""
+
+        return self._events
+
+    def set_event_stream(self, event_stream):
+        """
+        Publishes a MoveEvent for every move played through play_game or play_move to event_stream, a
+        CheckersEvents.EventStream or any object with a publish(event, source) method. source is this game.
+        Pass None to stop.
+        """
+
+        self._events = event_stream
+
+    def get_hash(self):
+        """Returns the 64 bit Zobrist hash of the board, the player who is up and jump_just_occurred"""
+
+        return self._hash
+
+    def compute_hash(self):
+        """Computes the Zobrist hash from scratch. get_hash returns the same number without the work"""
+
+        position_hash = 0
+        for square_index, code in enumerate(self._squares):
+            if code != EMPTY_CODE:
+                position_hash ^= ZOBRIST_PIECES[code][square_index]
+        if self._which_players_turn == "Black":
+            position_hash ^= ZOBRIST_BLACK_TURN
+        if self._jump_just_occurred:
+            position_hash ^= ZOBRIST_JUMP
+        return position_hash
+
     def get_jump_just_occurred(self):
         """Returns the value in jump_just_occurred. Will be True or False"""
 
@@ -140,6 +370,8 @@ class Checkers:
     def set_jump_just_occurred(self, true_false):
         """Sets jump_just_occurred to either True or False"""
 
+        if true_false != self._jump_just_occurred:
+            self._hash ^= ZOBRIST_JUMP
         self._jump_just_occurred = true_false
 
     def get_checker_details(self, square_location):
@@ -154,22 +386,265 @@ class Checkers:
         elif column > 7 or column < 0:
             raise InvalidSquare
 
-        location = self._board[row][column]
+        if (row + column) % 2 == 0:     # light squares never hold a checker
+            return None
 
-        if location == "__":
+        code = self._squares[row * 4 + column // 2]
+        if code == EMPTY_CODE:
             return None
         else:
-            return location
+            return PIECE_NAMES[code]
+
+    def get_position(self):
+        """
+        Returns the position as a tuple of 8 integers: the six piece bitboards in piece code order, the index of the
+        player who is up in COLORS, and 1 if a jump just occurred or 0 if not.
+        Player objects and their counts are not included.
+        """
+
+        return tuple(self._bitboards) + (COLOR_INDEX[self._which_players_turn], int(self._jump_just_occurred))
+
+    def set_position(self, position):
+        """
+        Replaces the board, the player who is up and jump_just_occurred with position, a tuple from get_position.
+        Player counts are left alone and the make_move undo records are dropped.
+        Raises ValueError, leaving the game unchanged, if two pieces share a square, a bitboard has bits past the 32
+        dark squares, or the turn or jump flag isn't 0 or 1.
+        """
+
+        if len(position) != 8 or position[6] not in (0, 1) or position[7] not in (0, 1):
+            raise ValueError("Not a Checkers position")
+        occupied = 0
+        for bitboard in position[:6]:
+            if bitboard < 0 or bitboard >> len(SQUARE_LOCATIONS):
+                raise ValueError("Piece off the board")
+            if bitboard & occupied:
+                raise ValueError("Two pieces on the same square")
+            occupied |= bitboard
+
+        self._bitboards = list(position[:6])
+        squares = bytearray((EMPTY_CODE,)) * len(SQUARE_LOCATIONS)
+        piece_counts = [0] * len(PIECE_NAMES)
+        position_hash = ZOBRIST_BLACK_TURN if position[6] else 0
+        if position[7]:
+            position_hash ^= ZOBRIST_JUMP
+        for code, bitboard in enumerate(self._bitboards):
+            keys = ZOBRIST_PIECES[code]
+            while bitboard:
+                low_bit = bitboard & -bitboard
+                square_index = low_bit.bit_length() - 1
+                squares[square_index] = code
+                position_hash ^= keys[square_index]
+                piece_counts[code] += 1
+                bitboard ^= low_bit
+        self._squares = squares
+        self._piece_counts = piece_counts
+        self._moves = None
+        self._which_players_turn = COLORS[position[6]]
+        self._jump_just_occurred = bool(position[7])
+        self._undo_stack = []
+        self._hash = position_hash
+
+    def to_bytes(self):
+        """
+        Returns the full state of the game as bytes in the SNAPSHOT_HEADER layout: the position, the player who is up,
+        jump_just_occurred and every player with their counts. from_bytes turns them back into a game. Raises
+        ValueError if a player's name is longer than 255 bytes in UTF-8, as CheckersRecord.pack_game does.
+        """
+
+        flags = (self._which_players_turn == "Black") | self._jump_just_occurred << 1
+        snapshot = [SNAPSHOT_HEADER.pack(SNAPSHOT_VERSION, *self._bitboards, flags, len(self._players))]
+        for player, (player_name, piece_color) in self._players.items():
+            encoded_name = player_name.encode("utf-8")
+            if len(encoded_name) > 255:
+                raise ValueError("Player names are limited to 255 bytes")
+            snapshot.append(SNAPSHOT_PLAYER.pack(COLOR_INDEX[piece_color], player._kings, player._triple_kings,
+                                                 player._total_captured_pieces, len(encoded_name)))
+            snapshot.append(encoded_name)
+        return b"".join(snapshot)
+
+    @classmethod
+    def from_bytes(cls, snapshot):
+        """Returns a new Checkers game restored from snapshot, bytes from to_bytes. Raises ValueError if it is not one."""
+
+        try:
+            version, *fields = SNAPSHOT_HEADER.unpack_from(snapshot)
+            if version != SNAPSHOT_VERSION:
+                raise ValueError("Unknown snapshot version")
+            if fields[6] >> 2:
+                raise ValueError("Unknown snapshot flags")
+            game = cls()
+            game.set_position(fields[:6] + [fields[6] & 1, fields[6] >> 1 & 1])
+            offset = SNAPSHOT_HEADER.size
+            for _ in range(fields[7]):
+                color_index, kings, triple_kings, total_captured, name_length = SNAPSHOT_PLAYER.unpack_from(snapshot,
+                                                                                                            offset)
+                offset += SNAPSHOT_PLAYER.size
+                player = game.add_player(bytes(snapshot[offset:offset + name_length]).decode("utf-8"),
+                                         COLORS[color_index])
+                offset += name_length
+                player._kings = kings
+                player._triple_kings = triple_kings
+                player._total_captured_pieces = total_captured
+        except (struct.error, IndexError, UnicodeDecodeError, InvalidPlayer) as error:
+            raise ValueError("Not a Checkers snapshot") from error
+        return game
+
+    def to_notation(self):
+        """
+        Returns the full state of the game as one line of text, in the style of checkers FEN:
+        turn:White pieces:Black pieces, then a field per player. The turn is W or B, followed by * if a jump just
+        occurred. Pieces are square numbers 1-32 (SQUARE_LOCATIONS order plus one), with K in front of kings and T in
+        front of triple kings. A player field is their color letter, name, king, triple king and captured counts
+        separated by /, with the name percent encoded. For example "B:W1,2,K7:B30,T32:WSam/1/0/9:BFaris/0/1/11".
+        """
+
+        fields = [self._which_players_turn[0] + ("*" if self._jump_just_occurred else "")]
+        for color_index in range(len(COLORS)):
+            pieces = []
+            for square_index, code in enumerate(self._squares):
+                if code // 3 == color_index:        # EMPTY_CODE // 3 is neither color
+                    pieces.append(f"{NOTATION_RANKS[code % 3]}{square_index + 1}")
+            fields.append(COLORS[color_index][0] + ",".join(pieces))
+        for player, (player_name, piece_color) in self._players.items():
+            fields.append(f"{piece_color[0]}{_quote_name(player_name)}/{player._kings}/{player._triple_kings}/"
+                          f"{player._total_captured_pieces}")
+        return ":".join(fields)
+
+    @classmethod
+    def from_notation(cls, notation):
+        """Returns a new Checkers game restored from notation, text from to_notation. Raises ValueError if it is not one."""
+
+        fields = notation.strip().split(":")
+        if len(fields) < 3 or fields[0] not in ("W", "B", "W*", "B*") or fields[1][:1] != "W" or fields[2][:1] != "B":
+            raise ValueError("Not Checkers notation")
+        bitboards = [0] * len(PIECE_NAMES)
+        for color_index, pieces in enumerate((fields[1][1:], fields[2][1:])):
+            for piece in filter(None, pieces.split(",")):
+                rank = NOTATION_RANKS.index(piece[0]) if piece[0] in "KT" else 0
+                square_number = int(piece[1:] if rank else piece)
+                if not 1 <= square_number <= len(SQUARE_LOCATIONS):
+                    raise ValueError(f"No square {square_number}")
+                if any(bitboard >> square_number - 1 & 1 for bitboard in bitboards):
+                    raise ValueError(f"Two pieces on square {square_number}")
+                bitboards[color_index * 3 + rank] |= 1 << square_number - 1
+        game = cls()
+        game.set_position(bitboards + [int(fields[0][0] == "B"), int(fields[0].endswith("*"))])
+        for field in fields[3:]:
+            name, kings, triple_kings, total_captured = field[1:].split("/")
+            try:
+                player = game.add_player(_unquote_name(name), {"W": "White", "B": "Black"}.get(field[:1]))
+            except InvalidPlayer as error:
+                raise ValueError(f"Bad player {field}") from error
+            player._kings = int(kings)
+            player._triple_kings = int(triple_kings)
+            player._total_captured_pieces = int(total_captured)
+        return game
+
+    def get_board(self):
+        """Returns the board as a list of 8 row lists holding piece names, with "__" for empty squares"""
+
+        board = [[EMPTY_SQUARE] * 8 for _ in range(8)]
+        for code, bitboard in enumerate(self._bitboards):
+            name = PIECE_NAMES[code]
+            while bitboard:
+                low_bit = bitboard & -bitboard
+                row, column = SQUARE_LOCATIONS[low_bit.bit_length() - 1]
+                board[row][column] = name
+                bitboard ^= low_bit
+        return board
+
+    def _piece_at(self, square_index):
+        """Returns the piece code on square_index (0-31), or None if the square is empty"""
+
+        code = self._squares[square_index]
+        return None if code == EMPTY_CODE else code
+
+    def _place_piece(self, code, square_index):
+        """Puts the piece with code on the empty square square_index"""
+
+        self._bitboards[code] |= 1 << square_index
+        self._squares[square_index] = code
+        self._piece_counts[code] += 1
+        self._moves = None
+        self._hash ^= ZOBRIST_PIECES[code][square_index]
+
+    def _remove_piece(self, code, square_index):
+        """Takes the piece with code off square_index"""
+
+        self._bitboards[code] &= ~(1 << square_index)
+        self._squares[square_index] = EMPTY_CODE
+        self._piece_counts[code] -= 1
+        self._moves = None
+        self._hash ^= ZOBRIST_PIECES[code][square_index]
+
+    def get_piece_counts(self, color):
+        """Returns (men, kings, triple kings) that color ("White" or "Black") has on the board"""
+
+        base = COLOR_INDEX[color] * 3
+        return tuple(self._piece_counts[base:base + 3])
+
+    def get_mobility(self, color):
+        """
+        Returns the Mobility of color ("White" or "Black"): how many jumps and steps it could make if it were up.
+        Worked out the first time it is asked for after a piece moves.
+        """
+
+        moves = self._all_moves(COLOR_INDEX[color])
+        jumps = 0
+        for starting_square_location, destination_square_location in moves:
+            if abs(destination_square_location[1] - starting_square_location[1]) > 1:
+                jumps += 1
+            else:       # steps come after every jump
+                break
+        return Mobility(jumps, len(moves) - jumps)
+
+    def _all_moves(self, color_index):
+        """Returns the move list of color_index as if it were up, from the cache when no piece has moved since"""
+
+        moves = self._moves
+        if moves is None:
+            moves = self._moves = [None, None]
+        if moves[color_index] is None:
+            moves[color_index] = self._generate_moves(color_index, False)
+        return moves[color_index]
+
+    def _has_moves(self, color_index):
+        """
+        Returns True if color_index would have a move if it were up. Looks for one piece with an empty square next to
+        it before falling back to the move list, so it rarely has to build one.
+        """
+
+        moves = self._moves
+        if moves is not None and moves[color_index] is not None:
+            return bool(moves[color_index])
+        bitboards = self._bitboards
+        base = color_index * 3
+        empty = ~(bitboards[0] | bitboards[1] | bitboards[2] | bitboards[3] | bitboards[4] | bitboards[5])
+        man_steps = MAN_STEPS[color_index]
+        pieces = bitboards[base]
+        while pieces:
+            low_bit = pieces & -pieces
+            if man_steps[low_bit.bit_length() - 1] & empty:
+                return True
+            pieces ^= low_bit
+        pieces = bitboards[base + 1] | bitboards[base + 2]
+        while pieces:
+            low_bit = pieces & -pieces
+            if KING_STEPS[low_bit.bit_length() - 1] & empty:
+                return True
+            pieces ^= low_bit
+        return bool(self._all_moves(color_index))      # every piece is blocked in, so only a jump could be left
 
     def print_board(self):
         """Prints the current board"""
 
-        print(self._board)
+        print(self.get_board())
 
     def pretty_print_board(self):
         """Prints board list by list for more of grid visual"""
 
-        for line in self._board:
+        for line in self.get_board():
             print(f"{line} \n")
 
     def set_which_players_turn(self):
@@ -179,6 +654,7 @@ class Checkers:
             self._which_players_turn = "White"
         else:
             self._which_players_turn = "Black"
+        self._hash ^= ZOBRIST_BLACK_TURN
 
     def get_which_players_turn(self):
         """Returns which player is up to play"""
@@ -188,234 +664,314 @@ class Checkers:
     def update_board(self, starting_square_location, destination_square_location, checker_piece_type):
         """Places the checker_piece_type at the destination_square_location"""
 
-        end_row, end_column = destination_square_location
-        start_row, start_column = starting_square_location
+        squares = self._squares
+        end_index = SQUARE_INDEX[destination_square_location]
+        start_index = SQUARE_INDEX[starting_square_location]
 
-        self._board[end_row][end_column] = checker_piece_type
-        self._board[start_row][start_column] = "__"
+        if squares[end_index] != EMPTY_CODE:
+            self._remove_piece(squares[end_index], end_index)
+        self._place_piece(PIECE_CODES[checker_piece_type], end_index)
+        if squares[start_index] != EMPTY_CODE:
+            self._remove_piece(squares[start_index], start_index)
 
-    def jump_procedure(self, starting_square_location, destination_square_location, current_checker, player_object):
+    def capture_piece(self, starting_square_location, destination_square_location, player_object):
         """
-        Various method calls when a jump has occurred
-        starting_square_location and destination_square_location must be tuples (row, column)
-        Updates board, captures piece(s), sets jump_just_occurred to True, switches the player's turn
+        Updates player_object's captured pieces count, and total captured pieces count.
+        If opponent had king or triple king captured, those counts are updated.
+        Clears the space of any captured piece
+        Returns a CaptureResult listing the squares cleared and the pieces removed from them
         """
 
-        self.update_board(starting_square_location, destination_square_location, current_checker)
-        self.capture_piece(starting_square_location, destination_square_location, player_object)
-        self.set_jump_just_occurred(True)
-        self.set_which_players_turn()
+        color_index = COLOR_INDEX[player_object.get_checker_color()]
+        captured = self._remove_captured(SQUARE_INDEX[tuple(starting_square_location)],
+                                         SQUARE_INDEX[tuple(destination_square_location)], color_index)
+        if not captured:
+            return CaptureResult((), ())
+
+        opposing_player_object = self._players_by_color[1 - color_index]
+        cleared_squares = []
+        removed_pieces = []
+
+        for square_index, code in captured:
+            rank = code % 3
+            if opposing_player_object is not None:
+                if rank == 1:       # capture a king
+                    opposing_player_object.set_king_count(-1)
+                elif rank == 2:     # capture a triple king
+                    opposing_player_object.set_triple_king_count(-1)
+            player_object.set_captured_pieces_count("increment")
+            player_object.set_total_captured_pieces()
+            cleared_squares.append(SQUARE_LOCATIONS[square_index])
+            removed_pieces.append(PIECE_NAMES[code])
+
+        return CaptureResult(tuple(cleared_squares), tuple(removed_pieces))
+
+    def _remove_captured(self, start_index, end_index, color_index):
+        """
+        Clears every piece not belonging to color_index from the squares between start_index and end_index (0-31).
+        Returns a list of (square_index, piece code) for the pieces removed.
+        """
+
+        start_row, start_column = SQUARE_LOCATIONS[start_index]
+        end_row, end_column = SQUARE_LOCATIONS[end_index]
+
+        distance = abs(end_column - start_column)
+        if distance < 2:        # nothing lies between the two squares
+            return []
+
+        # check each square in between start and finish in diagonal for opponent piece capture
+        direction = (2 if end_row > start_row else 0) + (1 if end_column > start_column else 0)
+        ray = RAYS[start_index][direction]
+        if len(ray) < distance - 1:     # the diagonal runs off the board before reaching the destination
+            raise InvalidSquare
 
-    def non_jump_procedure(self, starting_square_location, destination_square_location, current_checker):
+        bitboards = self._bitboards
+        squares = self._squares
+        piece_counts = self._piece_counts
+        position_hash = self._hash
+        captured = []
+        for square_index in ray[:distance - 1]:
+            code = squares[square_index]
+            if code != EMPTY_CODE and code // 3 != color_index:      # found an opponent piece
+                # clear the captured piece space, as _remove_piece does
+                bitboards[code] &= ~(1 << square_index)
+                squares[square_index] = EMPTY_CODE
+                piece_counts[code] -= 1
+                position_hash ^= ZOBRIST_PIECES[code][square_index]
+                captured.append((square_index, code))
+        self._hash = position_hash
+        self._moves = None
+        return captured
+
+    def make_move(self, move):
         """
-        Various method calls when no jump is being made
-        starting_square_location and destination_square_location must be tuples (row, column)
-        Updates board, sets jump_just_occurred to False, switches the player's turn
+        Plays move, a (starting_square_location, destination_square_location) tuple from legal_moves, without the checks
+        play_game makes. Board, turn, jump_just_occurred and player counts change exactly as they would in play_game.
+        Pushes an undo record so unmake_move can take the move back. Returns the number of pieces captured.
         """
 
-        self.update_board(starting_square_location, destination_square_location, current_checker)
-        self.set_jump_just_occurred(False)
-        self.set_which_players_turn()
+        start_index = SQUARE_INDEX[move[0]]
+        end_index = SQUARE_INDEX[move[1]]
+        turn = self._which_players_turn
+        jump_just_occurred = self._jump_just_occurred
+        code = self._squares[start_index]
+        new_code, captured = self._apply_move(start_index, end_index, code)
+        self._undo_stack.append((start_index, end_index, code, new_code, captured, turn, jump_just_occurred))
+        return len(captured)
 
-    def capture_piece(self, starting_square_location, destination_square_location, player_object):
+    def _apply_move(self, start_index, end_index, code, marks=None):
         """
-        Updates player_object's captured pieces count, and total captured pieces count.
-        If opponent had king or triple king captured, those counts are updated.
-        Clears the space of any captured piece
+        Moves the piece with code from square start_index to end_index (0-31) for play_move and make_move, with no
+        checks: promotes it, replaces whatever is on the destination, removes the opponent pieces it jumps, adds the
+        promotion and captures to the players' counts, and passes the turn to the other player.
+        If marks is a list, the time.perf_counter() reading after the promotion, the board update and the capture is
+        appended to it, so _play_measured_move can time each phase.
+        Returns (piece code after any promotion, list of (square_index, piece code) captured).
         """
 
-        end_row, end_column = destination_square_location
-        start_row, start_column = starting_square_location
+        color_index = code // 3
+        end_row, end_column = SQUARE_LOCATIONS[end_index]
+        player_object = self._players_by_color[color_index]
+
+        new_code = code
+        rank = code - color_index * 3
+        if rank == 0:
+            if end_row == 0 or end_row == 7:    # King the piece!
+                new_code += 1
+                if player_object is not None:
+                    player_object._kings += 1
+        elif rank == 1 and end_row == (0 if color_index == 0 else 7):      # Triple king the piece!
+            new_code += 1
+            if player_object is not None:
+                player_object._triple_kings += 1
+        if marks is not None:
+            marks.append(time.perf_counter())
+
+        # written out rather than through _place_piece and _remove_piece since every move comes through here. The
+        # starting square is emptied last, as in update_board
+        bitboards = self._bitboards
+        squares = self._squares
+        piece_counts = self._piece_counts
+        position_hash = self._hash
+        replaced = squares[end_index]
+        if replaced != EMPTY_CODE:
+            bitboards[replaced] &= ~(1 << end_index)
+            piece_counts[replaced] -= 1
+            position_hash ^= ZOBRIST_PIECES[replaced][end_index]
+        bitboards[new_code] |= 1 << end_index
+        squares[end_index] = new_code
+        piece_counts[new_code] += 1
+        position_hash ^= ZOBRIST_PIECES[new_code][end_index]
+        moved = squares[start_index]
+        if moved != EMPTY_CODE:
+            bitboards[moved] &= ~(1 << start_index)
+            squares[start_index] = EMPTY_CODE
+            piece_counts[moved] -= 1
+            position_hash ^= ZOBRIST_PIECES[moved][start_index]
+        self._hash = position_hash
+        if marks is not None:
+            marks.append(time.perf_counter())
+
+        jump = abs(end_column - SQUARE_LOCATIONS[start_index][1]) != 1
+        captured = []
+        if jump:
+            captured = self._remove_captured(start_index, end_index, color_index)
+            if captured:
+                self._count_captures(captured, color_index, 1)
+        if marks is not None:
+            marks.append(time.perf_counter())
+
+        # after a move it is always the other player's turn, subsequent jumps included
+        if self._which_players_turn == COLORS[color_index]:
+            self._which_players_turn = COLORS[1 - color_index]
+            self._hash ^= ZOBRIST_BLACK_TURN
+        if jump != self._jump_just_occurred:
+            self._jump_just_occurred = jump
+            self._hash ^= ZOBRIST_JUMP
+        self._moves = None
+        return new_code, captured
+
+    def unmake_move(self):
+        """Takes back the last move played with make_move, restoring the board, turn, jump_just_occurred and counts"""
+
+        start_index, end_index, code, new_code, captured, turn, jump_just_occurred = self._undo_stack.pop()
+        color_index = code // 3
+
+        self._remove_piece(new_code, end_index)
+        self._place_piece(code, start_index)
+        if new_code != code:        # undo the promotion
+            player_object = self._players_by_color[color_index]
+            if player_object is not None:
+                if new_code - color_index * 3 == 1:
+                    player_object.set_king_count(-1)
+                else:
+                    player_object.set_triple_king_count(-1)
+
+        if captured:
+            for square_index, captured_code in captured:
+                self._place_piece(captured_code, square_index)
+            self._count_captures(captured, color_index, -1)
+
+        if turn != self._which_players_turn:
+            self._which_players_turn = turn
+            self._hash ^= ZOBRIST_BLACK_TURN
+        if jump_just_occurred != self._jump_just_occurred:
+            self._jump_just_occurred = jump_just_occurred
+            self._hash ^= ZOBRIST_JUMP
+
+    def _count_captures(self, captured, color_index, sign):
+        """
+        Applies the player count changes for pieces captured by color_index, a list of (square_index, piece code).
+        sign is 1 when the capture is made and -1 when it is taken back.
+        """
+
+        player_object = self._players_by_color[color_index]
+        if player_object is not None:
+            player_object.set_total_captured_pieces(sign * len(captured))
+        opposing_player_object = self._players_by_color[1 - color_index]
+        if opposing_player_object is not None:
+            for square_index, code in captured:
+                rank = code % 3
+                if rank == 1:
+                    opposing_player_object.set_king_count(-sign)
+                elif rank == 2:
+                    opposing_player_object.set_triple_king_count(-sign)
+
+    def legal_moves(self, color):
+        """
+        Returns a list of (starting_square_location, destination_square_location) tuples that color ("White" or
+        "Black") can pass to play_game. Jumps come first, then single square steps.
+        When it is not color's turn, the only moves are the capturing jumps allowed right after color jumped.
+        """
+
+        if color == self._which_players_turn:
+            return list(self._all_moves(COLOR_INDEX[color]))
+        elif self._jump_just_occurred:      # subsequent jump by the player that just jumped
+            return self._generate_moves(COLOR_INDEX[color], True)
+        return []
 
-        white = ["White", "White_king", "White_Triple_King"]
-        black = ["Black", "Black_king", "Black_Triple_King"]
-
-        if player_object.get_checker_color() == "White":  # White checker is moving
-            # check each square in between start and finish in diagonal for opponent piece capture
-            if start_column - end_column < 0:   # moved right
-                if start_row - end_row < 0:     # moved down
-                    num = 1
-                    while num < end_column - start_column:
-                        current_square = (start_row + num, start_column + num)
-                        if self.get_checker_details(current_square) in black:  # we found an opponent piece
-                            if self.get_checker_details(current_square) == "Black_king":   # capture a king
-                                # reduce king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "Black":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_king_count(-1)
-                            elif self.get_checker_details(current_square) == "Black_Triple_King":  # capture a triple king
-                                # reduce triple king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "Black":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_triple_king_count(-1)
-                            self._board[start_row + num][start_column + num] = "__"  # clear the captured piece space
-                            player_object.set_captured_pieces_count("increment")
-                            player_object.set_total_captured_pieces()
-                        num += 1
-                else:   # moved up
-                    num = 1
-                    while num < end_column - start_column:
-                        current_square = (start_row - num, start_column + num)
-                        if self.get_checker_details(current_square) in black:
-                            if self.get_checker_details(current_square) == "Black_king":   # capture a king
-                                # reduce king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "Black":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_king_count(-1)
-                            elif self.get_checker_details(current_square) == "Black_Triple_King":  # capture a triple king
-                                # reduce triple king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "Black":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_triple_king_count(-1)
-                            self._board[start_row - num][start_column + num] = "__"  # clear the captured piece space
-                            player_object.set_captured_pieces_count("increment")
-                            player_object.set_total_captured_pieces()
-                        num += 1
-            else:   # moved left
-                if start_row - end_row < 0:  # moved down
-                    num = 1
-                    while num < start_column - end_column:
-                        current_square = (start_row + num, start_column - num)
-                        if self.get_checker_details(current_square) in black:
-                            if self.get_checker_details(current_square) == "Black_king":   # capture a king
-                                # reduce king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "Black":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_king_count(-1)
-                            elif self.get_checker_details(current_square) == "Black_Triple_King":  # capture a triple king
-                                # reduce triple king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "Black":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_triple_king_count(-1)
-                            self._board[start_row + num][start_column - num] = "__"  # clear the captured piece space
-                            player_object.set_captured_pieces_count("increment")
-                            player_object.set_total_captured_pieces()
-                        num += 1
-                else:       # moved up
-                    num = 1
-                    while num < start_column - end_column:
-                        current_square = (start_row - num, start_column - num)
-                        if self.get_checker_details(current_square) in black:
-                            if self.get_checker_details(current_square) == "Black_king":   # capture a king
-                                # reduce king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "Black":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_king_count(-1)
-                            elif self.get_checker_details(current_square) == "Black_Triple_King":  # capture a triple king
-                                # reduce triple king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "Black":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_triple_king_count(-1)
-                            self._board[start_row - num][start_column - num] = "__"  # clear the captured piece space
-                            player_object.set_captured_pieces_count("increment")
-                            player_object.set_total_captured_pieces()
-                        num += 1
-
-        else:       # Black checker is moving
-            # check each square in between start and finish in diagonal for opponent piece
-            if start_column - end_column < 0:  # moved right
-                if start_row - end_row < 0:  # moved down
-                    num = 1
-                    while num < end_column - start_column:
-                        current_square = (start_row + num, start_column + num)
-                        if self.get_checker_details(current_square) in white:
-                            if self.get_checker_details(current_square) == "White_king":   # capture a king
-                                # reduce king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "White":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_king_count(-1)
-                            elif self.get_checker_details(current_square) == "White_Triple_King":  # capture a triple king
-                                # reduce triple king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "White":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_triple_king_count(-1)
-                            self._board[start_row + num][start_column + num] = "__"  # clear the captured piece space
-                            player_object.set_captured_pieces_count("increment")
-                            player_object.set_total_captured_pieces()
-                        num += 1
-                else:  # moved up
-                    num = 1
-                    while num < end_column - start_column:
-                        current_square = (start_row - num, start_column + num)
-                        if self.get_checker_details(current_square) in white:
-                            if self.get_checker_details(current_square) == "White_king":   # capture a king
-                                # reduce king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "White":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_king_count(-1)
-                            elif self.get_checker_details(current_square) == "White_Triple_King":  # capture a triple king
-                                # reduce triple king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "White":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_triple_king_count(-1)
-                            self._board[start_row - num][start_column + num] = "__"  # clear the captured piece space
-                            player_object.set_captured_pieces_count("increment")
-                            player_object.set_total_captured_pieces()
-                        num += 1
-            else:  # moved left
-                if start_row - end_row < 0:  # moved down
-                    num = 1
-                    while num < start_column - end_column:
-                        current_square = (start_row + num, start_column - num)
-                        if self.get_checker_details(current_square) in white:
-                            if self.get_checker_details(current_square) == "White_king":   # capture a king
-                                # reduce king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "White":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_king_count(-1)
-                            elif self.get_checker_details(current_square) == "White_Triple_King":  # capture a triple king
-                                # reduce triple king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "White":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_triple_king_count(-1)
-                            self._board[start_row + num][start_column - num] = "__"  # clear the captured piece space
-                            player_object.set_captured_pieces_count("increment")
-                            player_object.set_total_captured_pieces()
-                        num += 1
-                else:  # moved up
-                    num = 1
-                    while num < start_column - end_column:
-                        current_square = (start_row - num, start_column - num)
-                        if self.get_checker_details(current_square) in white:
-                            if self.get_checker_details(current_square) == "White_king":   # capture a king
-                                # reduce king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "White":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_king_count(-1)
-                            elif self.get_checker_details(current_square) == "White_Triple_King":  # capture a triple king
-                                # reduce triple king count of opponent
-                                for player_obj in self._players:
-                                    if self._players[player_obj][1] == "White":
-                                        opposing_player_object = player_obj
-                                opposing_player_object.set_triple_king_count(-1)
-                            self._board[start_row - num][start_column - num] = "__"  # clear the captured piece space
-                            player_object.set_captured_pieces_count("increment")
-                            player_object.set_total_captured_pieces()
-                        num += 1
+    def _generate_moves(self, color_index, captures_only):
+        """
+        Builds the move list for legal_moves from the RAYS table.
+        Men step one square forward or jump an adjacent opponent piece forward. Kings step one square in any direction
+        or jump a single opponent piece anywhere along a diagonal, landing on any empty square past it. Triple kings
+        move like kings but may also jump their own pieces and up to two opponent pieces that sit next to each other.
+        If captures_only is True, steps and jumps that capture nothing are left out.
+        """
+
+        bitboards = self._bitboards
+        base = color_index * 3
+        enemy_base = 3 - base
+        own = bitboards[base] | bitboards[base + 1] | bitboards[base + 2]
+        enemy = bitboards[enemy_base] | bitboards[enemy_base + 1] | bitboards[enemy_base + 2]
+        occupied = own | enemy
+        jumps = []
+        steps = []
+
+        for square_index, code in enumerate(self._squares):
+            if code // 3 != color_index:        # empty squares hold EMPTY_CODE, which is neither color
+                continue
+            start = SQUARE_LOCATIONS[square_index]
+            rays = RAYS[square_index]
+            rank = code - base
+
+            if rank == 0:       # regular checker
+                for direction in FORWARD_DIRECTIONS[color_index]:
+                    ray = rays[direction]
+                    if not ray:
+                        continue
+                    if not occupied >> ray[0] & 1:
+                        if not captures_only:
+                            steps.append((start, SQUARE_LOCATIONS[ray[0]]))
+                    elif enemy >> ray[0] & 1 and len(ray) > 1 and not occupied >> ray[1] & 1:
+                        jumps.append((start, SQUARE_LOCATIONS[ray[1]]))
+
+            elif rank == 1:     # king
+                for ray in rays:
+                    if not ray:
+                        continue
+                    if not captures_only and not occupied >> ray[0] & 1:
+                        steps.append((start, SQUARE_LOCATIONS[ray[0]]))
+                    captured = False
+                    for target in ray:
+                        if occupied >> target & 1:
+                            if captured or not enemy >> target & 1:     # second piece or a friendly piece ends the jump
+                                break
+                            captured = True
+                        elif captured:
+                            jumps.append((start, SQUARE_LOCATIONS[target]))
+
+            else:       # triple king
+                for ray in rays:
+                    if not ray:
+                        continue
+                    if not captures_only and not occupied >> ray[0] & 1:
+                        steps.append((start, SQUARE_LOCATIONS[ray[0]]))
+                    passed_piece = False
+                    enemies = 0
+                    previous_enemy = False
+                    for target in ray:
+                        if enemy >> target & 1:
+                            if enemies == 0 or (enemies == 1 and previous_enemy):
+                                enemies += 1
+                            else:       # a third opponent piece or a second group can't be jumped
+                                break
+                            passed_piece = True
+                            previous_enemy = True
+                        elif own >> target & 1:
+                            passed_piece = True
+                            previous_enemy = False
+                        else:
+                            previous_enemy = False
+                            if passed_piece and (enemies or not captures_only):
+                                jumps.append((start, SQUARE_LOCATIONS[target]))
+
+        return jumps + steps
 
     def is_player_valid(self, player_name):
         """Returns True or False for if a player is in the game"""
 
-        player_values = self._players.values()
-        for list_of_values in player_values:
-            if player_name in list_of_values:
-                return True
-        return False
+        return self.get_player(player_name) is not None
 
     def play_game(self, player_name, starting_square_location, destination_square_location):
         """
@@ -424,242 +980,214 @@ class Checkers:
         Checks if correct player is attempting a move but will override if jump just occurred and player is attempting subsequent jump
         Checks if starting_square_location contains a piece belonging to player
         Moves piece and updates board. If piece was king-ed or triple king-ed this is reflected in the updated board
+        Prints what was wrong before raising
         """
 
-        if not self.is_player_valid(player_name):       # name does not exist as a player name
-            print("You are not a player in this game.")
-            raise InvalidPlayer
+        try:
+            return self.play_move(player_name, starting_square_location, destination_square_location)
+        except (InvalidPlayer, OutofTurn, InvalidSquare) as error:
+            if error.args:      # squares off the board are raised without a message
+                print(error)
+            raise
 
-        for player_obj in self._players:
-            if self._players[player_obj][0] == player_name:
-                player_object = player_obj
+    def play_move(self, player_name, starting_square_location, destination_square_location):
+        """
+        Same as play_game but never prints. The exceptions carry the message play_game prints.
+        Returns the number of pieces captured.
+        """
 
-        start_row, start_column = starting_square_location
-        end_row, end_column = destination_square_location
+        if self._metrics is not None:
+            return self._play_measured_move(player_name, starting_square_location, destination_square_location)
+
+        player_object, code, start_index, end_index = self._validate_move(player_name, starting_square_location,
+                                                                          destination_square_location)
+        new_code, captured = self._apply_move(start_index, end_index, code)
+
+        pieces_captured = player_object._captured_pieces + len(captured)
+        player_object._captured_pieces = 0
+        if self._events is not None:
+            self._publish_move(player_object, start_index, end_index, code, new_code, captured)
+        return pieces_captured
 
-        checker_color = player_object.get_checker_color()
+    def _validate_move(self, player_name, starting_square_location, destination_square_location):
+        """
+        Checks a move for play_move and returns (player object, piece code on the starting square, starting square
+        index, destination square index). Changes nothing, so a rejected move leaves the game as it was; a subsequent
+        jump keeps the turn with the other player when _apply_move plays it.
+        """
+
+        for player_object in self._players_by_color:
+            if player_object is not None and player_object._player_name == player_name:
+                break
+        else:       # name does not exist as a player name
+            raise InvalidPlayer("You are not a player in this game.")
 
-        if checker_color != self.get_which_players_turn():  # If the wrong person is trying to take a turn
-            if self.get_jump_just_occurred() is True and abs(start_row - end_row) > 1:  # jump just occurred and player is attempting a subsequent jump
-                self.set_which_players_turn()
-            else:
-                print("It is not your turn.")
-                raise OutofTurn
+        start_row, start_column = starting_square_location
+        end_row, end_column = destination_square_location
+        checker_color = player_object._checker_color
 
-        current_checker = self.get_checker_details(starting_square_location)
+        if checker_color != self._which_players_turn:  # If the wrong person is trying to take a turn
+            # unless a jump just occurred and the player who made it is attempting a subsequent jump
+            if not (self._jump_just_occurred is True and abs(start_row - end_row) > 1):
+                raise OutofTurn("It is not your turn.")
 
-        if checker_color == "Black":   # if the player with black checkers is playing
-            options = ["Black", "Black_king", "Black_Triple_King"]
-            if current_checker not in options:  # This square is either empty or does not have a checker belonging to this player
-                print("You don't have a checker in this square.")
+        start_index = SQUARE_INDEX.get((start_row, start_column))
+        if start_index is None:
+            if not (0 <= start_row <= 7 and 0 <= start_column <= 7):
                 raise InvalidSquare
-        else:       # if the player with white checkers is playing
-            options = ["White", "White_king", "White_Triple_King"]
-            if current_checker not in options:   # This square is either empty or does  not hav ea checker belonging to this player
-                print("You don't have a checker in this square.")
+            code = EMPTY_CODE       # light squares never hold a checker
+        else:
+            code = self._squares[start_index]
+        if code // 3 != COLOR_INDEX[checker_color]:        # EMPTY_CODE // 3 is neither color
+            # This square is either empty or does not have a checker belonging to this player
+            raise InvalidSquare("You don't have a checker in this square.")
+
+        end_index = SQUARE_INDEX.get((end_row, end_column))
+        if end_index is None:       # checkers must stay on the dark squares of the board
+            raise InvalidSquare("That square is not on the board.")
+
+        distance = abs(end_column - start_column)
+        if distance > 1:        # a jump must not run off the board before reaching the destination
+            direction = (2 if end_row > start_row else 0) + (1 if end_column > start_column else 0)
+            if len(RAYS[start_index][direction]) < distance - 1:
                 raise InvalidSquare
 
-        regular_checker = ["White", "Black"]
-        king_checker = ["White_king", "Black_king"]
-        triple_king_checker = ["White_Triple_King", "Black_Triple_King"]
-
-        # Movement for basic checker piece, not king or triple king
-        if current_checker in regular_checker:
-            # no jump taking place
-            if end_column == start_column + 1 or end_column == start_column - 1:
-                if end_row == 0 or end_row == 7:    # King the piece!
-                    player_object.set_king_count(1)
-                    if current_checker == regular_checker[0]:       # white checker
-                        current_checker = "White_king"
-                        self.non_jump_procedure(starting_square_location, destination_square_location, current_checker)
-                    else:       # black checker
-                        current_checker = "Black_king"
-                        self.non_jump_procedure(starting_square_location, destination_square_location, current_checker)
-                else:       # piece was not king-ed
-                    self.non_jump_procedure(starting_square_location, destination_square_location, current_checker)
-            # jump takes place
-            else:
-                if end_row == 0 or end_row == 7:    # King the piece!
-                    player_object.set_king_count(1)
-                    if current_checker == regular_checker[0]:       # white checker
-                        current_checker = "White_king"
-                        self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                            player_object)
-                    else:       # black checker
-                        current_checker = "Black_king"
-                        self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                            player_object)
-                else:       # piece was not king-ed
-                    self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                        player_object)
-
-        elif current_checker in king_checker:    # if piece is king checker
-            # no jump taking place
-            if end_column == start_column + 1 or end_column == start_column - 1:
-                if current_checker == king_checker[0]:  # White king
-                    if end_row == 0:    # Triple king the piece!
-                        player_object.set_triple_king_count(1)
-                        current_checker = "White_Triple_King"
-                        self.non_jump_procedure(starting_square_location, destination_square_location, current_checker)
-                    else:   # no promotion to triple king
-                        self.non_jump_procedure(starting_square_location, destination_square_location, current_checker)
-                else:   # Black king
-                    if end_row == 7:    # Triple king the piece!
-                        player_object.set_triple_king_count(1)
-                        current_checker = "Black_Triple_King"
-                        self.non_jump_procedure(starting_square_location, destination_square_location, current_checker)
-                    else:   # no promotion to triple king
-                        self.non_jump_procedure(starting_square_location, destination_square_location, current_checker)
-            # jump takes place
-            else:
-                if current_checker == king_checker[0]:  # White king
-                    if end_row == 0:    # Triple king the piece!
-                        player_object.set_triple_king_count(1)
-                        current_checker = "White_Triple_King"
-                        self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                            player_object)
-                    else:   # no promotion to triple king
-                        self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                            player_object)
-                else:   # Black king
-                    if end_row == 7:    # Triple king the piece!
-                        player_object.set_triple_king_count(1)
-                        current_checker = "Black_Triple_King"
-                        self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                            player_object)
-                    else:   # no promotion to triple king
-                        self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                            player_object)
-
-        elif current_checker in triple_king_checker:     # if piece is triple king checker
-            # no jump taking place
-            if end_column == start_column + 1 or end_column == start_column - 1:
-                self.non_jump_procedure(starting_square_location, destination_square_location, current_checker)
-            # jump takes place
-            else:
-                if current_checker == triple_king_checker[0]:  # White king
-                    self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                        player_object)
-                else:  # Black king
-                    self.jump_procedure(starting_square_location, destination_square_location, current_checker,
-                                        player_object)
-
-        pieces_captured = player_object.get_captured_pieces_count()
-        player_object.set_captured_pieces_count("reset")
+        return player_object, code, start_index, end_index
+
+    def _play_measured_move(self, player_name, starting_square_location, destination_square_location):
+        """play_move with every phase of _apply_move timed and counted by the metrics set with set_metrics"""
+
+        metrics = self._metrics
+        started = time.perf_counter()
+        try:
+            player_object, code, start_index, end_index = self._validate_move(
+                player_name, starting_square_location, destination_square_location)
+        except (InvalidPlayer, OutofTurn, InvalidSquare) as error:
+            metrics.count_exception(type(error).__name__)
+            raise
+        validated = time.perf_counter()
+        marks = []
+        new_code, captured = self._apply_move(start_index, end_index, code, marks)
+        promoted, moved, capture_done = marks
+
+        pieces_captured = player_object._captured_pieces + len(captured)
+        player_object._captured_pieces = 0
+        metrics.observe("validation", validated - started)
+        metrics.observe("promotion", promoted - validated)
+        metrics.observe("movement", moved - promoted)
+        if self._jump_just_occurred:
+            metrics.observe("capture", capture_done - moved)
+        metrics.record_move(pieces_captured, new_code % 3 if new_code != code else 0)
+        if self._events is not None:
+            self._publish_move(player_object, start_index, end_index, code, new_code, captured)
         return pieces_captured
 
-    def game_winner(self):
-        """Returns the name of the game winner if there is one. If there is no winner returns 'Game has not ended'"""
+    def _publish_move(self, player_object, start_index, end_index, code, new_code, captured):
+        """
+        Publishes the MoveEvent for a move play_move has just played to the event stream. Arguments are the square
+        indexes and piece codes from _validate_move and _apply_move.
+        """
 
-        for player in self._players:
-            if player.get_total_captured_pieces_count() == 12:
-                return player.get_name()
+        self._events.publish(MoveEvent(
+            player_object.get_name(), player_object.get_checker_color(), SQUARE_LOCATIONS[start_index],
+            SQUARE_LOCATIONS[end_index], PIECE_NAMES[new_code], new_code % 3 if new_code != code else 0,
+            tuple(SQUARE_LOCATIONS[square_index] for square_index, _ in captured),
+            tuple(PIECE_NAMES[captured_code] for _, captured_code in captured), self._which_players_turn,
+            self._jump_just_occurred, self.get_position()), self)
 
+    def game_winner(self):
+        """
+        Returns the name of the game winner if there is one. If there is no winner returns 'Game has not ended'
+        A player wins by capturing 12 pieces, or when the player who is up has no pieces or can't move and the player
+        who just jumped can't capture again.
+        """
+
+        for player in self._players_by_color:
+            if player is not None and player._total_captured_pieces == 12:
+                return player._player_name
+
+        turn_index = COLOR_INDEX[self._which_players_turn]
+        counts = self._piece_counts
+        base = turn_index * 3
+        if counts[base] + counts[base + 1] + counts[base + 2] and self._has_moves(turn_index):
+            return "Game has not ended"
+        if self._jump_just_occurred and self._generate_moves(1 - turn_index, True):
+            return "Game has not ended"
+        player_object = self._players_by_color[1 - turn_index]
+        if player_object is not None:
+            return player_object.get_name()
         return "Game has not ended"
 
 
-game = Checkers()
-game.pretty_print_board()
-# game.create_player("Sam", "White")
-# game.create_player("Faris", "Black")
-# print(game.play_game("Faris", (5, 2), (4, 1)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (2, 3), (3, 2)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (4, 1), (2, 3)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (1, 2), (3, 4)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (5, 4), (4, 5)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (0, 1), (1, 2)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (4, 5), (2, 3)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (2, 3), (0, 1)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (2,7),(3,6)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (6, 3), (5, 2)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (2,5),(3,4)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (0, 1), (4, 5)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (3,6),(5,4)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (6, 5), (4, 3)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (1,6),(2,7)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (5, 6), (4, 5)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (1,4),(2,5)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (4, 5), (3, 6)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (2,7),(4,5)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (7, 6), (6, 5)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (4,5),(5,4)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (5, 2), (4, 1)))
-# game.pretty_print_board()
-# print(game.play_game("Sam", (5,4),(7,6)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(7,6),(3,2)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (4,1),(2,3)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(0,3),(1,2)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (2,3),(0,1)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(2,1),(3,2)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (0,1),(1,2)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(2,5),(3,4)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (1,2),(2,1)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(0,5),(1,4)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (2,1),(4,3)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (4,3),(2,5)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (2,5),(0,3)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(0,7),(1,6)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (5,0),(4,1)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(1,6),(2,5)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (0,3),(3,6)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(1,0),(2,1)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (4,1),(3,2)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(2,1),(4,3)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (3,6),(4,5)))
-# game.pretty_print_board()
-# print(game.play_game("Sam",(4,3),(5,4)))
-# game.pretty_print_board()
-# print(game.play_game("Faris", (4,5),(6,3)))
-# game.pretty_print_board()
-# print(game.game_winner())
-
-
-# game.pretty_print_board()
-#
-# # try:
-# #     print(game.get_checker_details((7, 9)))
-# # except InvalidSquare:
-# #     print("That square is invalid! Try again.")
-#
-# # print(game.game_winner())   # "Game has not ended"
+
+def read_squares(prompt):
+    """
+    Asks for a move until it gets four numbers and returns them as (starting_square_location,
+    destination_square_location). Returns None if the reply is empty or input has ended.
+    """
+
+    while True:
+        try:
+            reply = input(prompt)
+        except EOFError:
+            return None
+        if not reply.strip():
+            return None
+        numbers = re.findall(r"-?\d+", reply)
+        if len(numbers) == 4:
+            start_row, start_column, end_row, end_column = (int(number) for number in numbers)
+            return (start_row, start_column), (end_row, end_column)
+        print("Enter a move as four numbers: start row, start column, destination row, destination column.")
+
+
+def main():
+    """Plays a game of checkers between two people at the console"""
+
+    game = Checkers()
+    names = {}
+    for color in COLORS[::-1]:      # Black plays first
+        while color not in names:
+            name = input(f"Name of the player with {color} checkers: ").strip() or color
+            try:
+                game.create_player(name, color)
+            except InvalidPlayer:       # create_player has printed why, so ask again
+                continue
+            names[color] = name
+
+    jump_declined = False       # the player who just jumped pressed Enter instead of jumping again
+    while game.game_winner() == "Game has not ended":
+        game.pretty_print_board()
+        color = game.get_which_players_turn()
+        previous_color = COLORS[1 - COLOR_INDEX[color]]
+        if not jump_declined and game.get_jump_just_occurred() and game.legal_moves(previous_color):
+            move = read_squares(f"{names[previous_color]}, you may jump again (press Enter to skip): ")
+            if move is not None:
+                try:
+                    game.play_game(names[previous_color], move[0], move[1])
+                except (OutofTurn, InvalidSquare):
+                    pass
+                continue
+            jump_declined = True
+
+        if not game.legal_moves(color):     # blocked or out of pieces
+            break
+        move = read_squares(f"{names[color]} ({color}), enter your move as start row, column, destination row, "
+                            f"column: ")
+        if move is None:
+            print("Game abandoned.")
+            return
+        try:
+            game.play_game(names[color], move[0], move[1])
+        except (OutofTurn, InvalidSquare):
+            continue
+        jump_declined = False
+
+    game.pretty_print_board()
+    winner = game.game_winner()
+    if winner == "Game has not ended":
+        winner = names[COLORS[1 - COLOR_INDEX[game.get_which_players_turn()]]]
+    print(f"{winner} wins!")
+
+
+if __name__ == '__main__':
+    main()
@@ -4,9 +4,15 @@
 # Description: Contains unit tests for CheckersGame. Tests init of game board, Player class,
 # get_checker_details, get_which_players_turn, Game class, get_jump_just_occurred, and get_king_count.
 # Tests jumping a checker piece, capturing a checker piece, and updating king count due to a capture.
+# Tests the board view, a full scripted game, the moves returned by legal_moves, piece counts and mobility.
 
+import pickle
+import random
+import subprocess
+import sys
 import unittest
-from CheckersGame import Checkers, Player
+from CheckersGame import Checkers, Player, Mobility, InvalidSquare, InvalidPlayer
+from CheckersFixtures import SCRIPTED_GAME, play_scripted_game, set_up_board, game_state
 
 
 class CheckersTests(unittest.TestCase):
@@ -122,6 +128,346 @@ class CheckersTests(unittest.TestCase):
                 player_object = player_obj
         self.assertNotEqual(player_object.get_king_count(), 1)
 
+    def test_board_view_after_move(self):
+        """Test that the string grid view follows the bitboards when a piece moves"""
+
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.create_player("Faris", "Black")
+        game.play_game("Faris", (5, 2), (4, 1))
+        board = game.get_board()
+        self.assertEqual(board[5][2], "__")
+        self.assertEqual(board[4][1], "Black")
+        self.assertEqual(game.get_checker_details((4, 1)), "Black")
+        self.assertEqual(game.get_checker_details((5, 2)), None)
+
+    def test_move_to_light_square(self):
+        """Test that a checker can't be moved onto a light square or off the board"""
+
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.create_player("Faris", "Black")
+        with self.assertRaises(InvalidSquare):
+            game.play_game("Faris", (5, 2), (4, 2))
+        with self.assertRaises(InvalidSquare):
+            game.play_game("Faris", (5, 0), (4, -1))
+
+    def test_scripted_game(self):
+        """Play a full game and check the final board and winner"""
+
+        game = play_scripted_game()
+        self.assertEqual(game.game_winner(), "Faris")
+        self.assertEqual(game.get_board()[6], ["__", "Black", "__", "Black_king", "__", "__", "__", "Black"])
+        self.assertEqual(game.get_board()[7], ["Black", "__", "Black", "__", "Black", "__", "__", "__"])
+        for row in range(6):
+            self.assertEqual(game.get_board()[row], ["__"] * 8)
+
+    def test_legal_moves_start(self):
+        """Test the moves available from the starting board"""
+
+        game = Checkers()
+        moves = game.legal_moves("Black")
+        self.assertEqual(len(moves), 7)
+        self.assertIn(((5, 0), (4, 1)), moves)
+        self.assertEqual(game.legal_moves("White"), [])
+
+    def test_legal_moves_jumps_first(self):
+        """Test that a man's jump is listed before its steps"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White"})
+        moves = game.legal_moves("Black")
+        self.assertEqual(moves[0], ((5, 2), (3, 4)))
+        self.assertEqual(sorted(moves[1:]), [((5, 2), (4, 1))])
+
+    def test_legal_moves_king(self):
+        """Test that a king jumps any distance over a single opponent piece but not over two"""
+
+        game = set_up_board({(7, 0): "Black_king", (5, 2): "White", (1, 6): "White", (0, 7): "White"})
+        jumps = [move for move in game.legal_moves("Black") if abs(move[0][1] - move[1][1]) > 1]
+        self.assertEqual(sorted(jumps), [((7, 0), (2, 5)), ((7, 0), (3, 4)), ((7, 0), (4, 3))])
+
+    def test_legal_moves_triple_king(self):
+        """Test that a triple king jumps friendly pieces and two opponent pieces next to each other"""
+
+        game = set_up_board({(7, 0): "Black_Triple_King", (6, 1): "Black", (4, 3): "White", (3, 4): "White",
+                             (1, 6): "White"})
+        moves = game.legal_moves("Black")
+        self.assertIn(((7, 0), (5, 2)), moves)       # over its own piece
+        self.assertIn(((7, 0), (2, 5)), moves)       # over its own piece and two opponent pieces
+        self.assertNotIn(((7, 0), (0, 7)), moves)    # a third opponent piece can't be jumped
+        game.play_game("Faris", (7, 0), (2, 5))
+        self.assertEqual(game.get_checker_details((4, 3)), None)
+        self.assertEqual(game.get_checker_details((3, 4)), None)
+        self.assertEqual(game.get_checker_details((6, 1)), "Black")
+
+    def test_legal_moves_subsequent_jump(self):
+        """Test that the player who just jumped may only make capturing jumps out of turn"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White", (2, 5): "White", (0, 1): "White"})
+        game.play_game("Faris", (5, 2), (3, 4))
+        self.assertEqual(game.legal_moves("Black"), [((3, 4), (1, 6))])
+        self.assertEqual(len(game.legal_moves("White")), 4)
+
+    def test_legal_moves_play_game(self):
+        """Play random games made of legal moves and check play_game accepts every one of them"""
+
+        rng = random.Random(7)
+        names = {"White": "Sam", "Black": "Faris"}
+        for _ in range(20):
+            game = Checkers()
+            game.create_player("Sam", "White")
+            game.create_player("Faris", "Black")
+            for _ in range(150):
+                color = game.get_which_players_turn()
+                moves = game.legal_moves(color)
+                if not moves:
+                    break
+                starting_square_location, destination_square_location = rng.choice(moves)
+                game.play_game(names[color], starting_square_location, destination_square_location)
+
+    def test_capture_result(self):
+        """Test the squares and pieces returned by capture_piece, and the opponent's king counts"""
+
+        game = set_up_board({(7, 0): "Black_Triple_King", (5, 2): "White_king", (4, 3): "White_Triple_King",
+                             (6, 1): "Black"})
+        sam = game.get_player_by_color("White")
+        faris = game.get_player_by_color("Black")
+        sam.set_king_count(1)
+        sam.set_triple_king_count(1)
+        game.update_board((7, 0), (3, 4), "Black_Triple_King")
+        capture_result = game.capture_piece((7, 0), (3, 4), faris)
+        self.assertEqual(capture_result.squares, ((5, 2), (4, 3)))
+        self.assertEqual(capture_result.pieces, ("White_king", "White_Triple_King"))
+        self.assertEqual(sam.get_king_count(), 0)
+        self.assertEqual(sam.get_triple_king_count(), 0)
+        self.assertEqual(faris.get_total_captured_pieces_count(), 2)
+        self.assertEqual(game.get_checker_details((6, 1)), "Black")
+
+    def test_player_lookup(self):
+        """Test finding players by name and color, and rejecting duplicate names and colors"""
+
+        game = Checkers()
+        sam = game.create_player("Sam", "White")
+        self.assertIs(game.get_player("Sam"), sam)
+        self.assertIs(game.get_player_by_color("White"), sam)
+        self.assertIsNone(game.get_player("Faris"))
+        self.assertTrue(game.is_player_valid("Sam"))
+        self.assertFalse(game.is_player_valid("White"))
+        with self.assertRaises(InvalidPlayer):
+            game.create_player("Sam", "Black")
+        with self.assertRaises(InvalidPlayer):
+            game.create_player("Faris", "White")
+        with self.assertRaises(InvalidPlayer):
+            game.create_player("Faris", "Red")
+        game.create_player("Faris", "Black")
+        with self.assertRaises(InvalidPlayer):
+            game.play_game("Cole", (5, 0), (4, 1))
+
+    def test_make_and_unmake_move(self):
+        """
+        Test that make_move changes the game the same way play_game does, and that unmake_move takes every move back
+        """
+
+        rng = random.Random(11)
+        names = {"White": "Sam", "Black": "Faris"}
+        for _ in range(20):
+            game = Checkers()
+            game.create_player("Sam", "White")
+            game.create_player("Faris", "Black")
+            searched = Checkers()
+            searched.create_player("Sam", "White")
+            searched.create_player("Faris", "Black")
+            states = [game_state(searched)]
+            for _ in range(150):
+                color = game.get_which_players_turn()
+                other_color = "White" if color == "Black" else "Black"
+                if game.get_jump_just_occurred() and game.legal_moves(other_color) and rng.random() < 0.5:
+                    color = other_color     # subsequent jump by the player who just jumped
+                moves = game.legal_moves(color)
+                if not moves:
+                    break
+                move = rng.choice(moves)
+                captured = game.play_game(names[color], move[0], move[1])
+                self.assertEqual(searched.make_move(move), captured)
+                self.assertEqual(game_state(searched), game_state(game))
+                self.assertEqual(game.get_hash(), game.compute_hash())
+                self.assertEqual(searched.get_hash(), game.get_hash())
+                self.assertEqual(game._piece_counts, [bin(bitboard).count("1") for bitboard in game._bitboards])
+                states.append(game_state(searched))
+            states.pop()
+            while states:
+                searched.unmake_move()
+                self.assertEqual(game_state(searched), states.pop())
+                self.assertEqual(searched.get_hash(), searched.compute_hash())
+
+    def test_hash_transposition(self):
+        """Test that reaching the same position through different move orders gives the same hash"""
+
+        first = Checkers()
+        second = Checkers()
+        for move in [((5, 0), (4, 1)), ((2, 1), (3, 0)), ((5, 6), (4, 7)), ((2, 7), (3, 6))]:
+            first.make_move(move)
+        for move in [((5, 6), (4, 7)), ((2, 7), (3, 6)), ((5, 0), (4, 1)), ((2, 1), (3, 0))]:
+            second.make_move(move)
+        self.assertEqual(first.get_hash(), second.get_hash())
+        self.assertNotEqual(first.get_hash(), Checkers().get_hash())
+        first.set_which_players_turn()
+        self.assertNotEqual(first.get_hash(), second.get_hash())
+        self.assertEqual(first.get_hash(), first.compute_hash())
+
+    def test_position_round_trip(self):
+        """Test that set_position restores a position saved with get_position"""
+
+        game = play_scripted_game()
+        copy = Checkers()
+        copy.set_position(game.get_position())
+        self.assertEqual(copy.get_board(), game.get_board())
+        self.assertEqual(copy.get_which_players_turn(), game.get_which_players_turn())
+        self.assertEqual(copy.get_jump_just_occurred(), game.get_jump_just_occurred())
+        self.assertEqual(copy.get_hash(), game.get_hash())
+
+    def test_snapshot_round_trip(self):
+        """Test that to_bytes and to_notation restore the board, turn, jump flag, players and their counts"""
+
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.create_player("Faris: 50%/x,y", "Black")
+        for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME[:25]:
+            if player_name == "Faris":
+                player_name = "Faris: 50%/x,y"
+            game.play_game(player_name, starting_square_location, destination_square_location)
+        self.assertTrue(game.get_jump_just_occurred())
+        for restored in (Checkers.from_bytes(game.to_bytes()), Checkers.from_notation(game.to_notation())):
+            self.assertEqual(game_state(restored), game_state(game))
+            self.assertEqual([player.get_name() for player in restored._players], ["Sam", "Faris: 50%/x,y"])
+            self.assertEqual(restored.get_hash(), game.get_hash())
+            self.assertEqual(restored.to_bytes(), game.to_bytes())
+
+        self.assertEqual(Checkers().to_notation(), "B:W1,2,3,4,5,6,7,8,9,10,11,12:B21,22,23,24,25,26,27,28,29,30,31,32")
+        game = Checkers.from_notation("W*:WK1,T2:B32")
+        self.assertEqual(game.get_checker_details((0, 1)), "White_king")
+        self.assertEqual(game.get_checker_details((0, 3)), "White_Triple_King")
+        self.assertEqual(game.get_which_players_turn(), "White")
+        self.assertTrue(game.get_jump_just_occurred())
+        for bad in (b"", b"\x02" + bytes(27), Checkers().to_bytes()[:-1] + b"\x01"):
+            with self.assertRaises(ValueError):
+                Checkers.from_bytes(bad)
+        for bad in ("", "X:W1:B2", "B:W33:B1", "B:W1:B2:WSam/1", "B:W1:B1,K1", "B:W1,K1:B2", "B:W1,1:B2"):
+            with self.assertRaises(ValueError):
+                Checkers.from_notation(bad)
+
+        game = Checkers()
+        game.create_player("\u00e9" * 127 + "x", "White")
+        self.assertEqual(Checkers.from_bytes(game.to_bytes()).get_player("\u00e9" * 127 + "x").get_name(),
+                         "\u00e9" * 127 + "x")
+        game.create_player("\u00e9" * 128, "Black")      # 128 characters but 256 bytes
+        with self.assertRaises(ValueError):
+            game.to_bytes()
+
+    def test_bad_positions_rejected(self):
+        """Test that positions with pieces sharing a square or stray bits are refused and leave the game unchanged"""
+
+        start = Checkers().get_position()
+        header = Checkers().to_bytes()[:25]
+        for bad in (start[:2] + (1,) + start[3:], (1 << 32,) + start[1:], start[:6] + (2, 0), start[:6] + (1, 2),
+                    start[:7]):
+            game = Checkers()
+            with self.assertRaises(ValueError):
+                game.set_position(bad)
+            self.assertEqual(game.get_position(), start)
+            self.assertEqual(game.get_hash(), game.compute_hash())
+        for flags in (4, 128):
+            with self.assertRaises(ValueError):
+                Checkers.from_bytes(header + bytes((flags, 0)))
+        with self.assertRaises(ValueError):
+            Checkers.from_bytes(header[:5] + (1).to_bytes(4, "little") + header[9:] + bytes((1, 0)))
+
+    def test_piece_counts_and_mobility(self):
+        """Test the piece counts and mobility through a capture and a promotion"""
+
+        game = set_up_board({(2, 1): "White", (6, 5): "White", (3, 2): "Black"})
+        self.assertEqual(game.get_piece_counts("White"), (2, 0, 0))
+        self.assertEqual(game.get_mobility("Black"), Mobility(1, 1))
+        self.assertEqual(game.get_mobility("White"), Mobility(1, 3))
+        game.play_game("Faris", (3, 2), (1, 0))
+        self.assertEqual(game.get_piece_counts("White"), (1, 0, 0))
+        self.assertEqual(game.get_mobility("White"), Mobility(0, 2))
+        game.play_game("Sam", (6, 5), (7, 4))
+        self.assertEqual(game.get_piece_counts("White"), (0, 1, 0))
+        self.assertEqual(game.get_mobility("White"), Mobility(0, 2))
+        self.assertEqual(game.get_piece_counts("Black"), (1, 0, 0))
+
+    def test_game_winner_without_captures(self):
+        """Test that a player who is up with no pieces or no moves loses"""
+
+        game = set_up_board({(3, 2): "White", (4, 1): "Black", (5, 6): "Black"})
+        self.assertEqual(game.game_winner(), "Game has not ended")
+        game.play_game("Faris", (4, 1), (2, 3))     # captures the only white piece
+        self.assertEqual(game.get_piece_counts("White"), (0, 0, 0))
+        self.assertEqual(game.game_winner(), "Faris")
+
+        # Black is up and both men are blocked
+        game = set_up_board({(5, 0): "Black", (4, 1): "White", (3, 2): "White", (6, 7): "White"})
+        self.assertEqual(game.get_mobility("Black"), Mobility(0, 0))
+        self.assertEqual(game.game_winner(), "Sam")
+        game = set_up_board({(5, 0): "Black", (4, 1): "White", (3, 2): "White", (6, 7): "White"})
+        self.assertEqual(game.game_winner(), "Sam")
+
+        # Black's man can't step, but can jump
+        game = set_up_board({(5, 0): "Black", (4, 1): "White", (6, 7): "White"})
+        self.assertEqual(game.game_winner(), "Game has not ended")
+        self.assertEqual(game.get_mobility("Black"), Mobility(1, 0))
+
+        # White just jumped and can jump again, so the game goes on
+        game = set_up_board({(3, 2): "White", (4, 3): "Black", (6, 5): "Black"}, turn="White")
+        game.play_game("Sam", (3, 2), (5, 4))
+        self.assertEqual(game.game_winner(), "Game has not ended")
+        game.play_game("Sam", (5, 4), (7, 6))
+        self.assertEqual(game.game_winner(), "Sam")
+
+    def test_slots(self):
+        """Test that games and players keep no per-instance dict and still pickle and copy their board"""
+
+        game = play_scripted_game()
+        self.assertFalse(hasattr(game, "__dict__"))
+        self.assertFalse(hasattr(game.get_player("Sam"), "__dict__"))
+        self.assertEqual(len(game._squares), 32)
+        self.assertEqual(game._board, game.get_board())
+        copy = pickle.loads(pickle.dumps(game))
+        self.assertEqual(game_state(copy), game_state(game))
+        self.assertEqual(copy.get_player("Faris").get_total_captured_pieces_count(), 12)
+        self.assertIsNone(copy.get_player("Cole"))
+        self.assertIsNone(copy.get_player_by_color("Red"))
+
+    def test_import_is_quiet(self):
+        """Test that importing CheckersGame prints nothing"""
+
+        result = subprocess.run([sys.executable, "-c", "import CheckersGame"], capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout, "")
+
+    def test_console_name_taken(self):
+        """Test that the console game asks again when the second player picks a name that is already taken"""
+
+        result = subprocess.run([sys.executable, "CheckersGame.py"], input="Sam\nSam\nFaris\n\n", capture_output=True,
+                                text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertIn("That name is already taken.", result.stdout)
+        self.assertIn("Sam (Black), enter your move", result.stdout)
+        self.assertIn("Game abandoned.", result.stdout)
+
+    def test_console_declined_jump(self):
+        """Test that the console game doesn't offer a declined subsequent jump again after a rejected move"""
+
+        moves = "".join(f"{start[0]} {start[1]} {end[0]} {end[1]}\n" for _, start, end in SCRIPTED_GAME[:7])
+        # Faris skips jumping on from (2, 3), then Sam tries a light square and gives up
+        result = subprocess.run([sys.executable, "CheckersGame.py"], input="Faris\nSam\n" + moves + "\n0 0 1 1\n\n",
+                                capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stdout.count("Faris, you may jump again"), 1)
+        self.assertEqual(result.stdout.count("Sam (White), enter your move"), 5)
+        self.assertIn("Game abandoned.", result.stdout)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,320 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains a CheckersMCTS Class that picks moves for a Player in a Checkers game with Monte Carlo tree
+# search. Children are chosen by UCT, leaves are scored by random playouts played with make_move, and playouts can be
+# sent to a process pool in batches. The tree is kept between moves so the part below the new position is reused. An
+# opening book can be checked before searching.
+
+import math
+import random
+import time
+from collections import deque, namedtuple
+from CheckersGame import Checkers, COLOR_INDEX
+from CheckersEngine import side_to_move
+
+
+DRAW = -1       # playout result when neither side has won after max_playout_moves moves
+
+# Returned by CheckersMCTS.search. win_rate is the searching player's share of wins through move (draws count as half),
+# visits is how often move was visited and reused is how many root visits were carried over from the previous search
+MCTSResult = namedtuple("MCTSResult", ["move", "win_rate", "visits", "playouts", "reused", "elapsed",
+                                       "playouts_per_second"])
+
+
+class Node:
+    """
+    Represents one position in the search tree, reached from its parent by move.
+    mover is the color index of the player who played move and wins counts playouts won by mover through this node.
+    color_index is the player to move here and untried holds the moves not expanded yet.
+    """
+
+    __slots__ = ("move", "parent", "mover", "color_index", "position_hash", "untried", "children", "visits", "wins")
+
+    def __init__(self, move, parent, mover, color_index, position_hash, untried):
+        self.move = move
+        self.parent = parent
+        self.mover = mover
+        self.color_index = color_index
+        self.position_hash = position_hash
+        self.untried = untried
+        self.children = []
+        self.visits = 0
+        self.wins = 0.0
+
+
+def playout(game, rng, max_moves):
+    """
+    Plays random moves on game with make_move until a player can't move or max_moves moves have been played, then
+    takes them all back. Returns the color index of the winner, or DRAW.
+    """
+
+    played = 0
+    winner = DRAW
+    try:
+        while played < max_moves:
+            color_index, moves = side_to_move(game)
+            if not moves:       # the player who is up can't move and the player who just jumped can't capture again
+                winner = 1 - color_index
+                break
+            game.make_move(moves[rng.randrange(len(moves))])
+            played += 1
+    finally:
+        for _ in range(played):
+            game.unmake_move()
+    return winner
+
+
+def _run_playouts(positions, max_moves, seed):
+    """
+    Process pool task for CheckersMCTS. Plays one playout from each position, a tuple from Checkers.get_position, and
+    returns the list of results.
+    """
+
+    rng = random.Random(seed)
+    game = Checkers()
+    results = []
+    for position in positions:
+        game.set_position(position)
+        results.append(playout(game, rng, max_moves))
+    return results
+
+
+class CheckersMCTS:
+    """
+    Represents a computer opponent that searches with Monte Carlo tree search. Takes a time budget in seconds per move,
+    the UCT exploration constant, the number of moves after which a playout counts as a draw, the most nodes the tree
+    may hold, a seed for the random playouts and, optionally, a CheckersOpeningBook.OpeningBook whose most played move
+    is returned without searching.
+
+    Pass a ProcessPoolExecutor as executor to play the playouts in other processes: batch_size leaves are selected per
+    round, with each selected path counted as visited so the batch spreads out, and sent in tasks of task_size
+    positions.
+
+    Like CheckersEngine, searches on the Checkers object it is given with make_move/unmake_move, so the game is
+    unchanged afterwards. A player with no moves loses.
+    """
+
+    def __init__(self, time_budget=1.0, exploration=1.4, max_playout_moves=150, max_nodes=1 << 20, seed=None,
+                 executor=None, batch_size=32, task_size=8, book=None):
+        self._time_budget = time_budget
+        self._exploration = exploration
+        self._max_playout_moves = max_playout_moves
+        self._max_nodes = max_nodes
+        self._rng = random.Random(seed)
+        self._executor = executor
+        self._batch_size = batch_size
+        self._task_size = task_size
+        self._book = book
+        self._root = None
+        self._node_count = 0
+
+    def get_time_budget(self):
+        """Returns the number of seconds a search may take"""
+
+        return self._time_budget
+
+    def set_time_budget(self, time_budget):
+        """Sets the number of seconds a search may take"""
+
+        self._time_budget = time_budget
+
+    def get_node_count(self):
+        """Returns the number of nodes in the tree kept from the last search"""
+
+        return self._node_count
+
+    def clear(self):
+        """Drops the search tree"""
+
+        self._root = None
+        self._node_count = 0
+
+    def choose_move(self, game, player_object):
+        """
+        Returns the (starting_square_location, destination_square_location) the search picks for player_object, or None
+        if the player has no move
+        """
+
+        return self.search(game, player_object.get_checker_color()).move
+
+    def play_move(self, game, player_object):
+        """
+        Picks a move for player_object and plays it through play_game. Returns the move, or None if there was nothing to
+        play
+        """
+
+        move = self.choose_move(game, player_object)
+        if move is not None:
+            game.play_game(player_object.get_name(), move[0], move[1])
+        return move
+
+    def search(self, game, color, time_budget=None, iterations=None):
+        """
+        Searches game for color ("White" or "Black") and returns an MCTSResult with the most visited move.
+        Stops when time_budget seconds have passed or, if iterations is given, after that many playouts, whichever comes
+        first. At least one playout is always played. A move from the opening book is returned with no playouts and
+        its book score as the win rate.
+        """
+
+        if time_budget is None:
+            time_budget = self._time_budget
+        start = time.perf_counter()
+        if self._book is not None:
+            legal = set(game.legal_moves(color))
+            for book_move in self._book.probe(game):
+                if book_move.move in legal:
+                    return MCTSResult(book_move.move, book_move.score, 0, 0, 0, time.perf_counter() - start, 0.0)
+        deadline = start + time_budget
+        color_index = COLOR_INDEX[color]
+        root = self._find_root(game, color_index)
+        if root is None:
+            moves = game.legal_moves(color)
+            if moves:
+                root = Node(None, None, 1 - color_index, color_index, game.get_hash(), moves)
+                self._node_count = 1
+        if root is None or self._result_of(root) is not None:     # color has no moves, the game is over
+            self.clear()
+            return MCTSResult(None, 0.0, 0, 0, 0, 0.0, 0.0)
+        root.parent = None
+        self._root = root
+        reused = root.visits
+
+        playouts = 0
+        while True:
+            if self._executor is None:
+                path = self._select(game, root)
+                try:
+                    winner = self._result_of(path[-1])
+                    if winner is None:
+                        winner = playout(game, self._rng, self._max_playout_moves)
+                finally:
+                    for _ in range(len(path) - 1):
+                        game.unmake_move()
+                self._backpropagate(path, winner)
+                playouts += 1
+            else:
+                playouts += self._run_batch(game, root)
+            if time.perf_counter() >= deadline or (iterations is not None and playouts >= iterations):
+                break
+
+        best = max(root.children, key=lambda child: child.visits)
+        elapsed = time.perf_counter() - start
+        playouts_per_second = playouts / elapsed if elapsed > 0 else 0.0
+        return MCTSResult(best.move, best.wins / best.visits, best.visits, playouts, reused, elapsed,
+                          playouts_per_second)
+
+    def _find_root(self, game, color_index, max_depth=6):
+        """
+        Returns the node of the kept tree for game's position with color_index to move, searching up to max_depth moves
+        below the last root, or None if the tree doesn't reach it
+        """
+
+        if self._root is None:
+            return None
+        position_hash = game.get_hash()
+        queue = deque([(self._root, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if node.position_hash == position_hash and node.color_index == color_index:
+                self._node_count = self._count_nodes(node)
+                return node
+            if depth < max_depth:
+                queue.extend((child, depth + 1) for child in node.children)
+        return None
+
+    @staticmethod
+    def _count_nodes(node):
+        """Returns the number of nodes in the tree below and including node"""
+
+        count = 0
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            count += 1
+            stack.extend(node.children)
+        return count
+
+    def _select(self, game, root):
+        """
+        Walks down from root by UCT, playing each move on game, and expands one untried move at the end of the walk.
+        Every node on the path has its visits counted here. Returns the path from root to the selected leaf.
+        """
+
+        node = root
+        node.visits += 1
+        path = [node]
+        exploration = self._exploration
+        while not node.untried and node.children:
+            log_visits = math.log(node.visits)
+            best_child = None
+            best_value = -1.0
+            for child in node.children:
+                if child.visits == 0:
+                    value = float("inf")
+                else:
+                    value = child.wins / child.visits + exploration * math.sqrt(log_visits / child.visits)
+                if value > best_value:
+                    best_value = value
+                    best_child = child
+            node = best_child
+            game.make_move(node.move)
+            node.visits += 1
+            path.append(node)
+
+        if node.untried and self._node_count < self._max_nodes:
+            move = node.untried.pop(self._rng.randrange(len(node.untried)))
+            game.make_move(move)
+            child_color_index, child_moves = side_to_move(game)
+            child = Node(move, node, node.color_index, child_color_index, game.get_hash(), child_moves)
+            node.children.append(child)
+            self._node_count += 1
+            child.visits += 1
+            path.append(child)
+        return path
+
+    @staticmethod
+    def _result_of(node):
+        """Returns the winner if the player to move at node has no moves left, otherwise None"""
+
+        if not node.untried and not node.children:
+            return 1 - node.color_index
+        return None
+
+    @staticmethod
+    def _backpropagate(path, winner):
+        """Adds a playout won by winner (or a DRAW) to every node on path. Visits were already counted by _select."""
+
+        for node in path:
+            if winner == DRAW:
+                node.wins += 0.5
+            elif winner == node.mover:
+                node.wins += 1.0
+
+    def _run_batch(self, game, root):
+        """
+        Selects batch_size leaves, plays their playouts on the process pool and backpropagates the results. Returns the
+        number of playouts.
+        """
+
+        paths = []
+        positions = []
+        for _ in range(self._batch_size):
+            path = self._select(game, root)
+            winner = self._result_of(path[-1])
+            if winner is None:
+                paths.append(path)
+                positions.append(game.get_position())
+            else:
+                self._backpropagate(path, winner)
+            for _ in range(len(path) - 1):
+                game.unmake_move()
+
+        task_size = self._task_size
+        futures = [self._executor.submit(_run_playouts, positions[index:index + task_size], self._max_playout_moves,
+                                         self._rng.getrandbits(32))
+                   for index in range(0, len(positions), task_size)]
+        winners = [winner for future in futures for winner in future.result()]
+        for path, winner in zip(paths, winners):
+            self._backpropagate(path, winner)
+        return self._batch_size
@@ -0,0 +1,85 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersMCTS. Tests that a search leaves the game as it found it, finds winning
+# captures, keeps to its time budget, reuses its tree between moves and plays out batches on a process pool.
+
+import random
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from CheckersGame import Checkers
+from CheckersMCTS import CheckersMCTS, playout, DRAW
+from CheckersFixtures import set_up_board, game_state
+
+
+class CheckersMCTSTests(unittest.TestCase):
+
+    def test_search_leaves_game_unchanged(self):
+        """Test that the board, turn, jump flag, counts and hash are the same after a search"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White", (2, 5): "White", (0, 1): "White", (7, 6): "Black"})
+        before = game_state(game)
+        position_hash = game.get_hash()
+        result = CheckersMCTS(seed=1).search(game, "Black", iterations=200)
+        self.assertIn(result.move, game.legal_moves("Black"))
+        self.assertEqual(result.playouts, 200)
+        self.assertEqual(game_state(game), before)
+        self.assertEqual(game.get_hash(), position_hash)
+
+    def test_playout(self):
+        """Test that a playout reports the winner and takes its moves back"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White"})
+        self.assertEqual(playout(game, random.Random(1), 10), 1)
+        self.assertEqual(game.get_checker_details((4, 3)), "White")
+        self.assertEqual(playout(Checkers(), random.Random(1), 0), DRAW)
+
+    def test_triple_king_capture(self):
+        """Test that the search finds a triple king jump that wins the endgame"""
+
+        game = set_up_board({(7, 0): "Black_Triple_King", (6, 1): "Black", (4, 3): "White", (3, 4): "White"})
+        result = CheckersMCTS(seed=2).search(game, "Black", iterations=300)
+        self.assertEqual(result.move[0], (7, 0))
+        self.assertEqual(result.win_rate, 1.0)
+
+    def test_tree_reuse_and_time_budget(self):
+        """Test that the tree below the opponent's reply is kept and that searches stop close to their time budget"""
+
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.create_player("Faris", "Black")
+        mcts = CheckersMCTS(time_budget=0.1, seed=3)
+        move = mcts.play_move(game, game.get_player("Faris"))
+        self.assertEqual(game.get_checker_details(move[1]), "Black")
+        reply = mcts.search(game, "White", iterations=100)
+        game.play_game("Sam", reply.move[0], reply.move[1])
+        result = mcts.search(game, "Black")
+        self.assertGreater(result.reused, 0)
+        self.assertGreaterEqual(result.elapsed, 0.1)
+        self.assertLess(result.elapsed, 1)
+        self.assertIsNone(mcts.search(set_up_board({(4, 3): "White"}), "Black").move)
+
+    def test_tree_reuse_into_finished_game(self):
+        """Test that reusing the tree for a position where the player who is up has no moves returns no move"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White"})
+        mcts = CheckersMCTS(seed=5)
+        move = mcts.play_move(game, game.get_player("Faris"))
+        self.assertEqual(move, ((5, 2), (3, 4)))
+        result = mcts.search(game, "White", iterations=10)
+        self.assertIsNone(result.move)
+        self.assertEqual(result.playouts, 0)
+
+    def test_process_pool(self):
+        """Test that playouts sent to a process pool are backpropagated"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White", (0, 1): "White", (7, 6): "Black"})
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            result = CheckersMCTS(seed=4, executor=executor, batch_size=16, task_size=4).search(game, "Black",
+                                                                                               iterations=128)
+        self.assertEqual(result.playouts, 128)
+        self.assertEqual(result.move, ((5, 2), (3, 4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains a MoveMetrics Class that a Checkers game records into once it is passed to set_metrics: a
+# latency histogram for each phase of a move (validation, promotion, movement and capture) and counters for moves,
+# captured pieces, promotions and exceptions. Metrics can be read as a snapshot dict or as Prometheus text.
+
+from bisect import bisect_left
+
+
+PHASES = ("validation", "promotion", "movement", "capture")
+
+# Upper bounds, in seconds, of the histogram buckets. Every histogram also has a +Inf bucket.
+BUCKET_BOUNDS = (1e-7, 2.5e-7, 5e-7, 1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 1e-3)
+
+PROMOTION_RANKS = ("king", "triple_king")
+
+
+class Histogram:
+    """Represents a latency histogram with BUCKET_BOUNDS buckets, keeping the count and sum of every observation"""
+
+    def __init__(self):
+        self._buckets = [0] * (len(BUCKET_BOUNDS) + 1)      # last bucket is +Inf
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, seconds):
+        """Records one observation"""
+
+        self._buckets[bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self._count += 1
+        self._sum += seconds
+
+    def get_count(self):
+        """Returns the number of observations"""
+
+        return self._count
+
+    def get_sum(self):
+        """Returns the total of every observation in seconds"""
+
+        return self._sum
+
+    def cumulative_buckets(self):
+        """Returns a list of (upper bound, observations at or below it), ending with (float("inf"), count)"""
+
+        buckets = []
+        total = 0
+        for bound, count in zip(BUCKET_BOUNDS + (float("inf"),), self._buckets):
+            total += count
+            buckets.append((bound, total))
+        return buckets
+
+    def quantile(self, fraction):
+        """Returns the upper bound of the bucket holding the fraction quantile, or 0.0 with no observations"""
+
+        if not self._count:
+            return 0.0
+        for bound, total in self.cumulative_buckets():
+            if total >= fraction * self._count:
+                return bound
+        return float("inf")
+
+
+class MoveMetrics:
+    """
+    Represents the metrics of every move played through play_game or play_move on the games it is passed to with
+    Checkers.set_metrics. One MoveMetrics may be shared by many games.
+    """
+
+    def __init__(self):
+        self._histograms = {phase: Histogram() for phase in PHASES}
+        self._moves = 0
+        self._captured_pieces = 0
+        self._promotions = [0] * len(PROMOTION_RANKS)
+        self._exceptions = {}       # key=exception class name, value=number raised
+
+    def observe(self, phase, seconds):
+        """Records how long one phase of a move took"""
+
+        self._histograms[phase].observe(seconds)
+
+    def record_move(self, captured, promotion):
+        """Counts a move that captured captured pieces. promotion is 0, 1 for a new king or 2 for a new triple king."""
+
+        self._moves += 1
+        self._captured_pieces += captured
+        if promotion:
+            self._promotions[promotion - 1] += 1
+
+    def count_exception(self, name):
+        """Counts an exception raised by a move, by its class name"""
+
+        self._exceptions[name] = self._exceptions.get(name, 0) + 1
+
+    def get_histogram(self, phase):
+        """Returns the Histogram for phase"""
+
+        return self._histograms[phase]
+
+    def reset(self):
+        """Clears every histogram and counter"""
+
+        self.__init__()
+
+    def snapshot(self):
+        """Returns the metrics as a dict of plain values that can be saved as JSON"""
+
+        return {
+            "moves": self._moves,
+            "captured_pieces": self._captured_pieces,
+            "promotions": dict(zip(PROMOTION_RANKS, self._promotions)),
+            "exceptions": dict(self._exceptions),
+            "phases": {phase: {"count": histogram.get_count(), "sum": histogram.get_sum(),
+                               "buckets": [[bound, total] for bound, total in histogram.cumulative_buckets()[:-1]]}
+                       for phase, histogram in self._histograms.items()},
+        }
+
+    def to_prometheus(self, prefix="checkers"):
+        """Returns the metrics in the Prometheus text exposition format, each name starting with prefix"""
+
+        lines = [f"# HELP {prefix}_moves_total Moves played.", f"# TYPE {prefix}_moves_total counter",
+                 f"{prefix}_moves_total {self._moves}",
+                 f"# HELP {prefix}_captured_pieces_total Pieces captured.",
+                 f"# TYPE {prefix}_captured_pieces_total counter",
+                 f"{prefix}_captured_pieces_total {self._captured_pieces}",
+                 f"# HELP {prefix}_promotions_total Pieces promoted, by the rank reached.",
+                 f"# TYPE {prefix}_promotions_total counter"]
+        for rank, count in zip(PROMOTION_RANKS, self._promotions):
+            lines.append(f'{prefix}_promotions_total{{rank="{rank}"}} {count}')
+        lines += [f"# HELP {prefix}_exceptions_total Moves rejected, by exception.",
+                  f"# TYPE {prefix}_exceptions_total counter"]
+        for name, count in sorted(self._exceptions.items()):
+            lines.append(f'{prefix}_exceptions_total{{exception="{name}"}} {count}')
+        lines += [f"# HELP {prefix}_move_phase_seconds Time spent in each phase of a move.",
+                  f"# TYPE {prefix}_move_phase_seconds histogram"]
+        for phase, histogram in self._histograms.items():
+            for bound, total in histogram.cumulative_buckets():
+                bound_text = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f'{prefix}_move_phase_seconds_bucket{{phase="{phase}",le="{bound_text}"}} {total}')
+            lines.append(f'{prefix}_move_phase_seconds_sum{{phase="{phase}"}} {histogram.get_sum()!r}')
+            lines.append(f'{prefix}_move_phase_seconds_count{{phase="{phase}"}} {histogram.get_count()}')
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,106 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersMetrics. Tests that a measured game records its phases, captures,
+# promotions and exceptions, plays out the same as an unmeasured one, and exports Prometheus text.
+
+import contextlib
+import io
+import unittest
+from CheckersGame import Checkers, OutofTurn
+from CheckersFixtures import SCRIPTED_GAME, play_scripted_game
+from CheckersMetrics import MoveMetrics, Histogram, PHASES
+
+
+def play_measured_game(metrics):
+    """Plays SCRIPTED_GAME with metrics set and returns the finished game"""
+
+    game = Checkers()
+    game.create_player("Sam", "White")
+    game.create_player("Faris", "Black")
+    game.set_metrics(metrics)
+    for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME:
+        game.play_game(player_name, starting_square_location, destination_square_location)
+    return game
+
+
+class CheckersMetricsTests(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        """Test that games aren't measured until metrics are set"""
+
+        game = Checkers()
+        self.assertIsNone(game.get_metrics())
+
+    def test_measured_game(self):
+        """Test the counters and histograms of the scripted game, and that measuring doesn't change the game"""
+
+        metrics = MoveMetrics()
+        game = play_measured_game(metrics)
+        expected = play_scripted_game()
+        self.assertEqual(game.get_board(), expected.get_board())
+        self.assertEqual(game.get_hash(), expected.get_hash())
+        self.assertEqual(game.game_winner(), "Faris")
+        for player, expected_player in zip(game._players, expected._players):
+            self.assertEqual(player.get_king_count(), expected_player.get_king_count())
+            self.assertEqual(player.get_total_captured_pieces_count(),
+                             expected_player.get_total_captured_pieces_count())
+
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["moves"], len(SCRIPTED_GAME))
+        self.assertEqual(snapshot["captured_pieces"], 18)
+        self.assertEqual(snapshot["promotions"], {"king": 3, "triple_king": 0})
+        self.assertEqual(snapshot["phases"]["validation"]["count"], len(SCRIPTED_GAME))
+        self.assertEqual(snapshot["phases"]["capture"]["count"], 18)
+        for phase in PHASES:
+            self.assertGreater(snapshot["phases"][phase]["sum"], 0)
+
+    def test_exceptions(self):
+        """Test that rejected moves are counted by exception"""
+
+        metrics = MoveMetrics()
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.set_metrics(metrics)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(2):
+                with self.assertRaises(OutofTurn):
+                    game.play_game("Sam", (2, 1), (3, 0))
+        self.assertEqual(metrics.snapshot()["exceptions"], {"OutofTurn": 2})
+        self.assertEqual(metrics.snapshot()["moves"], 0)
+        game.set_metrics(None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            with self.assertRaises(OutofTurn):
+                game.play_game("Sam", (2, 1), (3, 0))
+        self.assertEqual(metrics.snapshot()["exceptions"], {"OutofTurn": 2})
+
+    def test_histogram(self):
+        """Test bucket counts and quantiles"""
+
+        histogram = Histogram()
+        for seconds in (2e-7, 3e-6, 3e-6, 0.5):
+            histogram.observe(seconds)
+        buckets = dict(histogram.cumulative_buckets())
+        self.assertEqual(buckets[2.5e-7], 1)
+        self.assertEqual(buckets[5e-6], 3)
+        self.assertEqual(buckets[float("inf")], 4)
+        self.assertEqual(histogram.quantile(0.5), 5e-6)
+        self.assertEqual(histogram.quantile(1.0), float("inf"))
+
+    def test_prometheus(self):
+        """Test the Prometheus text export"""
+
+        metrics = MoveMetrics()
+        play_measured_game(metrics)
+        text = metrics.to_prometheus()
+        self.assertIn("checkers_moves_total 45\n", text)
+        self.assertIn('checkers_promotions_total{rank="king"} 3\n', text)
+        self.assertIn('checkers_move_phase_seconds_bucket{phase="capture",le="+Inf"} 18\n', text)
+        self.assertIn('checkers_move_phase_seconds_count{phase="movement"} 45\n', text)
+        self.assertIn("# TYPE checkers_move_phase_seconds histogram\n", text)
+        metrics.reset()
+        self.assertEqual(metrics.snapshot()["moves"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
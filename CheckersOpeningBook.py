@@ -0,0 +1,182 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains an opening book for Checkers built from archived games. build_book replays the first moves of
+# every CheckersRecord game and counts how often each move was played from each position and how those games ended.
+# An OpeningBook memory maps the book file and finds a position's moves with a binary search on its hash, so opening
+# a book reads nothing into memory.
+#
+# Book layout: the 4 byte magic b"CKB1", then one 22 byte little endian entry per (position, move), sorted by position
+# hash, then by games played and then by score, highest first:
+#   8 bytes position hash from Checkers.get_hash, 1 byte starting square 0-31, 1 byte destination square 0-31,
+#   4 bytes games the move was played in, 4 bytes of those won by the player who moved, 4 bytes of those drawn
+
+import argparse
+import mmap
+import struct
+from collections import namedtuple
+from CheckersGame import Checkers, COLORS, SQUARE_INDEX, SQUARE_LOCATIONS
+from CheckersRecord import read_games, iter_moves
+
+
+BOOK_MAGIC = b"CKB1"
+BOOK_ENTRY = struct.Struct("<QBBIII")
+BOOK_HASH = struct.Struct("<Q")
+
+# Returned by OpeningBook.probe. score is the share of games the player who moved went on to win, draws counting half
+BookMove = namedtuple("BookMove", ["move", "games", "wins", "draws", "score"])
+
+
+def count_book_moves(records, max_moves=16):
+    """
+    Replays the first max_moves moves of every GameRecord in records with make_move. Returns a dict with keys of
+    (position hash, starting square index, destination square index) and values of [games, wins, draws], wins being
+    the games won by the player who made the move.
+    """
+
+    counts = {}
+    game = Checkers()
+    start_position = game.get_position()
+    for record in records:
+        game.set_position(start_position)
+        for move in iter_moves(record.moves[:2 * max_moves]):
+            key = (game.get_hash(), SQUARE_INDEX[move.start], SQUARE_INDEX[move.end])
+            entry = counts.get(key)
+            if entry is None:
+                entry = counts[key] = [0, 0, 0]
+            entry[0] += 1
+            if record.winner is None:
+                entry[2] += 1
+            elif record.winner == move.color:
+                entry[1] += 1
+            game.make_move((move.start, move.end))
+    return counts
+
+
+def write_book(counts, book_path, min_games=1):
+    """Writes counts from count_book_moves to book_path, leaving out moves played in fewer than min_games games"""
+
+    entries = sorted((key for key, value in counts.items() if value[0] >= min_games),
+                     key=lambda key: (key[0], -counts[key][0], -2 * counts[key][1] - counts[key][2], key[1], key[2]))
+    with open(book_path, "wb") as book_file:
+        book_file.write(BOOK_MAGIC)
+        for key in entries:
+            book_file.write(BOOK_ENTRY.pack(key[0], key[1], key[2], *counts[key]))
+    return len(entries)
+
+
+def build_book(archive_paths, book_path, max_moves=16, min_games=1):
+    """
+    Builds a book from the first max_moves moves of every game in the CheckersRecord archives at archive_paths and
+    writes it to book_path. Returns the number of entries written.
+    """
+
+    def records():
+        for archive_path in archive_paths:
+            yield from read_games(archive_path)
+
+    return write_book(count_book_moves(records(), max_moves), book_path, min_games)
+
+
+class OpeningBook:
+    """
+    Represents a book file opened for lookups that takes its path. The file is memory mapped and searched in place.
+    Use as a context manager or call close when done.
+    """
+
+    def __init__(self, book_path):
+        self._file = open(book_path, "rb")
+        self._book = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._book[:len(BOOK_MAGIC)] != BOOK_MAGIC:
+            self.close()
+            raise ValueError("Not a checkers opening book")
+        self._entry_count = (len(self._book) - len(BOOK_MAGIC)) // BOOK_ENTRY.size
+
+    def __len__(self):
+        return self._entry_count
+
+    def _first_entry(self, position_hash):
+        """Returns the number of the first entry whose hash is not less than position_hash"""
+
+        low = 0
+        high = self._entry_count
+        book = self._book
+        while low < high:
+            middle = (low + high) // 2
+            if BOOK_HASH.unpack_from(book, len(BOOK_MAGIC) + middle * BOOK_ENTRY.size)[0] < position_hash:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def probe_hash(self, position_hash):
+        """
+        Returns a list of BookMove for position_hash, most played and then best scoring first, or an empty list if it
+        isn't in the book
+        """
+
+        moves = []
+        book = self._book
+        for entry_number in range(self._first_entry(position_hash), self._entry_count):
+            entry_hash, start, end, games, wins, draws = BOOK_ENTRY.unpack_from(
+                book, len(BOOK_MAGIC) + entry_number * BOOK_ENTRY.size)
+            if entry_hash != position_hash:
+                break
+            moves.append(BookMove((SQUARE_LOCATIONS[start], SQUARE_LOCATIONS[end]), games, wins, draws,
+                                  (wins + draws / 2) / games))
+        return moves
+
+    def probe(self, game):
+        """Returns a list of BookMove for the position in game, a Checkers object, most played first"""
+
+        return self.probe_hash(game.get_hash())
+
+    def choose_move(self, game, color, min_games=1):
+        """
+        Returns the most played book move for color ("White" or "Black") in game that is still legal, or None if the
+        position isn't in the book or no book move was played in min_games games
+        """
+
+        book_moves = self.probe(game)
+        if not book_moves:
+            return None
+        legal = set(game.legal_moves(color))
+        for book_move in book_moves:
+            if book_move.games >= min_games and book_move.move in legal:
+                return book_move.move
+        return None
+
+    def close(self):
+        """Unmaps and closes the book"""
+
+        if self._book is not None:
+            self._book.close()
+            self._book = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def main():
+    """Builds a book from archives on the command line and prints the moves it has for the starting position"""
+
+    parser = argparse.ArgumentParser(description="Build a Checkers opening book from game archives")
+    parser.add_argument("book", help="book file to write")
+    parser.add_argument("archives", nargs="+", help="CheckersRecord archives to read")
+    parser.add_argument("--max-moves", type=int, default=16, help="moves of each game to add to the book")
+    parser.add_argument("--min-games", type=int, default=1, help="leave out moves played in fewer games")
+    args = parser.parse_args()
+
+    entries = build_book(args.archives, args.book, args.max_moves, args.min_games)
+    print(f"{entries} entries written to {args.book}")
+    with OpeningBook(args.book) as book:
+        for book_move in book.probe(Checkers()):
+            print(f"{book_move.move}: {book_move.games} games, {book_move.score:.0%} for {COLORS[1]}")
+
+
+if __name__ == '__main__':
+    main()
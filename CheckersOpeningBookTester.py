@@ -0,0 +1,71 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersOpeningBook. Tests that a book built from an archive counts games, wins
+# and draws per position, that lookups find every recorded position, and that the engines play book moves.
+
+import os
+import tempfile
+import unittest
+from CheckersGame import Checkers
+from CheckersEngine import CheckersEngine
+from CheckersMCTS import CheckersMCTS
+from CheckersFixtures import SCRIPTED_GAME
+from CheckersRecordTester import write_scripted_archive
+from CheckersOpeningBook import OpeningBook, BookMove, build_book
+
+
+class CheckersOpeningBookTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        archive_path = os.path.join(self._directory.name, "games.ckr")
+        self._book_path = os.path.join(self._directory.name, "games.ckb")
+        write_scripted_archive(archive_path, 3)
+        self.assertEqual(build_book([archive_path], self._book_path, max_moves=10), 11)
+        self._book = OpeningBook(self._book_path)
+
+    def tearDown(self):
+        self._book.close()
+        self._directory.cleanup()
+
+    def test_probe(self):
+        """Test the start position's moves and that every recorded position is found"""
+
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.create_player("Faris", "Black")
+        first_move = (SCRIPTED_GAME[0][1], SCRIPTED_GAME[0][2])
+        self.assertEqual(self._book.probe(game), [BookMove(first_move, 3, 3, 0, 1.0),
+                                                  BookMove(((5, 0), (4, 1)), 3, 0, 3, 0.5)])
+        for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME[:10]:
+            book_moves = self._book.probe(game)
+            self.assertIn((starting_square_location, destination_square_location),
+                          [book_move.move for book_move in book_moves])
+            game.play_game(player_name, starting_square_location, destination_square_location)
+        self.assertEqual(self._book.probe(game), [])
+        self.assertEqual(self._book.choose_move(game, "Black"), None)
+
+    def test_engines_play_book_moves(self):
+        """Test that both engines answer book positions without searching"""
+
+        game = Checkers()
+        result = CheckersEngine(book=self._book).search(game, "Black")
+        self.assertEqual(result.move, (SCRIPTED_GAME[0][1], SCRIPTED_GAME[0][2]))
+        self.assertEqual(result.nodes, 0)
+        result = CheckersMCTS(book=self._book).search(game, "Black")
+        self.assertEqual(result.move, (SCRIPTED_GAME[0][1], SCRIPTED_GAME[0][2]))
+        self.assertEqual(result.playouts, 0)
+
+    def test_not_a_book(self):
+        """Test that a file without the book magic is refused"""
+
+        path = os.path.join(self._directory.name, "other.ckb")
+        with open(path, "wb") as other_file:
+            other_file.write(b"CKR1")
+        with self.assertRaises(ValueError):
+            OpeningBook(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
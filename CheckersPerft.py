@@ -0,0 +1,132 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Counts the positions reachable in exactly N moves (perft) from the starting board and from stored test
+# positions, in total or split by root move, and reports nodes per second. Subsequent jumps count as moves of their
+# own, and a player with no moves ends that line. compare_with_play_game replays every move of the tree through
+# play_game and checks it leaves the same game as make_move, so move generation changes can be checked against the
+# game rules.
+
+import argparse
+import contextlib
+import io
+import time
+from collections import namedtuple
+from CheckersGame import Checkers, COLORS, OutofTurn, InvalidPlayer, InvalidSquare
+from CheckersEngine import side_to_move
+
+
+# Stored test positions in Checkers.to_notation text. key=name, value=notation
+PERFT_POSITIONS = {
+    "start": "B:W1,2,3,4,5,6,7,8,9,10,11,12:B21,22,23,24,25,26,27,28,29,30,31,32:WSam/0/0/0:BFaris/0/0/0",
+    # the benchmark's scripted game just after Black's jump at move 25, with no subsequent jump for Black
+    "scripted_jump": "W*:W2,3,4,5,9,11:B10,21,25,28,29,30,31:WSam/0/0/5:BFaris/0/0/6",
+    # a Black man that has just jumped and can jump again before White replies
+    "subsequent_jump": "W*:W1,K6,11:B15,32:WSam/1/0/0:BFaris/0/0/1",
+    # two Black triple kings and a king against eight White pieces
+    "triple_king_endgame": "B:WK1,7,9,11,13,16,18,22:BK28,T29,T31:WSam/1/0/9:BFaris/1/2/4",
+}
+
+# Returned by run_perft
+PerftResult = namedtuple("PerftResult", ["nodes", "elapsed", "nodes_per_second"])
+
+
+def perft(game, depth):
+    """Returns the number of positions reached after exactly depth moves from game, playing them with make_move"""
+
+    if depth == 0:
+        return 1
+    moves = side_to_move(game)[1]
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        game.make_move(move)
+        nodes += perft(game, depth - 1)
+        game.unmake_move()
+    return nodes
+
+
+def divide(game, depth):
+    """Returns a dict of root move: perft of the position after it, for depth moves in total"""
+
+    counts = {}
+    for move in side_to_move(game)[1]:
+        game.make_move(move)
+        counts[move] = perft(game, depth - 1)
+        game.unmake_move()
+    return counts
+
+
+def run_perft(game, depth):
+    """Returns the PerftResult of perft(game, depth)"""
+
+    start = time.perf_counter()
+    nodes = perft(game, depth)
+    elapsed = time.perf_counter() - start
+    return PerftResult(nodes, elapsed, nodes / elapsed if elapsed > 0 else 0.0)
+
+
+def compare_with_play_game(game, depth):
+    """
+    Walks the perft tree of game to depth and plays every move both with make_move and with play_game on a copy of the
+    game from to_bytes. game must have a player for each color. Returns (nodes, list of (notation, move) for every move
+    play_game refused or after which the two games' to_bytes differ).
+    """
+
+    names = [game.get_player_by_color(color).get_name() for color in COLORS]
+    mismatches = []
+
+    def walk(depth):
+        if depth == 0:
+            return 1
+        color_index, moves = side_to_move(game)
+        snapshot = game.to_bytes()
+        nodes = 0
+        for move in moves:
+            copy = Checkers.from_bytes(snapshot)
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    copy.play_game(names[color_index], move[0], move[1])
+            except (OutofTurn, InvalidPlayer, InvalidSquare):
+                mismatches.append((game.to_notation(), move))
+                continue
+            game.make_move(move)
+            if copy.to_bytes() != game.to_bytes():
+                game.unmake_move()
+                mismatches.append((game.to_notation(), move))
+                continue
+            nodes += walk(depth - 1)
+            game.unmake_move()
+        return nodes
+
+    return walk(depth), mismatches
+
+
+def main():
+    """Runs perft from the command line on one stored position, printing the count for every depth up to --depth"""
+
+    parser = argparse.ArgumentParser(description="Count Checkers positions to a fixed depth")
+    parser.add_argument("--position", default="start", choices=sorted(PERFT_POSITIONS))
+    parser.add_argument("--depth", type=int, default=6)
+    parser.add_argument("--divide", action="store_true", help="split the deepest count by root move")
+    parser.add_argument("--check", action="store_true", help="also check every move against play_game")
+    args = parser.parse_args()
+
+    game = Checkers.from_notation(PERFT_POSITIONS[args.position])
+    for depth in range(1, args.depth + 1):
+        result = run_perft(game, depth)
+        print(f"depth {depth}: {result.nodes:,} nodes in {result.elapsed:.3f} sec, "
+              f"{result.nodes_per_second:,.0f} nodes/sec")
+    if args.divide:
+        for move, nodes in divide(game, args.depth).items():
+            print(f"{move}: {nodes:,}")
+    if args.check:
+        nodes, mismatches = compare_with_play_game(game, args.depth)
+        print(f"play_game check: {nodes:,} nodes, {len(mismatches)} mismatches")
+        for notation, move in mismatches:
+            print(f"  {move} from {notation}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersPerft. Tests the perft counts of every stored position, that divide
+# adds up to perft, and that make_move agrees with play_game along every line of the tree.
+
+import unittest
+from CheckersGame import Checkers
+from CheckersPerft import PERFT_POSITIONS, perft, divide, run_perft, compare_with_play_game
+
+
+# Perft counts for depths 1 to 5 of every stored position
+PERFT_COUNTS = {
+    "start": (7, 49, 379, 2872, 23582),
+    "scripted_jump": (9, 71, 575, 4684, 36849),
+    "subsequent_jump": (1, 4, 16, 85, 319),
+    "triple_king_endgame": (7, 60, 532, 4648, 39499),
+}
+
+
+class CheckersPerftTests(unittest.TestCase):
+
+    def test_counts(self):
+        """Test the perft counts of every stored position, and that the game is unchanged afterwards"""
+
+        for name, notation in PERFT_POSITIONS.items():
+            game = Checkers.from_notation(notation)
+            for depth, expected in enumerate(PERFT_COUNTS[name], 1):
+                self.assertEqual(perft(game, depth), expected, f"{name} depth {depth}")
+            self.assertEqual(game.to_notation(), notation)
+        self.assertEqual(perft(Checkers(), 0), 1)
+
+    def test_divide(self):
+        """Test that the root move counts add up to the perft count"""
+
+        game = Checkers.from_notation(PERFT_POSITIONS["scripted_jump"])
+        counts = divide(game, 3)
+        self.assertEqual(len(counts), PERFT_COUNTS["scripted_jump"][0])
+        self.assertEqual(counts[((2, 1), (3, 2))], 79)
+        self.assertEqual(sum(counts.values()), PERFT_COUNTS["scripted_jump"][2])
+        self.assertEqual(run_perft(game, 3).nodes, PERFT_COUNTS["scripted_jump"][2])
+
+    def test_play_game_agrees(self):
+        """Test that every move of the tree leaves the same game through play_game as through make_move"""
+
+        for name, notation in PERFT_POSITIONS.items():
+            game = Checkers.from_notation(notation)
+            nodes, mismatches = compare_with_play_game(game, 3)
+            self.assertEqual(nodes, PERFT_COUNTS[name][2])
+            self.assertEqual(mismatches, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
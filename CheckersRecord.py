@@ -0,0 +1,273 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains a compact binary format for archiving Checkers games, a GameRecordWriter that records games as
+# they are played through play_game, generators that read and replay archived games one at a time, and a GameArchive
+# Class for random access to the games of a memory mapped archive through an offset index.
+#
+# Archive layout: the 4 byte magic b"CKR1", then one record per game. A record is a little endian 4 byte length of the
+# rest of the record, a player count byte, for each player a color byte (0 White, 1 Black), a name length byte and the
+# UTF-8 name, a winner byte (0 no winner, 1 White, 2 Black), and then 2 bytes per move:
+#   byte 1: starting square 0-31 in bits 0-4, 1 in bit 5 if pieces were captured, promotion in bits 6-7 (1 king,
+#           2 triple king)
+#   byte 2: destination square 0-31 in bits 0-4, color of the player who moved in bit 5
+# An index file is the little endian 8 byte offset of every record in the archive.
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import namedtuple
+from CheckersGame import Checkers, COLORS, COLOR_INDEX, PIECE_CODES, SQUARE_INDEX, SQUARE_LOCATIONS
+
+
+ARCHIVE_MAGIC = b"CKR1"
+
+# Yielded by read_games. players is a tuple of (name, color) in the order they were created, winner is a color or None
+# and moves holds the packed 2 byte moves
+GameRecord = namedtuple("GameRecord", ["players", "winner", "moves"])
+
+# Yielded by iter_moves. promotion is 0, or 1 if the piece became a king, or 2 if it became a triple king
+RecordedMove = namedtuple("RecordedMove", ["color", "start", "end", "captured", "promotion"])
+
+
+def pack_move(color, starting_square_location, destination_square_location, captured, promotion):
+    """Returns the 2 bytes for one move"""
+
+    first = SQUARE_INDEX[starting_square_location] | (0x20 if captured else 0) | promotion << 6
+    second = SQUARE_INDEX[destination_square_location] | COLOR_INDEX[color] << 5
+    return bytes((first, second))
+
+
+def iter_moves(packed_moves):
+    """Generates a RecordedMove for every 2 bytes of packed_moves"""
+
+    for position in range(0, len(packed_moves) - 1, 2):
+        first = packed_moves[position]
+        second = packed_moves[position + 1]
+        yield RecordedMove(COLORS[second >> 5 & 1], SQUARE_LOCATIONS[first & 0x1F], SQUARE_LOCATIONS[second & 0x1F],
+                           bool(first & 0x20), first >> 6)
+
+
+def pack_game(players, winner, packed_moves):
+    """Returns the bytes of one record. players is a list of (name, color) and winner is a color or None."""
+
+    payload = bytearray((len(players),))
+    for name, color in players:
+        encoded_name = name.encode("utf-8")
+        if len(encoded_name) > 255:
+            raise ValueError("Player names are limited to 255 bytes")
+        payload.append(COLOR_INDEX[color])
+        payload.append(len(encoded_name))
+        payload += encoded_name
+    payload.append(0 if winner is None else COLOR_INDEX[winner] + 1)
+    payload += packed_moves
+    return struct.pack("<I", len(payload)) + payload
+
+
+def unpack_game(buffer, offset):
+    """Returns (GameRecord starting at offset in buffer, offset of the next record)"""
+
+    length, = struct.unpack_from("<I", buffer, offset)
+    position = offset + 4
+    end = position + length
+    players = []
+    for _ in range(buffer[position]):
+        color = COLORS[buffer[position + 1]]
+        name_length = buffer[position + 2]
+        name = bytes(buffer[position + 3:position + 3 + name_length]).decode("utf-8")
+        players.append((name, color))
+        position += 2 + name_length
+    winner_byte = buffer[position + 1]
+    winner = None if winner_byte == 0 else COLORS[winner_byte - 1]
+    return GameRecord(tuple(players), winner, bytes(buffer[position + 2:end])), end
+
+
+class GameRecordWriter:
+    """
+    Represents an archive open for writing that takes a binary file object. Writes the archive magic if the file is
+    empty, so an existing archive opened in append mode keeps growing.
+
+    start_game begins recording a Checkers game, play_game plays and records each move, and end_game writes the
+    record with the winner from game_winner.
+    """
+
+    def __init__(self, archive_file):
+        self._file = archive_file
+        if self._file.tell() == 0:
+            self._file.write(ARCHIVE_MAGIC)
+        self._game = None
+        self._players = []
+        self._moves = bytearray()
+
+    def start_game(self, game):
+        """Starts recording game. Players must already be created."""
+
+        self._game = game
+        self._players = [(name, color) for name, color in game._players.values()]
+        self._moves = bytearray()
+
+    def play_game(self, player_name, starting_square_location, destination_square_location):
+        """Plays the move with the recorded game's play_game, records it and returns play_game's result"""
+
+        game = self._game
+        piece = game.get_checker_details(starting_square_location)
+        captured = game.play_game(player_name, starting_square_location, destination_square_location)
+        new_code = PIECE_CODES[game.get_checker_details(destination_square_location)]
+        promotion = new_code % 3 if new_code != PIECE_CODES[piece] else 0     # the rank the piece was promoted to
+        self._moves += pack_move(game.get_player(player_name).get_checker_color(), tuple(starting_square_location),
+                                 tuple(destination_square_location), captured, promotion)
+        return captured
+
+    def end_game(self):
+        """Writes the recorded game to the archive"""
+
+        winner = self._game.game_winner()
+        winner_color = None
+        if winner != "Game has not ended":
+            winner_color = self._game.get_player(winner).get_checker_color()
+        self.write_game(self._players, winner_color, self._moves)
+        self._game = None
+
+    def write_game(self, players, winner, packed_moves):
+        """Writes a game that was recorded elsewhere. Arguments are as for pack_game."""
+
+        self._file.write(pack_game(players, winner, packed_moves))
+
+
+def _map_archive(archive_file):
+    """Returns a read only mmap of archive_file after checking its magic, or None if the file has no games"""
+
+    archive_file.seek(0, 2)
+    size = archive_file.tell()
+    if size <= len(ARCHIVE_MAGIC):
+        return None
+    archive = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+    if archive[:len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+        archive.close()
+        raise ValueError("Not a checkers game archive")
+    return archive
+
+
+def read_games(path):
+    """Generates the GameRecord of every game in the archive at path, reading from a memory map one game at a time"""
+
+    with open(path, "rb") as archive_file:
+        archive = _map_archive(archive_file)
+        if archive is None:
+            return
+        try:
+            offset = len(ARCHIVE_MAGIC)
+            while offset < len(archive):
+                record, offset = unpack_game(archive, offset)
+                yield record
+        finally:
+            archive.close()
+
+
+def replay_positions(record):
+    """
+    Plays record through play_game on a new Checkers game, generating (RecordedMove, game) after every move.
+    The same Checkers object is yielded each time.
+    """
+
+    game = Checkers()
+    names = {}
+    for name, color in record.players:
+        game.create_player(name, color)
+        names[color] = name
+    for move in iter_moves(record.moves):
+        game.play_game(names[move.color], move.start, move.end)
+        yield move, game
+
+
+def replay_game(record):
+    """Returns a Checkers game with every move of record played"""
+
+    game = None
+    for move, game in replay_positions(record):
+        pass
+    if game is None:        # no moves were recorded
+        game = Checkers()
+        for name, color in record.players:
+            game.create_player(name, color)
+    return game
+
+
+def build_index(path):
+    """Returns an array of the byte offset of every game in the archive at path, found by hopping over record lengths"""
+
+    offsets = array("Q")
+    with open(path, "rb") as archive_file:
+        archive = _map_archive(archive_file)
+        if archive is None:
+            return offsets
+        try:
+            offset = len(ARCHIVE_MAGIC)
+            while offset < len(archive):
+                offsets.append(offset)
+                length, = struct.unpack_from("<I", archive, offset)
+                offset += 4 + length
+        finally:
+            archive.close()
+    return offsets
+
+
+def write_index(offsets, index_path):
+    """Saves offsets from build_index to index_path"""
+
+    offsets = array("Q", offsets)
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    with open(index_path, "wb") as index_file:
+        index_file.write(offsets.tobytes())
+
+
+def read_index(index_path):
+    """Loads offsets saved by write_index"""
+
+    offsets = array("Q")
+    with open(index_path, "rb") as index_file:
+        offsets.frombytes(index_file.read())
+    if sys.byteorder == "big":
+        offsets.byteswap()
+    return offsets
+
+
+class GameArchive:
+    """
+    Represents an archive opened for random access that takes the archive path and, optionally, the path of an index
+    written by write_index. Without an index one is built by scanning the record lengths.
+
+    The archive is memory mapped, so only the games that are looked at are read from disk. Supports len(), indexing
+    and iteration, each returning GameRecords. Use as a context manager or call close when done.
+    """
+
+    def __init__(self, path, index_path=None):
+        self._offsets = read_index(index_path) if index_path is not None else build_index(path)
+        self._file = open(path, "rb")
+        self._archive = _map_archive(self._file)
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, game_number):
+        return unpack_game(self._archive, self._offsets[game_number])[0]
+
+    def __iter__(self):
+        for offset in self._offsets:
+            yield unpack_game(self._archive, offset)[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Unmaps and closes the archive"""
+
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+        self._file.close()
@@ -0,0 +1,97 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersRecord. Tests packing moves, writing and reading an archive, replaying a
+# recorded game, and random access through the offset index.
+
+import os
+import tempfile
+import unittest
+from CheckersGame import Checkers
+from CheckersFixtures import SCRIPTED_GAME, play_scripted_game
+from CheckersRecord import (GameRecordWriter, GameArchive, pack_move, iter_moves, read_games, replay_game,
+                            build_index, write_index)
+
+
+def write_scripted_archive(path, copies):
+    """Writes SCRIPTED_GAME copies times to a new archive at path, adding a short unfinished game after each copy"""
+
+    with open(path, "wb") as archive_file:
+        writer = GameRecordWriter(archive_file)
+        for _ in range(copies):
+            game = Checkers()
+            game.create_player("Sam", "White")
+            game.create_player("Faris", "Black")
+            writer.start_game(game)
+            for player_name, starting_square_location, destination_square_location in SCRIPTED_GAME:
+                writer.play_game(player_name, starting_square_location, destination_square_location)
+            writer.end_game()
+
+            game = Checkers()
+            game.create_player("Cole", "Black")
+            game.create_player("Sami", "White")
+            writer.start_game(game)
+            writer.play_game("Cole", (5, 0), (4, 1))
+            writer.end_game()
+
+
+class CheckersRecordTests(unittest.TestCase):
+
+    def setUp(self):
+        self._directory = tempfile.TemporaryDirectory()
+        self._path = os.path.join(self._directory.name, "games.ckr")
+
+    def tearDown(self):
+        self._directory.cleanup()
+
+    def test_pack_move(self):
+        """Test that a move with a capture and a promotion survives packing"""
+
+        packed = pack_move("Black", (2, 3), (0, 1), 1, 1) + pack_move("White", (0, 1), (4, 5), 0, 2)
+        self.assertEqual(len(packed), 4)
+        moves = list(iter_moves(packed))
+        self.assertEqual(tuple(moves[0]), ("Black", (2, 3), (0, 1), True, 1))
+        self.assertEqual(tuple(moves[1]), ("White", (0, 1), (4, 5), False, 2))
+
+    def test_write_and_replay(self):
+        """Test that an archived game reads back with its players and winner and replays to the same board"""
+
+        write_scripted_archive(self._path, 2)
+        records = list(read_games(self._path))
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[0].players, (("Sam", "White"), ("Faris", "Black")))
+        self.assertEqual(records[0].winner, "Black")
+        self.assertEqual(len(records[0].moves), 2 * len(SCRIPTED_GAME))
+        self.assertEqual(records[1].players, (("Cole", "Black"), ("Sami", "White")))
+        self.assertIsNone(records[1].winner)
+        moves = list(iter_moves(records[0].moves))
+        self.assertEqual(tuple(moves[2]), ("Black", (4, 1), (2, 3), True, 0))
+        self.assertEqual(moves[7].promotion, 1)     # Faris's first king
+        self.assertEqual(replay_game(records[0]).get_board(), play_scripted_game().get_board())
+        self.assertEqual(replay_game(records[0]).game_winner(), "Faris")
+
+    def test_archive_index(self):
+        """Test random access to games through a saved index"""
+
+        write_scripted_archive(self._path, 3)
+        index_path = self._path + ".idx"
+        offsets = build_index(self._path)
+        self.assertEqual(len(offsets), 6)
+        write_index(offsets, index_path)
+        with GameArchive(self._path, index_path) as archive:
+            self.assertEqual(len(archive), 6)
+            self.assertEqual(archive[5].players[0], ("Cole", "Black"))
+            self.assertEqual(archive[4].winner, "Black")
+            self.assertEqual([record.winner for record in archive], ["Black", None] * 3)
+
+    def test_empty_archive(self):
+        """Test that an archive with no games reads as empty"""
+
+        with open(self._path, "wb") as archive_file:
+            GameRecordWriter(archive_file)
+        self.assertEqual(list(read_games(self._path)), [])
+        self.assertEqual(len(build_index(self._path)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
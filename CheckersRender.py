@@ -0,0 +1,145 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains a BoardRenderer Class that draws a Checkers board as a compact text grid, with one glyph per
+# man, king and triple king and optional ANSI colors. Rendered boards are cached by position hash, and the diff mode
+# lists only the squares that changed between two positions and can write them as ANSI cursor updates for watchers
+# whose terminal already shows the earlier board.
+
+from collections import OrderedDict, namedtuple
+from CheckersGame import PIECE_NAMES, SQUARE_LOCATIONS
+
+
+# Glyphs indexed by piece code. ascii follows to_notation: uppercase for White, lowercase for Black, K for kings and T
+# for triple kings
+GLYPH_SETS = {
+    "ascii": ("M", "K", "T", "m", "k", "t"),
+    "unicode": ("⛀", "⛁", "♕", "⛂", "⛃", "♛"),
+}
+DARK_SQUARE = "."
+LIGHT_SQUARE = " "
+
+# ANSI escape sequences used when color is on, indexed by color index
+ANSI_COLORS = ("\x1b[1;97m", "\x1b[1;31m")
+ANSI_RESET = "\x1b[0m"
+
+# Returned by BoardRenderer.diff. before and after are piece names, or None for an empty square
+SquareChange = namedtuple("SquareChange", ["square_location", "before", "after"])
+
+
+class BoardRenderer:
+    """
+    Represents a board renderer that takes the name of a glyph set from GLYPH_SETS, whether to color pieces with ANSI
+    escapes, and how many rendered boards to keep. Boards are drawn with row numbers down the left and column numbers
+    across the top, row 0 first, like get_board.
+    """
+
+    def __init__(self, glyphs="ascii", color=False, cache_size=4096):
+        self._glyphs = GLYPH_SETS[glyphs]
+        self._color = color
+        if color:
+            self._pieces = tuple(f"{ANSI_COLORS[code // 3]}{glyph}{ANSI_RESET}"
+                                 for code, glyph in enumerate(self._glyphs))
+        else:
+            self._pieces = self._glyphs
+        # the grid with every dark square empty. render copies its pieces into _buffer, which is reused between calls
+        self._template = ["  " + " ".join(str(column) for column in range(8)) + "\n"]
+        self._cell_slots = []       # index in the template of each dark square, in SQUARE_LOCATIONS order
+        for row in range(8):
+            self._template.append(str(row))
+            for column in range(8):
+                if (row + column) % 2 == 1:
+                    self._cell_slots.append(len(self._template) + 1)
+                self._template += [" ", DARK_SQUARE if (row + column) % 2 == 1 else LIGHT_SQUARE]
+            self._template.append("\n")
+        self._buffer = list(self._template)
+        self._cache = OrderedDict()     # key=position hash, value=rendered board, least recently used first
+        self._cache_size = cache_size
+        self._hits = 0
+        self._misses = 0
+
+    def render(self, game):
+        """Returns the board of game, a Checkers object, as text. Boards already drawn come from the cache."""
+
+        position_hash = game.get_hash()
+        cache = self._cache
+        text = cache.get(position_hash)
+        if text is not None:
+            self._hits += 1
+            cache.move_to_end(position_hash)
+            return text
+        self._misses += 1
+        text = self.render_position(game.get_position())
+        cache[position_hash] = text
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+        return text
+
+    def render_position(self, position):
+        """Returns the board of position, a tuple from Checkers.get_position, as text without using the cache"""
+
+        buffer = self._buffer
+        buffer[:] = self._template
+        slots = self._cell_slots
+        pieces = self._pieces
+        for code in range(len(PIECE_NAMES)):
+            bitboard = position[code]
+            while bitboard:
+                low_bit = bitboard & -bitboard
+                buffer[slots[low_bit.bit_length() - 1]] = pieces[code]
+                bitboard ^= low_bit
+        return "".join(buffer)
+
+    def get_cache_info(self):
+        """Returns (cache hits, cache misses, boards cached)"""
+
+        return self._hits, self._misses, len(self._cache)
+
+    def clear_cache(self):
+        """Empties the cache and resets its counters"""
+
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @staticmethod
+    def diff(previous_position, game):
+        """
+        Returns a list of SquareChange for every square whose piece differs between previous_position, a tuple from
+        Checkers.get_position, and the board of game, in SQUARE_LOCATIONS order
+        """
+
+        position = game.get_position()
+        changed = 0
+        for code in range(len(PIECE_NAMES)):
+            changed |= previous_position[code] ^ position[code]
+        changes = []
+        while changed:
+            low_bit = changed & -changed
+            changes.append(SquareChange(SQUARE_LOCATIONS[low_bit.bit_length() - 1],
+                                        _piece_on(previous_position, low_bit), _piece_on(position, low_bit)))
+            changed ^= low_bit
+        return changes
+
+    def render_diff(self, previous_position, game, top=1, left=1):
+        """
+        Returns ANSI cursor movements that redraw only the squares that changed since previous_position, for a terminal
+        showing the board rendered from previous_position with its first line at line top and its first character at
+        column left (both counted from 1)
+        """
+
+        updates = []
+        for change in self.diff(previous_position, game):
+            row, column = change.square_location
+            glyph = self._pieces[PIECE_NAMES.index(change.after)] if change.after is not None else DARK_SQUARE
+            updates.append(f"\x1b[{top + 1 + row};{left + 2 + 2 * column}H{glyph}")
+        return "".join(updates)
+
+
+def _piece_on(position, bit):
+    """Returns the name of the piece on the square of bit in position, or None if it is empty"""
+
+    for code in range(len(PIECE_NAMES)):
+        if position[code] & bit:
+            return PIECE_NAMES[code]
+    return None
@@ -0,0 +1,66 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersRender. Tests the text grid, glyphs and ANSI colors, the position hash
+# cache, and the squares listed and redrawn by the diff mode.
+
+import unittest
+from CheckersGame import Checkers
+from CheckersRender import BoardRenderer, SquareChange, ANSI_RESET
+from CheckersFixtures import set_up_board
+
+
+class CheckersRenderTests(unittest.TestCase):
+
+    def test_render(self):
+        """Test the starting board and a board holding every kind of piece"""
+
+        renderer = BoardRenderer()
+        lines = renderer.render(Checkers()).split("\n")
+        self.assertEqual(lines[0], "  0 1 2 3 4 5 6 7")
+        self.assertEqual(lines[1], "0   M   M   M   M")
+        self.assertEqual(lines[4], "3 .   .   .   .  ")
+        self.assertEqual(lines[8], "7 m   m   m   m  ")
+        self.assertEqual(len(lines), 10)
+
+        game = set_up_board({(0, 1): "White_king", (2, 3): "White_Triple_King", (7, 6): "Black_king",
+                             (5, 4): "Black_Triple_King", (3, 2): "White", (4, 5): "Black"})
+        text = renderer.render(game)
+        for glyph in "KTktMm":
+            self.assertEqual(text.count(glyph), 1)
+        colored = BoardRenderer(glyphs="unicode", color=True).render(game)
+        self.assertEqual(colored.count(ANSI_RESET), 6)
+        self.assertIn("\x1b[1;31m♛", colored)
+
+    def test_cache(self):
+        """Test that a position is drawn once and then served from the cache"""
+
+        renderer = BoardRenderer(cache_size=2)
+        game = Checkers()
+        game.create_player("Sam", "White")
+        game.create_player("Faris", "Black")
+        first = renderer.render(game)
+        self.assertIs(renderer.render(game), first)
+        game.play_game("Faris", (5, 2), (4, 1))
+        renderer.render(game)
+        game.play_game("Sam", (2, 3), (3, 2))
+        renderer.render(game)
+        self.assertEqual(renderer.get_cache_info(), (1, 3, 2))
+        self.assertEqual(renderer.render(Checkers()), first)
+        self.assertEqual(renderer.get_cache_info(), (1, 4, 2))
+
+    def test_diff(self):
+        """Test that only the squares a jump changed are listed and redrawn"""
+
+        game = set_up_board({(5, 2): "Black", (4, 3): "White", (0, 1): "White"})
+        before = game.get_position()
+        game.play_game("Faris", (5, 2), (3, 4))
+        changes = BoardRenderer.diff(before, game)
+        self.assertEqual(changes, [SquareChange((3, 4), None, "Black"), SquareChange((4, 3), "White", None),
+                                   SquareChange((5, 2), "Black", None)])
+        self.assertEqual(BoardRenderer().render_diff(before, game), "\x1b[5;11Hm\x1b[6;9H.\x1b[7;7H.")
+        self.assertEqual(BoardRenderer.diff(game.get_position(), game), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,372 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains a CheckersServer Class that hosts many Checkers tables in one asyncio process and takes
+# requests as JSON lines over a TCP or Unix socket, a CheckersClient Class for talking to it, and a load test that plays
+# games over many connections and reports request latency percentiles.
+#
+# Protocol: every request is one JSON object on its own line and gets one JSON object back on its own line. Requests
+# name an "op" and may carry an "id", which is echoed in the response.
+#   {"op": "create"}                                            -> {"ok": true, "table": 1}
+#   {"op": "join", "table": 1, "name": "Sam", "color": "White"}  -> {"ok": true}
+#   {"op": "move", "table": 1, "name": "Sam", "start": [2, 1], "end": [3, 0]}
+#                                                               -> {"ok": true, "captured": 0, "turn": "Black",
+#                                                                   "jump_just_occurred": false, "winner": null}
+#   {"op": "state", "table": 1}        -> {"ok": true, "board": [...], "turn": "Black", "jump_just_occurred": false,
+#                                          "winner": null}
+#   {"op": "legal_moves", "table": 1, "color": "Black"}          -> {"ok": true, "moves": [[[5, 0], [4, 1]], ...]}
+#   {"op": "close", "table": 1}                                 -> {"ok": true}
+# A request that fails gets {"ok": false, "error": <name>, "message": <text>}. error is OutofTurn, InvalidPlayer or
+# InvalidSquare for moves play_game would reject, UnknownTable, or BadRequest for anything unreadable.
+
+import argparse
+import asyncio
+import json
+import time
+from collections import namedtuple
+from CheckersGame import Checkers, COLORS, OutofTurn, InvalidPlayer, InvalidSquare
+from CheckersFixtures import SCRIPTED_GAME
+
+
+MAX_LINE = 1 << 16      # longest request line accepted
+
+# Returned by load_test. Latencies are in milliseconds
+LoadTestResult = namedtuple("LoadTestResult", ["requests", "errors", "elapsed", "requests_per_second", "p50", "p90",
+                                               "p99", "max"])
+
+
+class BadRequest(Exception):
+    """Raised when a request is missing a field or has a field of the wrong kind"""
+    pass
+
+
+class UnknownTable(Exception):
+    """Raised when a request names a table the server isn't hosting"""
+    pass
+
+
+def percentile(sorted_values, fraction):
+    """Returns the nearest rank percentile of sorted_values, for fraction between 0 and 1, or 0.0 if it is empty"""
+
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def _square(request, field):
+    """Returns the (row, column) tuple in request[field]"""
+
+    value = request.get(field)
+    if not isinstance(value, list) or len(value) != 2 or not all(isinstance(number, int) for number in value):
+        raise BadRequest(f"{field} must be [row, column]")
+    return value[0], value[1]
+
+
+class CheckersServer:
+    """
+    Represents a server hosting Checkers tables, each a Checkers object, numbered from 1 as they are created.
+
+    handle_request answers one request dict, so the protocol can be used without a socket. serve_tcp and serve_unix
+    start listening and return the asyncio server. Every connection is a coroutine waiting on its next line, so idle
+    connections cost little more than their socket.
+    """
+
+    def __init__(self):
+        self._tables = {}       # key=table number, value=Checkers object
+        self._next_table = 1
+        self._connections = 0
+
+    def get_table(self, table):
+        """Returns the Checkers object for table number table"""
+
+        game = self._tables.get(table) if isinstance(table, int) else None
+        if game is None:
+            raise UnknownTable(f"There is no table {table}.")
+        return game
+
+    def get_table_count(self):
+        """Returns the number of tables being hosted"""
+
+        return len(self._tables)
+
+    def get_connection_count(self):
+        """Returns the number of open connections"""
+
+        return self._connections
+
+    def handle_request(self, request):
+        """Returns the response dict for request, a dict in the protocol described at the top of this module"""
+
+        try:
+            if not isinstance(request, dict):
+                raise BadRequest("A request must be a JSON object")
+            response = self._dispatch(request)
+            response["ok"] = True
+        except (OutofTurn, InvalidPlayer, InvalidSquare, UnknownTable, BadRequest) as error:
+            response = {"ok": False, "error": type(error).__name__, "message": str(error)}
+            if isinstance(error, InvalidSquare) and not error.args:     # squares off the board have no message
+                response["message"] = "That square is not on the board."
+        except (ValueError, TypeError) as error:        # fields play_move can't make sense of
+            response = {"ok": False, "error": "BadRequest", "message": str(error)}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    def _dispatch(self, request):
+        """Carries out request and returns the fields of its response"""
+
+        operation = request.get("op")
+        if operation == "create":
+            table = self._next_table
+            self._next_table += 1
+            self._tables[table] = Checkers()
+            return {"table": table}
+
+        game = self.get_table(request.get("table"))
+        if operation == "join":
+            name = request.get("name")
+            if not isinstance(name, str):
+                raise BadRequest("name must be a string")
+            game.add_player(name, request.get("color"))
+            return {}
+        if operation == "move":
+            captured = game.play_move(request.get("name"), _square(request, "start"), _square(request, "end"))
+            return {"captured": captured, "turn": game.get_which_players_turn(),
+                    "jump_just_occurred": game.get_jump_just_occurred(), "winner": self._winner(game)}
+        if operation == "state":
+            return {"board": game.get_board(), "turn": game.get_which_players_turn(),
+                    "jump_just_occurred": game.get_jump_just_occurred(), "winner": self._winner(game)}
+        if operation == "legal_moves":
+            color = request.get("color")
+            if color not in COLORS:
+                raise BadRequest("color must be White or Black")
+            return {"moves": game.legal_moves(color)}
+        if operation == "close":
+            del self._tables[request.get("table")]
+            return {}
+        raise BadRequest(f"Unknown op {operation}")
+
+    @staticmethod
+    def _winner(game):
+        """Returns game_winner's answer, or None if the game has not ended"""
+
+        winner = game.game_winner()
+        return None if winner == "Game has not ended" else winner
+
+    def handle_line(self, line):
+        """Returns the response line, as bytes, for one request line"""
+
+        try:
+            request = json.loads(line)
+        except ValueError:
+            response = {"ok": False, "error": "BadRequest", "message": "A request must be one line of JSON"}
+        else:
+            response = self.handle_request(request)
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+    async def _handle_connection(self, reader, writer):
+        """Answers request lines from one connection until it closes"""
+
+        self._connections += 1
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:      # a line longer than MAX_LINE
+                    writer.write(b'{"ok":false,"error":"BadRequest","message":"Request line too long"}\n')
+                    break
+                except ConnectionError:
+                    break
+                if not line:
+                    break
+                writer.write(self.handle_line(line))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._connections -= 1
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def wait_for_connections(self, timeout=5.0):
+        """Waits until every connection has closed, or until timeout seconds have passed"""
+
+        deadline = time.perf_counter() + timeout
+        while self._connections and time.perf_counter() < deadline:
+            await asyncio.sleep(0.01)
+
+    async def serve_tcp(self, host="127.0.0.1", port=0):
+        """Starts listening on host and port and returns the asyncio server. Port 0 picks a free port."""
+
+        return await asyncio.start_server(self._handle_connection, host, port, limit=MAX_LINE, backlog=1024)
+
+    async def serve_unix(self, path):
+        """Starts listening on the Unix socket at path and returns the asyncio server"""
+
+        return await asyncio.start_unix_server(self._handle_connection, path, limit=MAX_LINE, backlog=1024)
+
+
+class CheckersClient:
+    """
+    Represents one connection to a CheckersServer. Use the connect_tcp or connect_unix coroutines to open one.
+    request sends one request and waits for its response.
+    """
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 1
+
+    @classmethod
+    async def connect_tcp(cls, host, port):
+        """Returns a CheckersClient connected to host and port"""
+
+        reader, writer = await asyncio.open_connection(host, port, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    @classmethod
+    async def connect_unix(cls, path):
+        """Returns a CheckersClient connected to the Unix socket at path"""
+
+        reader, writer = await asyncio.open_unix_connection(path, limit=MAX_LINE)
+        return cls(reader, writer)
+
+    async def request(self, operation, **fields):
+        """Sends a request with op operation and fields, and returns the response dict"""
+
+        fields["op"] = operation
+        fields["id"] = self._next_id
+        self._next_id += 1
+        self._writer.write(json.dumps(fields, separators=(",", ":")).encode() + b"\n")
+        await self._writer.drain()
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("The server closed the connection")
+        return json.loads(line)
+
+    async def close(self):
+        """Closes the connection"""
+
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def _play_games(connect, games, latencies):
+    """Load test task: plays SCRIPTED_GAME games times over one connection, adding each request's latency to latencies"""
+
+    client = await connect()
+    errors = 0
+    try:
+        for _ in range(games):
+            start = time.perf_counter()
+            table = (await client.request("create"))["table"]
+            latencies.append(time.perf_counter() - start)
+            requests = [("join", {"table": table, "name": "Sam", "color": "White"}),
+                        ("join", {"table": table, "name": "Faris", "color": "Black"})]
+            requests += [("move", {"table": table, "name": name, "start": list(start_square), "end": list(end_square)})
+                         for name, start_square, end_square in SCRIPTED_GAME]
+            requests.append(("close", {"table": table}))
+            for operation, fields in requests:
+                start = time.perf_counter()
+                response = await client.request(operation, **fields)
+                latencies.append(time.perf_counter() - start)
+                if not response["ok"]:
+                    errors += 1
+    finally:
+        await client.close()
+    return errors
+
+
+async def load_test(connect, connections=100, games=5, idle=0):
+    """
+    Plays games scripted games over each of connections connections at once, while idle more connections stay open
+    without sending anything, and returns a LoadTestResult. connect is a coroutine function returning a new
+    CheckersClient.
+    """
+
+    idle_clients = [await connect() for _ in range(idle)]
+    latencies = []
+    start = time.perf_counter()
+    try:
+        errors = sum(await asyncio.gather(*(_play_games(connect, games, latencies) for _ in range(connections))))
+    finally:
+        elapsed = time.perf_counter() - start
+        for client in idle_clients:
+            await client.close()
+
+    latencies = sorted(latency * 1000 for latency in latencies)
+    return LoadTestResult(len(latencies), errors, elapsed, len(latencies) / elapsed if elapsed > 0 else 0.0,
+                          percentile(latencies, 0.5), percentile(latencies, 0.9), percentile(latencies, 0.99),
+                          latencies[-1] if latencies else 0.0)
+
+
+async def _serve_forever(args):
+    """Runs a server from the command line until it is interrupted"""
+
+    server = CheckersServer()
+    if args.unix:
+        listener = await server.serve_unix(args.unix)
+        print(f"serving on {args.unix}")
+    else:
+        listener = await server.serve_tcp(args.host, args.port)
+        print(f"serving on {args.host}:{listener.sockets[0].getsockname()[1]}")
+    async with listener:
+        await listener.serve_forever()
+
+
+async def _run_load_test(args):
+    """Runs a load test from the command line, starting a server in the same process unless one is named"""
+
+    server = listener = None
+    if args.unix:
+        async def connect():
+            return await CheckersClient.connect_unix(args.unix)
+    else:
+        port = args.port
+        if not port:
+            server = CheckersServer()
+            listener = await server.serve_tcp(args.host, 0)
+            port = listener.sockets[0].getsockname()[1]
+
+        async def connect():
+            return await CheckersClient.connect_tcp(args.host, port)
+    try:
+        result = await load_test(connect, args.connections, args.games, args.idle)
+    finally:
+        if listener is not None:
+            listener.close()
+            await listener.wait_closed()
+            await server.wait_for_connections()
+    print(f"{result.requests:,} requests, {result.errors} errors, {result.elapsed:.2f} sec, "
+          f"{result.requests_per_second:,.0f} requests/sec")
+    print(f"latency ms: p50 {result.p50:.3f}, p90 {result.p90:.3f}, p99 {result.p99:.3f}, max {result.max:.3f}")
+
+
+def main():
+    """Serves Checkers tables, or load tests a server, from the command line"""
+
+    parser = argparse.ArgumentParser(description="Host Checkers tables over a JSON lines socket protocol")
+    parser.add_argument("command", choices=["serve", "load-test"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="load-test starts its own server when no port is given")
+    parser.add_argument("--unix", help="Unix socket path to use instead of TCP")
+    parser.add_argument("--connections", type=int, default=100, help="connections playing games in a load test")
+    parser.add_argument("--games", type=int, default=5, help="games played over each connection in a load test")
+    parser.add_argument("--idle", type=int, default=0, help="extra connections left idle during a load test")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(_serve_forever(args) if args.command == "serve" else _run_load_test(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
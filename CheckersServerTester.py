@@ -0,0 +1,134 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersServer. Tests that requests are answered and errors become responses
+# without printing, and plays games over TCP and Unix socket connections with idle connections open.
+
+import asyncio
+import contextlib
+import io
+import os
+import socket
+import tempfile
+import unittest
+from CheckersServer import CheckersServer, CheckersClient, load_test, percentile
+
+
+class CheckersServerTests(unittest.TestCase):
+
+    def test_handle_request(self):
+        """Test a table being created, joined and played on, with errors answered instead of printed"""
+
+        server = CheckersServer()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            table = server.handle_request({"op": "create", "id": 7})
+            self.assertEqual(table, {"table": 1, "ok": True, "id": 7})
+            self.assertTrue(server.handle_request({"op": "join", "table": 1, "name": "Sam", "color": "White"})["ok"])
+            self.assertEqual(server.handle_request({"op": "join", "table": 1, "name": "Sam", "color": "Black"}),
+                             {"ok": False, "error": "InvalidPlayer", "message": "That name is already taken."})
+            self.assertTrue(server.handle_request({"op": "join", "table": 1, "name": "Faris", "color": "Black"})["ok"])
+
+            response = server.handle_request({"op": "move", "table": 1, "name": "Sam", "start": [2, 1],
+                                              "end": [3, 0]})
+            self.assertEqual(response["error"], "OutofTurn")
+            self.assertEqual(response["message"], "It is not your turn.")
+            response = server.handle_request({"op": "move", "table": 1, "name": "Faris", "start": [5, 0],
+                                              "end": [4, -1]})
+            self.assertEqual(response["error"], "InvalidSquare")
+            response = server.handle_request({"op": "move", "table": 1, "name": "Faris", "start": [5, 0],
+                                              "end": [4, 1]})
+            self.assertEqual(response, {"captured": 0, "turn": "White", "jump_just_occurred": False, "winner": None,
+                                        "ok": True})
+            self.assertEqual(server.handle_request({"op": "state", "table": 1})["board"][4][1], "Black")
+            self.assertEqual(len(server.handle_request({"op": "legal_moves", "table": 1, "color": "White"})["moves"]),
+                             7)
+            self.assertEqual(server.handle_request({"op": "move", "table": 2})["error"], "UnknownTable")
+            self.assertEqual(server.handle_request({"op": "move", "table": 1, "name": "Sam"})["error"], "BadRequest")
+            self.assertEqual(server.handle_line(b"not json\n")[:30], b'{"ok":false,"error":"BadReques')
+            self.assertTrue(server.handle_request({"op": "close", "table": 1})["ok"])
+        self.assertEqual(server.get_table_count(), 0)
+        self.assertEqual(output.getvalue(), "")
+
+    def test_rejected_move_keeps_turn(self):
+        """Test a rejected subsequent jump leaves the turn and jump flag as they were"""
+
+        server = CheckersServer()
+        server.handle_request({"op": "create"})
+        server.handle_request({"op": "join", "table": 1, "name": "Sam", "color": "White"})
+        server.handle_request({"op": "join", "table": 1, "name": "Faris", "color": "Black"})
+        for name, start, end in (("Faris", [5, 0], [4, 1]), ("Sam", [2, 3], [3, 2]), ("Faris", [4, 1], [2, 3])):
+            self.assertTrue(server.handle_request({"op": "move", "table": 1, "name": name, "start": start,
+                                                   "end": end})["ok"])
+
+        response = server.handle_request({"op": "move", "table": 1, "name": "Faris", "start": [4, 1], "end": [2, 3]})
+        self.assertEqual(response["error"], "InvalidSquare")
+        state = server.handle_request({"op": "state", "table": 1})
+        self.assertEqual(state["turn"], "White")
+        self.assertTrue(state["jump_just_occurred"])
+        self.assertEqual(server.handle_request({"op": "move", "table": 1, "name": "Faris", "start": [5, 2],
+                                                "end": [4, 3]})["error"], "OutofTurn")
+
+    def test_percentile(self):
+        """Test nearest rank percentiles"""
+
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 0.5), 50)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile(values, 1.0), 100)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+    def test_tcp_load_test(self):
+        """Play games over TCP while idle connections stay open"""
+
+        async def run():
+            server = CheckersServer()
+            listener = await server.serve_tcp()
+            port = listener.sockets[0].getsockname()[1]
+
+            async def connect():
+                return await CheckersClient.connect_tcp("127.0.0.1", port)
+
+            idle = [await connect() for _ in range(200)]
+            result = await load_test(connect, connections=5, games=2)
+            connections = server.get_connection_count()
+            for client in idle:
+                await client.close()
+            listener.close()
+            await listener.wait_closed()
+            await server.wait_for_connections()
+            return result, connections, server.get_table_count()
+
+        result, connections, tables = asyncio.run(run())
+        self.assertEqual(result.errors, 0)
+        self.assertEqual(result.requests, 5 * 2 * 49)      # create, two joins, 45 moves and close per game
+        self.assertLessEqual(result.p50, result.p99)
+        self.assertEqual(connections, 200)
+        self.assertEqual(tables, 0)
+
+    @unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+    def test_unix_socket(self):
+        """Test a table being played on over a Unix socket"""
+
+        async def run(path):
+            server = CheckersServer()
+            listener = await server.serve_unix(path)
+            client = await CheckersClient.connect_unix(path)
+            table = (await client.request("create"))["table"]
+            await client.request("join", table=table, name="Cole", color="White")
+            await client.request("join", table=table, name="Sami", color="Black")
+            response = await client.request("move", table=table, name="Sami", start=[5, 0], end=[4, 1])
+            await client.close()
+            listener.close()
+            await listener.wait_closed()
+            await server.wait_for_connections()
+            return response
+
+        with tempfile.TemporaryDirectory() as directory:
+            response = asyncio.run(run(os.path.join(directory, "checkers.sock")))
+        self.assertTrue(response["ok"])
+        self.assertEqual(response["turn"], "White")
+
+
+if __name__ == '__main__':
+    unittest.main()
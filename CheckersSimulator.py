@@ -0,0 +1,179 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Plays many Checkers games between computer move policies (random, greedy capture and engine search)
+# through play_game, spread across worker processes. Each finished game is written to a JSON lines file as soon as its
+# batch comes back, and the run reports games per second.
+
+import argparse
+import contextlib
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from CheckersGame import Checkers, COLORS
+from CheckersEngine import CheckersEngine, side_to_move
+
+
+# Each color's player is named after the color so records read naturally
+PLAYER_NAMES = {"White": "White", "Black": "Black"}
+
+# A policy is called as policy(game, color, moves, rng) with the moves color may make and returns one of them
+
+
+def random_policy(game, color, moves, rng):
+    """Picks any of moves"""
+
+    return rng.choice(moves)
+
+
+def greedy_capture_policy(game, color, moves, rng):
+    """Picks the move that captures the most pieces, choosing at random between equally good moves"""
+
+    best_moves = []
+    most_captured = -1
+    for move in moves:
+        captured = game.make_move(move)
+        game.unmake_move()
+        if captured > most_captured:
+            most_captured = captured
+            best_moves = [move]
+        elif captured == most_captured:
+            best_moves.append(move)
+    return rng.choice(best_moves)
+
+
+def make_search_policy(max_depth=4, time_budget=0.1):
+    """Returns a policy that picks the move a CheckersEngine finds in a max_depth or time_budget search"""
+
+    engine = CheckersEngine(table_size=1 << 16, time_budget=time_budget, max_depth=max_depth)
+
+    def search_policy(game, color, moves, rng):
+        return engine.search(game, color).move
+
+    return search_policy
+
+
+def make_policy(name, max_depth=4, time_budget=0.1):
+    """Returns the policy called name: "random", "greedy" or "search". The search options only apply to "search"."""
+
+    if name == "random":
+        return random_policy
+    if name == "greedy":
+        return greedy_capture_policy
+    if name == "search":
+        return make_search_policy(max_depth, time_budget)
+    raise ValueError(f"Unknown policy {name}")
+
+
+def play_one_game(white_policy, black_policy, rng, max_moves=300):
+    """
+    Plays one game through play_game and returns a dict record with the moves as [color, start, destination], the
+    winner, each color's total captured pieces and the number of moves.
+    After a jump, the player who jumped keeps going while they can capture. A player with no move loses, and a game
+    still going after max_moves has no winner.
+    """
+
+    game = Checkers()
+    for color in COLORS:
+        game.create_player(PLAYER_NAMES[color], color)
+    policies = (white_policy, black_policy)
+    moves_played = []
+    winner = None
+
+    while len(moves_played) < max_moves:
+        winner = game.game_winner()
+        if winner != "Game has not ended":
+            break
+        color_index, moves = side_to_move(game)     # game_winner has checked there is a move to make
+        move = policies[color_index](game, COLORS[color_index], moves, rng)
+        game.play_game(PLAYER_NAMES[COLORS[color_index]], move[0], move[1])
+        moves_played.append([COLORS[color_index], list(move[0]), list(move[1])])
+    else:
+        winner = game.game_winner()
+
+    if winner == "Game has not ended":
+        winner = None
+    return {
+        "moves": moves_played,
+        "winner": winner,
+        "captured": {color: game.get_player(PLAYER_NAMES[color]).get_total_captured_pieces_count()
+                     for color in COLORS},
+        "move_count": len(moves_played),
+    }
+
+
+def play_games(white, black, number_of_games, seed, max_moves=300, max_depth=4, time_budget=0.1):
+    """
+    Process pool task: plays number_of_games games between the policies named white and black and returns their
+    records. Anything play_game prints is thrown away.
+    """
+
+    rng = random.Random(seed)
+    white_policy = make_policy(white, max_depth, time_budget)
+    black_policy = make_policy(black, max_depth, time_budget)
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        return [play_one_game(white_policy, black_policy, rng, max_moves) for _ in range(number_of_games)]
+
+
+def run_simulation(number_of_games, output_path, white="random", black="random", workers=None, batch_size=50,
+                   seed=0, max_moves=300, max_depth=4, time_budget=0.1):
+    """
+    Plays number_of_games games on a pool of workers processes in batches of batch_size, appending one JSON record per
+    game to output_path as batches finish. Returns a summary dict with the number of games, wins per color, draws,
+    elapsed seconds and games per second.
+    """
+
+    start = time.perf_counter()
+    summary = {"games": 0, "wins": {color: 0 for color in COLORS}, "draws": 0}
+    batches = []
+    remaining = number_of_games
+    while remaining > 0:
+        batches.append(min(batch_size, remaining))
+        remaining -= batch_size
+
+    with ProcessPoolExecutor(max_workers=workers) as executor, open(output_path, "w") as output:
+        futures = [executor.submit(play_games, white, black, size, seed + batch_number, max_moves, max_depth,
+                                   time_budget)
+                   for batch_number, size in enumerate(batches)]
+        for future in futures:
+            for record in future.result():
+                output.write(json.dumps(record) + "\n")
+                summary["games"] += 1
+                if record["winner"] is None:
+                    summary["draws"] += 1
+                else:
+                    summary["wins"][record["winner"]] += 1
+            output.flush()
+
+    summary["elapsed"] = time.perf_counter() - start
+    summary["games_per_second"] = summary["games"] / summary["elapsed"] if summary["elapsed"] > 0 else 0.0
+    return summary
+
+
+def main():
+    """Runs a simulation from the command line and prints its summary"""
+
+    parser = argparse.ArgumentParser(description="Play Checkers games between computer policies")
+    parser.add_argument("games", type=int, help="number of games to play")
+    parser.add_argument("output", help="JSON lines file the game records are written to")
+    parser.add_argument("--white", default="random", choices=["random", "greedy", "search"])
+    parser.add_argument("--black", default="random", choices=["random", "greedy", "search"])
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, defaults to the CPU count")
+    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-moves", type=int, default=300)
+    parser.add_argument("--depth", type=int, default=4, help="search policy depth")
+    parser.add_argument("--time-budget", type=float, default=0.1, help="search policy seconds per move")
+    args = parser.parse_args()
+
+    summary = run_simulation(args.games, args.output, args.white, args.black, args.workers, args.batch_size,
+                             args.seed, args.max_moves, args.depth, args.time_budget)
+    print(f"{summary['games']} games in {summary['elapsed']:.2f} sec, {summary['games_per_second']:,.1f} games/sec")
+    print(f"White wins: {summary['wins']['White']}, Black wins: {summary['wins']['Black']}, "
+          f"draws: {summary['draws']}")
+
+
+if __name__ == '__main__':
+    main()
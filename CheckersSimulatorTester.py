@@ -0,0 +1,46 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersSimulator. Tests that game records replay to the same result and that a
+# simulation run writes one record per game.
+
+import json
+import os
+import random
+import tempfile
+import unittest
+from CheckersGame import Checkers
+from CheckersSimulator import play_one_game, random_policy, greedy_capture_policy, run_simulation
+
+
+class CheckersSimulatorTests(unittest.TestCase):
+
+    def test_record_replays(self):
+        """Test that the moves in a record replay through play_game to the recorded captures"""
+
+        record = play_one_game(random_policy, greedy_capture_policy, random.Random(3))
+        self.assertEqual(record["move_count"], len(record["moves"]))
+        game = Checkers()
+        game.create_player("White", "White")
+        game.create_player("Black", "Black")
+        for color, starting_square_location, destination_square_location in record["moves"]:
+            game.play_game(color, tuple(starting_square_location), tuple(destination_square_location))
+        self.assertEqual(game.get_player("White").get_total_captured_pieces_count(), record["captured"]["White"])
+        self.assertEqual(game.get_player("Black").get_total_captured_pieces_count(), record["captured"]["Black"])
+
+    def test_run_simulation(self):
+        """Test that a simulation writes every game and counts the results"""
+
+        with tempfile.TemporaryDirectory() as directory:
+            output_path = os.path.join(directory, "games.jsonl")
+            summary = run_simulation(7, output_path, "random", "greedy", workers=2, batch_size=3)
+            with open(output_path) as records:
+                lines = [json.loads(line) for line in records]
+        self.assertEqual(summary["games"], 7)
+        self.assertEqual(len(lines), 7)
+        self.assertEqual(summary["wins"]["White"] + summary["wins"]["Black"] + summary["draws"], 7)
+        self.assertGreater(summary["games_per_second"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,401 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Builds endgame tablebases for Checkers positions with only a few pieces left, and contains a Tablebase
+# Class that probes them. Every position of a material signature (how many men, kings and triple kings each color has)
+# is solved by retrograde iteration to win, loss or draw for the player to move, with the number of moves to the end.
+# Each signature is saved as its own file of 2 byte entries that Tablebase memory maps, so a probe is one array read.
+#
+# Entry bits: 0-1 result (0 draw, 1 win, 2 loss, 3 not a possible position), 2-14 moves until the game ends with best
+# play, 15 color index of the player to move. The player to move is the one CheckersEngine.side_to_move names, so a
+# player who just jumped and can capture again is the one to move.
+
+import argparse
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections import namedtuple
+from itertools import combinations
+from math import comb
+from CheckersGame import Checkers, COLORS, SQUARE_LOCATIONS
+from CheckersEngine import side_to_move
+
+
+DRAW, WIN, LOSS, IMPOSSIBLE = 0, 1, 2, 3
+RESULT_NAMES = ("draw", "win", "loss", "impossible")
+MAX_DISTANCE = (1 << 13) - 1
+
+# COMBINATIONS[n][k] is the number of ways to choose k of the first n squares, used to rank a set of squares
+COMBINATIONS = tuple(tuple(comb(n, k) for k in range(13)) for n in range(33))
+
+# Men can never stand on the row where they would have been promoted
+PROMOTION_ROW_MASKS = (sum(1 << index for index, (row, column) in enumerate(SQUARE_LOCATIONS) if row == 7),
+                       sum(1 << index for index, (row, column) in enumerate(SQUARE_LOCATIONS) if row == 0))
+
+# Returned by Tablebase.probe. result is DRAW, WIN or LOSS for the player with color index to_move, and distance is the
+# number of moves (plies) until the game ends with best play
+ProbeResult = namedtuple("ProbeResult", ["result", "distance", "to_move"])
+
+
+def popcount(bitboard):
+    """Returns the number of squares set in bitboard"""
+
+    return bin(bitboard).count("1")
+
+
+def signature_of(bitboards):
+    """Returns the material signature of bitboards: the number of pieces of each piece code"""
+
+    return tuple(popcount(bitboard) for bitboard in bitboards)
+
+
+def signature_name(signature):
+    """Returns the file name stem for signature, for example W100B001 for a White man against a Black triple king"""
+
+    return "W" + "".join(str(count) for count in signature[:3]) + "B" + "".join(str(count) for count in signature[3:])
+
+
+def signature_size(signature):
+    """Returns the number of entries in signature's table"""
+
+    size = 4        # who is up, and whether a jump just occurred
+    for count in signature:
+        size *= COMBINATIONS[32][count]
+    return size
+
+
+def rank_squares(bitboard):
+    """Returns the colex rank of the set of squares in bitboard among all sets of the same size"""
+
+    rank = 0
+    count = 0
+    while bitboard:
+        low_bit = bitboard & -bitboard
+        count += 1
+        rank += COMBINATIONS[low_bit.bit_length() - 1][count]
+        bitboard ^= low_bit
+    return rank
+
+
+def position_index(position, signature):
+    """Returns the entry number of position, a Checkers.get_position tuple, in signature's table"""
+
+    index = 0
+    for code in range(6):
+        index = index * COMBINATIONS[32][signature[code]] + rank_squares(position[code])
+    return index * 4 + position[6] * 2 + position[7]
+
+
+def signatures_up_to(max_pieces):
+    """
+    Returns every signature with both colors on the board and at most max_pieces pieces, in the order they must be
+    built: fewer pieces first, and among equal counts the ones with less promotion left to happen first, since captures
+    remove pieces and promotions only raise ranks.
+    """
+
+    signatures = []
+    for total in range(2, max_pieces + 1):
+        for pieces in _compositions(total, 6):
+            if sum(pieces[:3]) and sum(pieces[3:]):
+                signatures.append(pieces)
+    return sorted(signatures, key=lambda pieces: (sum(pieces), 2 * (pieces[0] + pieces[3]) + pieces[1] + pieces[4]))
+
+
+def _compositions(total, parts):
+    """Generates every tuple of parts non negative integers adding up to total"""
+
+    if parts == 1:
+        yield (total,)
+        return
+    for first in range(total + 1):
+        for rest in _compositions(total - first, parts - 1):
+            yield (first,) + rest
+
+
+def _placements(signature):
+    """Generates every tuple of six bitboards with signature's piece counts on distinct squares"""
+
+    def place(code, used, bitboards):
+        if code == 6:
+            yield tuple(bitboards)
+            return
+        free = [index for index in range(32) if not used >> index & 1]
+        for squares in combinations(free, signature[code]):
+            bitboard = 0
+            for index in squares:
+                bitboard |= 1 << index
+            yield from place(code + 1, used | bitboard, bitboards + [bitboard])
+
+    yield from place(0, 0, [])
+
+
+class TablebaseBuilder:
+    """
+    Represents a tablebase being built into a directory, for positions with up to max_pieces pieces.
+    build solves every signature in dependency order and writes one file per signature.
+    """
+
+    def __init__(self, directory, max_pieces=3):
+        self._directory = directory
+        self._max_pieces = max_pieces
+        self._tables = {}       # key=signature, value=array of entries for signatures already solved
+
+    def build(self, progress=None):
+        """Solves and saves every signature. progress, if given, is called with each signature name when it is done."""
+
+        os.makedirs(self._directory, exist_ok=True)
+        for signature in signatures_up_to(self._max_pieces):
+            table = self.solve(signature)
+            self._tables[signature] = table
+            save_table(table, os.path.join(self._directory, signature_name(signature) + ".tb"))
+            if progress is not None:
+                progress(signature_name(signature))
+
+    def _external_value(self, position):
+        """
+        Returns (result, distance, color index to move) for a position outside the signature being solved. It has
+        fewer pieces or more promoted ones, so its table is already built, or one color has nothing left.
+        """
+
+        signature = signature_of(position[:6])
+        if not sum(signature[:3]) or not sum(signature[3:]):
+            loser = 0 if not sum(signature[:3]) else 1
+            # the position is finished, it counts as lost for the player with no pieces
+            return LOSS, 0, loser
+        entry = self._tables[signature][position_index(position, signature)]
+        return entry & 3, entry >> 2 & MAX_DISTANCE, entry >> 15
+
+    def solve(self, signature):
+        """Returns the array of entries for signature. Every smaller or more promoted signature must be solved first."""
+
+        size = signature_size(signature)
+        entries = array("H", [IMPOSSIBLE]) * size
+        results = bytearray(size)       # DRAW until proven otherwise
+        distances = array("H", [0]) * size
+        to_move = bytearray(size)
+        successors = {}     # key=entry number, value=list of entry numbers in this table, and whether the same player moves
+        external = {}       # key=entry number, value=list of (result, distance) of positions outside this table, for
+        #                     the player to move in the entry
+        game = Checkers()
+
+        for bitboards in _placements(signature):
+            if bitboards[0] & PROMOTION_ROW_MASKS[0] or bitboards[3] & PROMOTION_ROW_MASKS[1]:
+                continue
+            for turn_index in (0, 1):
+                for jump in (0, 1):
+                    position = bitboards + (turn_index, jump)
+                    index = position_index(position, signature)
+                    game.set_position(position)
+                    color_index, moves = side_to_move(game)
+                    to_move[index] = color_index
+                    entries[index] = DRAW
+                    if not moves:       # blocked
+                        results[index] = LOSS
+                        continue
+                    inside = []
+                    outside = []
+                    for move in moves:
+                        game.make_move(move)
+                        child = game.get_position()
+                        if signature_of(child[:6]) == signature:
+                            inside.append(position_index(child, signature))
+                        else:
+                            child_result, child_distance, child_to_move = self._external_value(child)
+                            if child_to_move != color_index and child_result != DRAW:
+                                child_result = WIN if child_result == LOSS else LOSS
+                            outside.append((child_result, child_distance))
+                        game.unmake_move()
+                    successors[index] = inside
+                    external[index] = outside
+
+        # the player to move in each child is looked up once every entry's player is known
+        for index, inside in successors.items():
+            successors[index] = [(child, to_move[child] == to_move[index]) for child in inside]
+
+        self._iterate(successors, external, results, distances)
+
+        for index, inside in successors.items():
+            entries[index] = results[index] | min(distances[index], MAX_DISTANCE) << 2 | to_move[index] << 15
+        for index in range(size):       # blocked positions have no successors
+            if entries[index] == DRAW and results[index] == LOSS:
+                entries[index] = LOSS | to_move[index] << 15
+        return entries
+
+    @staticmethod
+    def _iterate(successors, external, results, distances):
+        """
+        Repeats passes over the unsolved positions until none change. Child values are turned around to the point of
+        view of the player choosing the move, so a position is won if some move wins and lost if every move loses.
+        Distances are then tightened until stable: the fastest win and the slowest loss.
+        """
+
+        def child_value(child, same_player):
+            result = results[child]
+            if not same_player and result != DRAW:
+                result = WIN if result == LOSS else LOSS
+            return result, distances[child]
+
+        unsolved = [index for index in successors if results[index] == DRAW]
+        changed = True
+        while changed:
+            changed = False
+            still_unsolved = []
+            for index in unsolved:
+                wins = []
+                all_lost = True
+                for result, distance in ([child_value(child, same) for child, same in successors[index]] +
+                                         external[index]):
+                    if result == WIN:       # this move wins
+                        wins.append(distance)
+                    elif result == DRAW:
+                        all_lost = False
+                if wins:
+                    results[index] = WIN
+                    distances[index] = min(wins) + 1
+                    changed = True
+                elif all_lost:
+                    results[index] = LOSS
+                    distances[index] = max(distance for result, distance in
+                                           [child_value(child, same) for child, same in successors[index]] +
+                                           external[index]) + 1
+                    changed = True
+                else:
+                    still_unsolved.append(index)
+            unsolved = still_unsolved
+
+        solved = [index for index in successors if results[index] != DRAW]
+        for _ in range(MAX_DISTANCE):
+            changed = False
+            for index in solved:
+                values = [child_value(child, same) for child, same in successors[index]] + external[index]
+                if results[index] == WIN:
+                    distance = min(distance for result, distance in values if result == WIN) + 1
+                else:
+                    distance = max(distance for result, distance in values) + 1
+                distance = min(distance, MAX_DISTANCE)
+                if distance != distances[index]:
+                    distances[index] = distance
+                    changed = True
+            if not changed:
+                break
+
+
+def save_table(entries, path):
+    """Writes entries to path as little endian 2 byte values"""
+
+    entries = array("H", entries)
+    if sys.byteorder == "big":
+        entries.byteswap()
+    with open(path, "wb") as table_file:
+        table_file.write(entries.tobytes())
+
+
+def build_tablebase(directory, max_pieces=3, progress=None):
+    """Builds the tablebase for up to max_pieces pieces into directory"""
+
+    TablebaseBuilder(directory, max_pieces).build(progress)
+
+
+class Tablebase:
+    """
+    Represents a built tablebase that takes the directory it was built into. Tables are memory mapped the first time a
+    position with their signature is probed, so opening a tablebase reads nothing.
+    Use as a context manager or call close when done.
+    """
+
+    def __init__(self, directory):
+        self._directory = directory
+        self._tables = {}       # key=signature, value=mmap of its table, or None if there is no file for it
+        self._max_pieces = 0
+        for file_name in os.listdir(directory):
+            if file_name.endswith(".tb"):
+                self._max_pieces = max(self._max_pieces, sum(int(digit) for digit in file_name[:-3] if digit.isdigit()))
+
+    def get_max_pieces(self):
+        """Returns the most pieces any table covers"""
+
+        return self._max_pieces
+
+    def _table(self, signature):
+        """Returns the mmap for signature's table, or None if it was not built"""
+
+        if signature not in self._tables:
+            path = os.path.join(self._directory, signature_name(signature) + ".tb")
+            table = None
+            if os.path.exists(path):
+                with open(path, "rb") as table_file:
+                    table = mmap.mmap(table_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._tables[signature] = table
+        return self._tables[signature]
+
+    def probe_position(self, position):
+        """
+        Returns the ProbeResult for position, a Checkers.get_position tuple, or None if the tablebase doesn't cover it
+        """
+
+        signature = signature_of(position[:6])
+        if sum(signature) > self._max_pieces:
+            return None
+        if not sum(signature[:3]) or not sum(signature[3:]):
+            return ProbeResult(LOSS, 0, 0 if not sum(signature[:3]) else 1)
+        table = self._table(signature)
+        if table is None:
+            return None
+        offset = position_index(position, signature) * 2
+        entry = table[offset] | table[offset + 1] << 8
+        if entry & 3 == IMPOSSIBLE:
+            return None
+        return ProbeResult(entry & 3, entry >> 2 & MAX_DISTANCE, entry >> 15)
+
+    def probe(self, game):
+        """Returns the ProbeResult for the position in game, a Checkers object, or None if it isn't covered"""
+
+        return self.probe_position(game.get_position())
+
+    def adjudicate(self, game):
+        """
+        Returns the name of the player who wins game with best play, "Draw" if neither can force a win, or None if the
+        position isn't covered or the winning color has no player
+        """
+
+        result = self.probe(game)
+        if result is None:
+            return None
+        if result.result == DRAW:
+            return "Draw"
+        winner_index = result.to_move if result.result == WIN else 1 - result.to_move
+        player_object = game.get_player_by_color(COLORS[winner_index])
+        return player_object.get_name() if player_object is not None else None
+
+    def close(self):
+        """Unmaps every open table"""
+
+        for table in self._tables.values():
+            if table is not None:
+                table.close()
+        self._tables = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def main():
+    """Builds a tablebase from the command line, printing each signature as it is finished"""
+
+    parser = argparse.ArgumentParser(description="Build a Checkers endgame tablebase")
+    parser.add_argument("directory", help="directory to write the tables to")
+    parser.add_argument("--max-pieces", type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    build_tablebase(args.directory, args.max_pieces,
+                    lambda name: print(f"{name} done at {time.perf_counter() - start:.1f} sec"))
+
+
+if __name__ == '__main__':
+    main()
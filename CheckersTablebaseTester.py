@@ -0,0 +1,101 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersTablebase. Builds a two piece tablebase and tests position indexing,
+# probing wins, losses and draws, adjudication and searching with the tablebase.
+
+import os
+import tempfile
+import unittest
+from CheckersGame import Checkers
+from CheckersEngine import CheckersEngine, WIN_SCORE
+from CheckersFixtures import set_up_board
+from CheckersTablebase import (Tablebase, build_tablebase, position_index, signature_of, signature_size,
+                               signatures_up_to, DRAW, WIN, LOSS)
+
+
+class CheckersTablebaseTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._directory = tempfile.TemporaryDirectory()
+        build_tablebase(cls._directory.name, 2)
+        cls._tablebase = Tablebase(cls._directory.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tablebase.close()
+        cls._directory.cleanup()
+
+    def test_files(self):
+        """Test that one file of 2 byte entries is written for every two piece signature"""
+
+        signatures = signatures_up_to(2)
+        self.assertEqual(len(signatures), 9)
+        for signature in signatures:
+            self.assertEqual(sum(signature[:3]), 1)
+            self.assertEqual(sum(signature[3:]), 1)
+        self.assertEqual(len(os.listdir(self._directory.name)), 9)
+        self.assertEqual(self._tablebase.get_max_pieces(), 2)
+
+    def test_position_index(self):
+        """Test that every position of a signature has its own index"""
+
+        game = set_up_board({(0, 1): "White_king", (7, 0): "Black"})
+        signature = signature_of(game.get_position()[:6])
+        indexes = set()
+        for white_square in range(32):
+            for black_square in range(32):
+                if white_square != black_square:
+                    for turn in range(2):
+                        for jump in range(2):
+                            position = (0, 1 << white_square, 0, 1 << black_square, 0, 0, turn, jump)
+                            indexes.add(position_index(position, signature))
+        self.assertEqual(len(indexes), 32 * 31 * 4)
+        self.assertLess(max(indexes), signature_size(signature))
+
+    def test_probe(self):
+        """Test wins, losses and draws with their distances"""
+
+        # the triple king catches the man before it can be promoted
+        result = self._tablebase.probe(set_up_board({(0, 7): "White", (7, 0): "Black_Triple_King"}))
+        self.assertEqual((result.result, result.distance, result.to_move), (WIN, 3, 1))
+
+        # the only move steps onto the white king's diagonal
+        result = self._tablebase.probe(set_up_board({(0, 7): "White_king", (7, 0): "Black_king"}))
+        self.assertEqual((result.result, result.distance), (LOSS, 2))
+
+        # a capture ends the game at once
+        result = self._tablebase.probe(set_up_board({(4, 3): "White", (5, 2): "Black"}))
+        self.assertEqual((result.result, result.distance), (WIN, 1))
+
+        result = self._tablebase.probe(set_up_board({(2, 1): "White_king", (7, 0): "Black_Triple_King"}))
+        self.assertEqual(result.result, DRAW)
+
+    def test_probe_not_covered(self):
+        """Test that positions with too many pieces aren't covered"""
+
+        game = Checkers()
+        self.assertIsNone(self._tablebase.probe(game))
+        self.assertIsNone(self._tablebase.adjudicate(game))
+
+    def test_adjudicate(self):
+        """Test that adjudicate names the winner with best play"""
+
+        self.assertEqual(self._tablebase.adjudicate(set_up_board({(0, 7): "White", (7, 0): "Black_Triple_King"})),
+                         "Faris")
+        self.assertEqual(self._tablebase.adjudicate(set_up_board({(0, 7): "White_king", (7, 0): "Black_king"})),
+                         "Sam")
+        self.assertEqual(self._tablebase.adjudicate(set_up_board({(2, 1): "White_king",
+                                                                  (7, 0): "Black_Triple_King"})), "Draw")
+
+    def test_engine(self):
+        """Test that a shallow search with the tablebase sees the win the tablebase knows"""
+
+        game = set_up_board({(0, 7): "White", (7, 0): "Black_Triple_King"})
+        result = CheckersEngine(tablebase=self._tablebase).search(game, "Black", max_depth=1)
+        self.assertEqual(result.score, WIN_SCORE - 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Replays logged Checkers games in bulk through the print free play_move and reports, for each game, the
+# first move play_game would reject (or, in strict mode, any move legal_moves doesn't list) along with the final
+# position and winner. Logs are checked in chunks across worker processes.
+
+import argparse
+import json
+import os
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from CheckersGame import Checkers, InvalidPlayer, InvalidSquare, OutofTurn
+
+
+# A move log is a dict with "players", a list of [name, color] in creation order, and "moves", a list of
+# [player_name, [start row, start column], [destination row, destination column]].
+# Logs without "players" are taken to name each player after their color, as CheckersSimulator does.
+DEFAULT_PLAYERS = (("White", "White"), ("Black", "Black"))
+
+# Returned for every log. illegal_move_number is the 0 based position of the first bad move (None if every move was
+# accepted), error describes it, position is the Checkers.get_position tuple after the last accepted move and winner is
+# game_winner's answer at that point
+ValidationResult = namedtuple("ValidationResult", ["game_number", "valid", "illegal_move_number", "illegal_move",
+                                                   "error", "moves_played", "position", "winner"])
+
+
+def validate_log(log, game_number=0, strict=False):
+    """
+    Replays one move log and returns its ValidationResult.
+    Replay stops at the first move play_move raises on. With strict, a move is also illegal if legal_moves doesn't list
+    it for the player making it. A log that isn't a dict, a log without moves, or one with a move that isn't
+    [name, start, destination], is invalid too, with illegal_move_number None when no move was reached.
+    """
+
+    game = Checkers()
+    if not isinstance(log, dict):
+        return ValidationResult(game_number, False, None, None, "Malformed log", 0, game.get_position(),
+                                "Game has not ended")
+    try:
+        for name, color in log.get("players", DEFAULT_PLAYERS):
+            game.add_player(name, color)
+    except (InvalidPlayer, ValueError, TypeError):
+        return ValidationResult(game_number, False, None, None, "Invalid players", 0, game.get_position(),
+                                "Game has not ended")
+
+    illegal_move_number = None
+    illegal_move = None
+    error = None
+    moves_played = 0
+    entry = None        # the move being replayed, None between moves
+    try:
+        for entry in log["moves"]:
+            player_name, starting_square_location, destination_square_location = entry
+            entry = (player_name, tuple(starting_square_location), tuple(destination_square_location))
+            if strict:
+                player_object = game.get_player(player_name)
+                if player_object is None:
+                    raise InvalidPlayer("You are not a player in this game.")
+                if entry[1:] not in game.legal_moves(player_object.get_checker_color()):
+                    raise InvalidSquare("That move is not allowed by the rules.")
+            game.play_move(player_name, entry[1], entry[2])
+            moves_played += 1
+            entry = None
+    except (InvalidPlayer, OutofTurn, InvalidSquare, KeyError, ValueError, TypeError) as exception:
+        if entry is not None:
+            illegal_move_number = moves_played
+            illegal_move = entry
+        error = f"{type(exception).__name__}: {exception}" if str(exception) else type(exception).__name__
+
+    return ValidationResult(game_number, error is None, illegal_move_number, illegal_move, error, moves_played,
+                            game.get_position(), game.game_winner())
+
+
+def validate_chunk(logs, first_game_number, strict):
+    """Process pool task: validates a list of logs numbered from first_game_number"""
+
+    return [validate_log(log, first_game_number + offset, strict) for offset, log in enumerate(logs)]
+
+
+def validate_logs(logs, workers=None, chunk_size=200, strict=False):
+    """
+    Generates a ValidationResult for every log in logs, an iterable of move logs, in the order given.
+    Logs are sent to a pool of workers processes chunk_size at a time. Only a few chunks per worker are in flight,
+    so logs can come from a file too large to hold in memory.
+    """
+
+    logs = iter(logs)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        limit = 2 * (workers or os.cpu_count() or 1)
+        game_number = 0
+        while True:
+            while len(in_flight) < limit:
+                chunk = list(islice(logs, chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(validate_chunk, chunk, game_number, strict))
+                game_number += len(chunk)
+            if not in_flight:
+                return
+            for result in in_flight.popleft().result():
+                yield result
+
+
+def read_logs(path):
+    """Generates the move logs in a JSON lines file such as the one CheckersSimulator writes"""
+
+    with open(path) as log_file:
+        for line in log_file:
+            if line.strip():
+                yield json.loads(line)
+
+
+def main():
+    """Validates a JSON lines file of move logs from the command line and prints each bad game and a summary"""
+
+    parser = argparse.ArgumentParser(description="Replay and check logged Checkers games")
+    parser.add_argument("logs", help="JSON lines file with one move log per line")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes, defaults to the CPU count")
+    parser.add_argument("--chunk-size", type=int, default=200)
+    parser.add_argument("--strict", action="store_true", help="also reject moves legal_moves doesn't list")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    games = invalid = 0
+    for result in validate_logs(read_logs(args.logs), args.workers, args.chunk_size, args.strict):
+        games += 1
+        if not result.valid:
+            invalid += 1
+            print(f"game {result.game_number}: move {result.illegal_move_number} {result.illegal_move} "
+                  f"{result.error}")
+    elapsed = time.perf_counter() - start
+    games_per_second = games / elapsed if elapsed > 0 else 0.0
+    print(f"{games} games, {invalid} with illegal moves, {elapsed:.2f} sec, {games_per_second:,.0f} games/sec")
+
+
+if __name__ == '__main__':
+    main()
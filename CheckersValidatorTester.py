@@ -0,0 +1,124 @@
+# Author: Samantha Jarrah
+# GitHub username: samantha-jarrah
+# Date: 10/18/26
+# Description: Contains unit tests for CheckersValidator and the print free play_move. Tests that good games pass, that
+# the first bad move is reported, strict rule checking, and bulk validation across processes.
+
+import contextlib
+import io
+import unittest
+from CheckersGame import Checkers, OutofTurn
+from CheckersFixtures import SCRIPTED_GAME, play_scripted_game
+from CheckersValidator import validate_log, validate_logs
+
+
+SCRIPTED_LOG = {"players": [["Sam", "White"], ["Faris", "Black"]],
+                "moves": [[name, list(start), list(end)] for name, start, end in SCRIPTED_GAME]}
+
+
+class CheckersValidatorTests(unittest.TestCase):
+
+    def test_play_move_is_quiet(self):
+        """Test that play_move raises without printing while play_game prints"""
+
+        game = Checkers()
+        game.create_player("Sam", "White")
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            with self.assertRaises(OutofTurn):
+                game.play_move("Sam", (2, 1), (3, 0))
+        self.assertEqual(output.getvalue(), "")
+        with contextlib.redirect_stdout(output):
+            with self.assertRaises(OutofTurn):
+                game.play_game("Sam", (2, 1), (3, 0))
+        self.assertEqual(output.getvalue(), "It is not your turn.\n")
+
+    def test_valid_game(self):
+        """Test that the scripted game is valid and ends with the right position and winner"""
+
+        result = validate_log(SCRIPTED_LOG)
+        self.assertTrue(result.valid)
+        self.assertEqual(result.moves_played, len(SCRIPTED_GAME))
+        self.assertEqual(result.position, play_scripted_game().get_position())
+        self.assertEqual(result.winner, "Faris")
+
+    def test_first_illegal_move(self):
+        """Test that replay stops at the first move play_game rejects"""
+
+        log = {"players": SCRIPTED_LOG["players"], "moves": SCRIPTED_LOG["moves"][:3] + [["Faris", [5, 0], [4, 1]]] +
+               SCRIPTED_LOG["moves"][3:]}
+        result = validate_log(log, 4)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.game_number, 4)
+        self.assertEqual(result.illegal_move_number, 3)
+        self.assertEqual(result.illegal_move, ("Faris", (5, 0), (4, 1)))
+        self.assertEqual(result.error, "OutofTurn: It is not your turn.")
+        self.assertEqual(result.moves_played, 3)
+        self.assertEqual(result.winner, "Game has not ended")
+
+    def test_strict(self):
+        """Test that strict mode rejects a move play_game accepts but the rules don't allow"""
+
+        log = {"moves": [["Black", [5, 0], [3, 2]]]}
+        self.assertTrue(validate_log(log).valid)
+        result = validate_log(log, strict=True)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.illegal_move_number, 0)
+
+    def test_invalid_players_are_quiet(self):
+        """Test that a bad player list is reported without printing"""
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            result = validate_log({"players": [["Sam", "White"], ["Sam", "Black"]], "moves": []})
+            self.assertEqual(validate_log({"players": [["Sam"]], "moves": []}).error, "Invalid players")
+        self.assertFalse(result.valid)
+        self.assertEqual(result.error, "Invalid players")
+        self.assertEqual(output.getvalue(), "")
+
+    def test_malformed_logs(self):
+        """Test that a log that isn't a dict, has no moves or has a malformed move is that game's error instead of an
+        exception"""
+
+        result = validate_log({"players": SCRIPTED_LOG["players"]})
+        self.assertFalse(result.valid)
+        self.assertIsNone(result.illegal_move_number)
+        self.assertEqual(result.error, "KeyError: 'moves'")
+
+        log = {"players": SCRIPTED_LOG["players"], "moves": SCRIPTED_LOG["moves"][:2] + [["Faris", [4, 1]]]}
+        result = validate_log(log)
+        self.assertFalse(result.valid)
+        self.assertEqual(result.illegal_move_number, 2)
+        self.assertEqual(result.illegal_move, ["Faris", [4, 1]])
+        self.assertEqual(result.moves_played, 2)
+        self.assertTrue(result.error.startswith("ValueError"))
+
+        result = validate_log({"moves": [["Black", 5, [4, 1]]]})
+        self.assertEqual(result.illegal_move_number, 0)
+        self.assertTrue(result.error.startswith("TypeError"))
+
+        for log in ([], "x", None):
+            result = validate_log(log, 2)
+            self.assertFalse(result.valid)
+            self.assertEqual(result.game_number, 2)
+            self.assertIsNone(result.illegal_move_number)
+            self.assertEqual(result.error, "Malformed log")
+
+        logs = [SCRIPTED_LOG, {"players": SCRIPTED_LOG["players"]}, [], SCRIPTED_LOG]
+        self.assertEqual([result.valid for result in validate_logs(logs, workers=1, chunk_size=1)],
+                         [True, False, False, True])
+        self.assertEqual([result.valid for result in validate_logs(logs, workers=2, chunk_size=4)],
+                         [True, False, False, True])
+
+    def test_validate_logs(self):
+        """Test bulk validation keeps the input order"""
+
+        bad_log = {"moves": [["White", [2, 1], [3, 0]]]}
+        logs = [SCRIPTED_LOG, bad_log] * 5
+        results = list(validate_logs(logs, workers=2, chunk_size=3))
+        self.assertEqual([result.game_number for result in results], list(range(10)))
+        self.assertEqual([result.valid for result in results], [True, False] * 5)
+
+
+if __name__ == '__main__':
+    unittest.main()